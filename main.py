@@ -7,14 +7,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 from dotenv import load_dotenv
 import logging
 import typer
-from src.cli.interact.service import InteractService
-from src.cli.missed_entities.service import MissEntitiesService
-from src.cli.export_data.service import ExportDataService
-from src.cli.import_data.service import ImportService
+from src.cli.registry import load_service
 from src.config.logging import setup_logging
 
 load_dotenv()
 app = typer.Typer()
+bench_app = typer.Typer(help="Benchmarks for the CLI and the trained model.")
+app.add_typer(bench_app, name="bench")
 logger = logging.getLogger(__name__)
 
 @app.callback()
@@ -25,10 +24,25 @@ def main(debug: bool = typer.Option(False, help="Enable debug logging")):
 
 @app.command(name="import")
 def import_data(
-        input_path: Path,
+        input_path: Path | None = typer.Argument(None, help="Raw SMS file, one message per line. Optional with --resume."),
         train_ratio: float = typer.Option(0.7, "--train-ratio"),
         val_ratio: float = typer.Option(0.2, "--val-ratio"),
         test_ratio: float = typer.Option(0.1, "--test-ratio"),
+        streaming: bool = typer.Option(False, "--streaming", help="Split in one streaming pass by a stable hash of each message instead of shuffling in memory."),
+        seed: int = typer.Option(0, "--seed", help="Hash seed for --streaming. Keep it fixed so messages never change split."),
+        dedup: bool = typer.Option(False, "--dedup", help="Drop exact and near-duplicate messages before splitting."),
+        dedup_threshold: float = typer.Option(0.8, "--dedup-threshold", help="Estimated Jaccard similarity at which two messages count as near-duplicates."),
+        dedup_against_imported: bool = typer.Option(False, "--dedup-against-imported", help="Also drop messages that duplicate anything already in data/raw/."),
+        chunk_size: int = typer.Option(1000, "--chunk-size", help="Tasks per Label Studio import request."),
+        workers: int = typer.Option(4, "--workers", help="Concurrent import requests."),
+        resume: bool = typer.Option(False, "--resume", help="First finish imports that were interrupted, sending only unconfirmed chunks."),
+        pre_annotate: bool = typer.Option(False, "--pre-annotate", help="Attach the model's predicted entities to each task as Label Studio predictions."),
+        model_dir: Path = typer.Option(None, "--model-dir", help="Model for --pre-annotate and --select-top-k. model-best/ will be used as default."),
+        batch_size: int = typer.Option(256, "--batch-size", help="nlp.pipe batch size for --pre-annotate."),
+        n_process: int = typer.Option(1, "--n-process", help="Processes for --pre-annotate and --select-top-k."),
+        select_top_k: int = typer.Option(None, "--select-top-k", help="Only import the K messages per split the model is least sure about."),
+        compare_model_dir: Path = typer.Option(None, "--compare-model-dir", help="Rank --select-top-k by disagreement with this model instead of beam margins."),
+        beam_width: int = typer.Option(8, "--beam-width", help="Beam width for margin-based --select-top-k."),
 ):
     """
     Split a dataset file into training, validation, and test sets.
@@ -40,46 +54,157 @@ def import_data(
 
     The original input file is deleted after successful splitting.
 
+    With --streaming, the input is read line by line and never held in
+    memory: each message is assigned a split by a seeded hash of its
+    normalized (casefolded, whitespace collapsed) text and written out
+    immediately. Ratios are met in expectation rather than exactly, and a
+    message always lands in the same split, so overlapping dumps imported
+    later can't leak test messages into train.
+
+    With --dedup, exact and near-duplicate messages ("food pls" vs
+    "FOOD PLS!!") are dropped first using MinHash/LSH over character
+    shingles, keeping the first message of each cluster. A report of the
+    largest clusters is saved to data/dedup/.
+
+    Split files are uploaded in chunks of --chunk-size tasks, --workers at a
+    time, retrying transient failures with backoff. Confirmed chunks are
+    journaled in data/import_journal/, so after an interrupted import,
+    `import --resume` sends only the chunks that never made it.
+
+    With --pre-annotate, every message is run through the trained model
+    (batched with nlp.pipe, streamed alongside the upload) and its entities
+    are attached as Label Studio predictions, so annotators only have to
+    correct them.
+
+    With --select-top-k, only the K messages per split the model is least
+    sure about are imported, ranked by the margin between the two best beam
+    analyses of the NER, or with --compare-model-dir by how much two models
+    disagree. Scoring is batched and spread over --n-process processes. The
+    remaining messages are kept in data/al_pool/ for later rounds.
+
     Args:
         input_path: Path to the input file to split
         train_ratio: Fraction of data for training (default: 0.7)
         val_ratio: Fraction of data for validation (default: 0.2) 
         test_ratio: Fraction of data for testing (default: 0.1)
+        streaming: Split in one streaming pass by stable hash
+        seed: Hash seed used with --streaming (default: 0)
+        dedup: Drop near-duplicate messages before splitting
+        dedup_threshold: Similarity threshold for --dedup (default: 0.8)
+        dedup_against_imported: Also dedup against previously imported data
+        chunk_size: Tasks per import request (default: 1000)
+        workers: Concurrent import requests (default: 4)
+        resume: Resume interrupted imports first
+        pre_annotate: Attach model predictions to imported tasks
+        model_dir: Model used with --pre-annotate and --select-top-k (default: model-best/)
+        batch_size: nlp.pipe batch size with --pre-annotate and --select-top-k (default: 256)
+        n_process: Processes for --pre-annotate and --select-top-k (default: 1)
+        select_top_k: Import only the K most uncertain messages per split
+        compare_model_dir: Second model for disagreement-based selection
+        beam_width: Beam width for margin-based selection (default: 8)
     """
     ratios = {
         "train_ratio": train_ratio,
         "val_ratio": val_ratio,
         "test_ratio": test_ratio,
     }
-    ImportService.run(
+    load_service("import").run(
         input_path=input_path, 
         ratios=ratios,
+        streaming=streaming,
+        seed=seed,
+        dedup=dedup,
+        dedup_threshold=dedup_threshold,
+        dedup_against_imported=dedup_against_imported,
+        chunk_size=chunk_size,
+        workers=workers,
+        resume=resume,
+        pre_annotate=pre_annotate,
+        model_dir=model_dir,
+        batch_size=batch_size,
+        n_process=n_process,
+        select_top_k=select_top_k,
+        compare_model_dir=compare_model_dir,
+        beam_width=beam_width,
     )
 
 
 @app.command(name="export")
-def export_data():
+def export_data(
+        incremental: bool = typer.Option(False, "--incremental", help="Only pull tasks created or updated since the last incremental export."),
+        reset: bool = typer.Option(False, "--reset", help="With --incremental, discard the local cache and watermark first."),
+        save_converted: bool = typer.Option(False, "--save-converted", help="Also write the intermediate spaCy JSON to data/converted/."),
+        workers: int = typer.Option(1, "--workers", help="Worker processes per split for building the DocBin."),
+        shard_size: int = typer.Option(None, "--shard-size", help="Records per DocBin shard when building with workers. Defaults to 2000."),
+        sharded: bool = typer.Option(False, "--sharded", help="Leave the train DocBin shards in data/spacy/train/ instead of merging them."),
+        doc_cache_mb: int = typer.Option(None, "--doc-cache-mb", help="Size limit of the on-disk Doc cache in MB, 1024 by default. 0 disables the cache."),
+):
     """
     Export all dataset splits from Label Studio and convert to spaCy DocBin format.
     
     This command automates the complete export pipeline for all three dataset splits 
     (training, validation, testing). For each split, it:
     1. Exports annotated data directly from Label Studio via API
-    2. Strips unnecessary metadata to create clean spaCy-compatible JSON
+    2. Strips unnecessary metadata to create clean spaCy-compatible records
     3. Converts to binary DocBin format for model training
+
+    The snapshot download is parsed as a stream and each task is converted and
+    added to the DocBin as it arrives, so neither the raw export nor the
+    converted JSON is ever held in memory or written to disk in full. Pass
+    --save-converted to keep the intermediate JSON anyway.
+
+    With --workers > 1, records are cut into shards of --shard-size that are
+    tokenized in worker processes and merged back in their original order.
+    --sharded leaves the train shards as data/spacy/train/shard-*.spacy plus
+    a manifest.json instead; val and test are always merged into one file.
+    Whichever layout is written replaces the other, so a stale shard
+    directory never shadows a newer merged export. config.cfg trains from
+    data/spacy/train/ with the streaming street_ninja.StreamingCorpus.v1
+    reader (falling back to train.spacy), so training needs
+    `--code src/training/corpus.py`. Docs/sec per split is logged.
+
+    Built Docs are cached in data/cache/docs.sqlite3 per content-defined
+    shard, keyed on a hash of its examples' text, entities and the tokenizer
+    config, so a rebuild only tokenizes the shards holding new or edited
+    annotations. Least recently used entries are evicted past --doc-cache-mb,
+    and the cache hit rate is logged per split.
+
+    The three splits are exported concurrently, and snapshot status is polled
+    with exponential backoff, so the total time is roughly that of the slowest split.
     
     All output files are saved with timestamped filenames for traceability.
     No manual export or parameters required - the command handles all splits automatically.
     
+    With --incremental, snapshots are skipped: only tasks created or updated
+    since the last incremental run are fetched, merged into a local cache under
+    data/converted/incremental/, and only the affected DocBin buckets are
+    rebuilt before the split's .spacy file is reassembled. Deleted tasks are
+    only dropped after a --reset. --workers, --shard-size, --sharded and
+    --doc-cache-mb don't apply to incremental exports and are rejected.
+
     Replaces the previous workflow of manual Label Studio export + labelstudio-to-docbin command.
     """
-    ExportDataService.run()
+    load_service("export").run(
+        incremental=incremental,
+        reset=reset,
+        save_converted=save_converted,
+        workers=workers,
+        shard_size=shard_size,
+        sharded=sharded,
+        doc_cache_mb=doc_cache_mb,
+    )
 
 
 @app.command(name="interact")
 def interact(
-    inquiry: str,
-    model_dir: Path = typer.Option(None, help="Path to trained model directory. model-last/ will be used as default.")
+    inquiry: str = typer.Argument(None, help="A single text input to parse."),
+    model_dir: Path = typer.Option(None, help="Path to trained model directory. model-last/ will be used as default."),
+    input_file: Path = typer.Option(None, "--input-file", help="Text file with one message per line to parse in batch mode."),
+    stdin: bool = typer.Option(False, "--stdin", help="Read messages from stdin, one per line, in batch mode."),
+    output_path: Path = typer.Option(None, "--output-path", help="JSONL output file for batch mode. Defaults to stdout."),
+    batch_size: int = typer.Option(256, "--batch-size", help="Number of messages per nlp.pipe batch."),
+    n_process: int = typer.Option(1, "--n-process", help="Number of worker processes for nlp.pipe."),
+    profile: bool = typer.Option(False, "--profile", help="Print per-component pipeline timings when done."),
 ):
     """
     Run an input string through the trained NER model and print extracted entities.
@@ -88,15 +213,290 @@ def interact(
     using real or test SMS-style messages. It loads the latest trained spaCy model,
     runs inference, and prints out detected entities and their labels.
 
+    With --input-file or --stdin, messages are streamed through nlp.pipe instead
+    and written as JSONL (text, entities, offsets) as they are produced. A
+    messages/sec summary is printed to stderr at the end.
+
+    --profile times the tokenizer and each pipeline component (tok2vec, ner)
+    separately and prints a per-component report to stderr.
+
     Args:
         inquiry: A single text input to parse (e.g., "where's shelter near 222 main st?").
+        input_file: File of messages to parse in batch mode, one per line
+        stdin: Read messages from stdin instead of a file
+        output_path: Where to write JSONL results (default: stdout)
+        batch_size: Messages per nlp.pipe batch (default: 256)
+        n_process: nlp.pipe worker processes (default: 1)
+        profile: Report per-component timings (default: False)
+    """
+    load_service("interact").run(
+        inquiry=inquiry,
+        model_dir=model_dir,
+        input_file=input_file,
+        stdin=stdin,
+        output_path=output_path,
+        batch_size=batch_size,
+        n_process=n_process,
+        profile=profile,
+    )
+
+
+@app.command(name="serve")
+def serve(
+    model_dir: Path = typer.Option(None, help="Path to trained model directory. model-best/ will be used as default."),
+    host: str = typer.Option("127.0.0.1", "--host"),
+    port: int = typer.Option(8000, "--port"),
+    socket_path: Path = typer.Option(None, "--socket-path", help="Serve over a Unix socket instead of TCP."),
+    reload_interval: float = typer.Option(5.0, "--reload-interval", help="Seconds between checks for a retrained model."),
+    max_batch: int = typer.Option(1, "--max-batch", help="Coalesce up to this many concurrent requests per nlp.pipe call. 1 disables batching."),
+    max_wait_ms: float = typer.Option(5.0, "--max-wait-ms", help="Longest a request waits for its batch to fill before it is flushed."),
+    cache_size: int = typer.Option(0, "--cache-size", help="Cache results for up to this many normalized inquiries. 0 disables caching."),
+    workers: int = typer.Option(1, "--workers", help="Pre-forked worker processes sharing one loaded model."),
+    worker_threads: int = typer.Option(1, "--worker-threads", help="BLAS/OpenMP threads allowed per worker."),
+    profile: bool = typer.Option(False, "--profile", help="Record per-component pipeline timings, served on /metrics."),
+):
+    """
+    Serve the trained NER model over a local HTTP endpoint.
+
+    Loads the model once and keeps it warm, so each request only pays for
+    inference. POST {"text": "..."} to /parse to get back the same
+    (text, label) entity pairs that `interact` prints. GET /health returns
+    the fingerprint of the model currently being served.
+
+    The model directory is polled and the pipeline is reloaded in the background
+    when it changes on disk, without dropping requests.
+
+    Under bursty traffic, --max-batch > 1 groups concurrent requests into a
+    single nlp.pipe call, flushed when the batch is full or --max-wait-ms
+    has elapsed, whichever comes first.
+
+    --cache-size enables an LRU cache keyed on the case/whitespace-folded
+    inquiry and the served model, so repeated messages skip inference. The
+    model still runs on the inquiry as sent; a cached result is reused for
+    later messages that only differ in case or spacing. Hit/miss counters are reported on /health.
+
+    --workers > 1 loads the model once in a parent process and forks workers
+    that share it copy-on-write, each capped at --worker-threads BLAS threads.
+    A per-worker unique vs shared memory report is logged at startup and
+    whenever the parent receives SIGUSR1.
+
+    --profile records per-component wall time, docs/sec and latency
+    histograms, served as JSON on GET /metrics (per worker process).
+
+    Args:
+        model_dir: Trained model to serve (default: data/training/model-best)
+        host: Interface to bind for TCP (default: 127.0.0.1)
+        port: Port to bind for TCP (default: 8000)
+        socket_path: Unix socket path; overrides host/port when set
+        reload_interval: Seconds between model directory checks (default: 5)
+        max_batch: Largest micro-batch; 1 runs each request alone (default: 1)
+        max_wait_ms: Micro-batch flush deadline in milliseconds (default: 5)
+        cache_size: Max cached inquiries; 0 disables the cache (default: 0)
+        workers: Number of pre-forked worker processes (default: 1)
+        worker_threads: BLAS/OpenMP threads per worker (default: 1)
+        profile: Serve per-component timings on /metrics (default: False)
+    """
+    load_service("serve").run(
+        model_dir=model_dir,
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        reload_interval=reload_interval,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+        cache_size=cache_size,
+        workers=workers,
+        worker_threads=worker_threads,
+        profile=profile,
+    )
+
+
+@app.command(name="validate")
+def validate(
+    input_paths: list[Path] = typer.Argument(None, help="Converted spaCy or Label Studio export records (.json, .jsonl, .msgpack, optionally .gz/.xz). Defaults to the latest converted JSON per split."),
+    output_path: Path = typer.Option(None, "--output-path", help="Where to write the JSON report. Defaults to data/validation/report__<timestamp>.json."),
+    batch_size: int = typer.Option(1000, "--batch-size", help="Texts per tokenizer.pipe batch."),
+    strict: bool = typer.Option(False, "--strict", help="Exit with code 1 if any span would be dropped or rejected by the build."),
+):
+    """
+    Check annotated entity spans against spaCy's token boundaries.
+
+    Every text is tokenized once and all of its spans are checked in bulk
+    against precomputed token start/end offsets. Reports spans with labels
+    outside LOCATION/RESOURCE/QUALIFIER (e.g. ADDRESS), spans outside the
+    text, overlapping spans, and spans that don't line up with tokens, with
+    the nearest expanded and contracted token-aligned offsets for each.
+
+    The full report is written as JSON and a per-kind summary is printed.
+    """
+    load_service("validate").run(
+        input_paths=input_paths,
+        output_path=output_path,
+        batch_size=batch_size,
+        strict=strict,
+    )
+
+
+@app.command(name="evaluate")
+def evaluate(
+    model_dir: Path = typer.Option(None, help="Path to trained model directory. model-best/ will be used as default."),
+    splits: list[str] = typer.Option(["test", "val"], "--split", help="Split to evaluate (test, val or train). Repeat for several."),
+    batch_size: int = typer.Option(256, "--batch-size", help="nlp.pipe batch size."),
+    n_process: int = typer.Option(1, "--n-process", help="nlp.pipe process count."),
+    output_dir: Path = typer.Option(None, "--output-dir", help="Where to write the JSON reports. Defaults to data/evaluation/."),
+):
+    """
+    Evaluate a trained model on the exported test/val DocBins.
+
+    Runs the model over each split's .spacy file (or sharded directory) with
+    nlp.pipe and prints overall and per-label precision, recall and F1 for
+    LOCATION, RESOURCE and QUALIFIER, plus words/sec. An entity only counts
+    as correct if its offsets and label match exactly.
+
+    Each split's report is saved as JSON, including every example with
+    missed or wrong entities, and can be browsed with `missed_entities
+    --input-path <report>`.
     """
-    InteractService.run(inquiry=inquiry, model_dir=model_dir)
+    load_service("evaluate").run(
+        model_dir=model_dir,
+        splits=splits,
+        batch_size=batch_size,
+        n_process=n_process,
+        output_dir=output_dir,
+    )
 
 
 @app.command(name="missed_entities")
 def missed_entities(input_path: Path = typer.Option(..., "--input-path")):
-    MissEntitiesService.run(input_path=input_path)
+    load_service("missed_entities").run(input_path=input_path)
+
+
+@app.command(name="sweep")
+def sweep(
+    hidden_widths: list[int] = typer.Option([32, 64], "--hidden-width", help="NER hidden_width values. Repeat for a grid."),
+    widths: list[int] = typer.Option([64, 96], "--width", help="tok2vec width values."),
+    depths: list[int] = typer.Option([2, 4], "--depth", help="tok2vec depth values."),
+    embed_sizes: list[int] = typer.Option([1000, 2000], "--embed-size", help="tok2vec embed_size values."),
+    tok2vec_modes: list[str] = typer.Option(["separate", "shared"], "--tok2vec", help="`separate` (current config) and/or `shared` listener."),
+    jobs: int = typer.Option(None, "--jobs", help="Concurrent trainings. Defaults to CPU cores / --threads-per-job."),
+    threads_per_job: int = typer.Option(1, "--threads-per-job", help="BLAS threads per training job."),
+    max_steps: int = typer.Option(None, "--max-steps", help="Override training.max_steps for quicker sweeps."),
+    min_f1: float = typer.Option(None, "--min-f1", help="Accuracy floor used to recommend the fastest acceptable variant."),
+):
+    """
+    Sweep NER architecture settings and report the speed/accuracy Pareto front.
+
+    Trains one model per combination of the given grid values (on top of
+    config.cfg) in parallel across CPU cores, then evaluates each on
+    data/spacy/test.spacy for entity P/R/F and inference words/sec. Prints a
+    table with Pareto-optimal variants marked and saves everything under
+    data/sweeps/<timestamp>/.
+
+    The `shared` tok2vec mode makes NER listen to the pipeline's tok2vec
+    component instead of computing its own duplicate embeddings.
+    """
+    load_service("sweep").run(
+        hidden_widths=hidden_widths,
+        widths=widths,
+        depths=depths,
+        embed_sizes=embed_sizes,
+        tok2vec_modes=tok2vec_modes,
+        jobs=jobs,
+        threads_per_job=threads_per_job,
+        max_steps=max_steps,
+        min_f1=min_f1,
+    )
+
+
+@bench_app.command(name="startup")
+def bench_startup(repeat: int = typer.Option(5, "--repeat", help="Fresh-interpreter runs per measurement.")):
+    """
+    Measure CLI startup and per-command import time against their budgets.
+
+    Each command's service module is imported in a fresh interpreter and the
+    median import time is compared to the budget in src/cli/registry.py.
+    Exits non-zero if any command is over budget.
+    """
+    load_service("bench_startup").run(repeat=repeat)
+
+
+@bench_app.command(name="inference")
+def bench_inference(
+    model_dir: Path = typer.Option(None, help="Path to trained model directory. model-best/ will be used as default."),
+    corpus: Path = typer.Option(None, "--corpus", help="Text file with one message per line. Synthetic SMS are generated when omitted."),
+    synthetic_size: int = typer.Option(2000, "--synthetic-size", help="Number of synthetic messages to generate."),
+    latency_samples: int = typer.Option(1000, "--latency-samples", help="Messages timed one at a time for latency percentiles."),
+    batch_sizes: list[int] = typer.Option([1, 32, 256], "--batch-size", help="nlp.pipe batch size to test. Repeat for a grid."),
+    n_processes: list[int] = typer.Option([1], "--n-process", help="nlp.pipe process count to test. Repeat for a grid."),
+    output_path: Path = typer.Option(None, "--output-path", help="Where to save JSON results. Defaults to data/bench/."),
+    baseline: Path = typer.Option(None, "--baseline", help="Previous results JSON to compare against."),
+    max_regression: float = typer.Option(0.1, "--max-regression", help="Allowed fractional slowdown vs the baseline."),
+):
+    """
+    Benchmark inference speed of a trained model.
+
+    Reports model load time, p50/p95/p99 single-message latency, nlp.pipe
+    throughput for every --batch-size x --n-process combination, and peak RSS.
+    Results are saved as JSON. With --baseline, exits non-zero if any latency
+    percentile or throughput cell regressed by more than --max-regression.
+
+    Without --corpus, synthetic SMS are generated by recombining the entities
+    in data/examples/training_data.json.
+    """
+    load_service("bench_inference").run(
+        model_dir=model_dir,
+        corpus=corpus,
+        synthetic_size=synthetic_size,
+        latency_samples=latency_samples,
+        batch_sizes=batch_sizes,
+        n_processes=n_processes,
+        output_path=output_path,
+        baseline=baseline,
+        max_regression=max_regression,
+    )
+
+
+@bench_app.command(name="labelstudio")
+def bench_labelstudio(
+    sizes: list[int] = typer.Option([10_000, 100_000, 1_000_000], "--size", help="Number of tasks to import and export. Repeat for several sizes."),
+    workers: int = typer.Option(4, "--workers", help="Concurrent import requests."),
+    chunk_size: int = typer.Option(1000, "--chunk-size", help="Tasks per import request."),
+    snapshot_delay: float = typer.Option(0.0, "--snapshot-delay", help="Seconds the fake server takes to build an export snapshot."),
+    latency_ms: float = typer.Option(0.0, "--latency-ms", help="Latency added to every fake server request."),
+    failure_rate: float = typer.Option(0.0, "--failure-rate", help="Fraction of fake server requests answered with a 503."),
+    output_path: Path = typer.Option(None, "--output-path", help="Where to save JSON results. Defaults to data/bench/."),
+    serve: bool = typer.Option(False, "--serve", help="Only run the fake server, e.g. to point import/export at it."),
+    port: int = typer.Option(8080, "--port", help="Port for --serve."),
+    synthetic_tasks: int = typer.Option(1000, "--synthetic-tasks", help="Annotated tasks per project export with --serve."),
+    seed: int = typer.Option(None, "--seed", help="Seed for injected latency and failures. Random by default; saved with the results."),
+):
+    """
+    Benchmark import and export throughput against a fake Label Studio.
+
+    For each --size, a local stand-in server implementing the project import
+    and export snapshot endpoints is started, that many synthetic SMS are
+    imported through the import command's chunked uploader, and as many
+    synthetic annotated tasks are exported, streamed and converted. Latency,
+    snapshot build time and injected failures are configurable. Each size's
+    server draws its failures from --seed plus the size, so repeated and
+    differently sized runs don't replay the same failure sequence.
+
+    With --serve, only the fake server runs (on --port, 8080 by default), so
+    `import` and `export` can be exercised without a real Label Studio.
+    """
+    load_service("bench_labelstudio").run(
+        sizes=sizes,
+        workers=workers,
+        chunk_size=chunk_size,
+        snapshot_delay=snapshot_delay,
+        latency_ms=latency_ms,
+        failure_rate=failure_rate,
+        output_path=output_path,
+        serve=serve,
+        port=port,
+        synthetic_tasks=synthetic_tasks,
+        seed=seed,
+    )
 
 
 if __name__ == "__main__":
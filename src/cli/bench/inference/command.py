@@ -0,0 +1,202 @@
+from dataclasses import asdict
+from enum import Enum
+import logging
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any
+from .corpus import SyntheticSmsGenerator
+from .dataclasses import InferenceBenchResult, LatencyStats, ThroughputResult
+from ...base_command import BaseCommand
+from ...interact.command import InteractCommand
+from ....common.io import ConsoleWriter, FileReader, FileWriter
+from ....common.utils import timestamp
+from ....config.constants import BENCH_DIR, EXAMPLES_DIR, MODEL_DIR
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBenchCommand(BaseCommand):
+    """
+    Benchmarks a trained model: load time, per-message latency percentiles,
+    nlp.pipe throughput across batch_size x n_process, and peak RSS.
+
+    Results are saved as JSON so runs can be diffed, and compared to an
+    optional baseline run to catch regressions.
+    """
+
+    class Kwargs(Enum):
+        MODEL_DIR = "model_dir"
+        CORPUS = "corpus"
+        SYNTHETIC_SIZE = "synthetic_size"
+        LATENCY_SAMPLES = "latency_samples"
+        BATCH_SIZES = "batch_sizes"
+        N_PROCESSES = "n_processes"
+        OUTPUT_PATH = "output_path"
+        BASELINE = "baseline"
+        MAX_REGRESSION = "max_regression"
+
+    SYNTHETIC_SOURCE = EXAMPLES_DIR / "training_data.json"
+    WARMUP_MESSAGES = 20
+
+    def __init__(
+            self,
+            model_dir: Path = MODEL_DIR,
+            corpus: Path | None = None,
+            synthetic_size: int = 2000,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        self.model_dir = model_dir
+        self.corpus = corpus
+        self.synthetic_size = synthetic_size
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+        self.console_writer = console_writer
+
+    def run(
+            self,
+            batch_sizes: list[int],
+            n_processes: list[int],
+            latency_samples: int = 1000,
+    ) -> InferenceBenchResult:
+        texts = self._load_corpus()
+        start = time.perf_counter()
+        interact_command = InteractCommand(model_dir=self.model_dir)
+        load_seconds = time.perf_counter() - start
+        logger.info(f"Loaded model in {load_seconds:.2f}s, benchmarking on {len(texts)} messages")
+
+        nlp = interact_command.nlp
+        for text in texts[:self.WARMUP_MESSAGES]:
+            nlp(text)
+
+        result = InferenceBenchResult(
+            model_dir=str(self.model_dir),
+            corpus=str(self.corpus) if self.corpus else f"synthetic:{self.SYNTHETIC_SOURCE.name}",
+            messages=len(texts),
+            load_seconds=load_seconds,
+            latency=self._measure_latency(nlp, texts[:latency_samples]),
+        )
+        for n_process in n_processes:
+            for batch_size in batch_sizes:
+                result.throughput.append(self._measure_throughput(nlp, texts, batch_size, n_process))
+        result.peak_rss_mb = self._peak_rss_mb()
+        return result
+
+    def save(self, result: InferenceBenchResult, output_path: Path | None = None) -> Path:
+        if output_path is None:
+            output_path = BENCH_DIR / f"inference__{timestamp(intraday=True)}.json"
+        self.file_writer.save_json(output_path, self.to_json(result))
+        logger.info(f"Saved benchmark results to {output_path}")
+        return output_path
+
+    def to_json(self, result: InferenceBenchResult) -> dict[str, Any]:
+        data = asdict(result)
+        for row, throughput in zip(data["throughput"], result.throughput):
+            row["messages_per_sec"] = round(throughput.messages_per_sec, 2)
+            row["words_per_sec"] = round(throughput.words_per_sec, 2)
+        return data
+
+    def print_report(self, result: InferenceBenchResult):
+        latency = result.latency
+        self.console_writer.echo(f"Model: {result.model_dir}")
+        self.console_writer.echo(f"Corpus: {result.corpus} ({result.messages} messages)")
+        self.console_writer.echo(f"Load time: {result.load_seconds:.2f}s")
+        self.console_writer.echo(
+            f"Latency ({latency.samples} msgs): p50={latency.p50_ms:.2f}ms "
+            f"p95={latency.p95_ms:.2f}ms p99={latency.p99_ms:.2f}ms mean={latency.mean_ms:.2f}ms"
+        )
+        self.console_writer.echo(f"\n{'n_process':>9} | {'batch_size':>10} | {'msgs/sec':>10} | {'words/sec':>10}")
+        for t in result.throughput:
+            self.console_writer.echo(
+                f"{t.n_process:>9} | {t.batch_size:>10} | {t.messages_per_sec:>10.1f} | {t.words_per_sec:>10.1f}"
+            )
+        if result.peak_rss_mb is not None:
+            self.console_writer.echo(f"\nPeak RSS: {result.peak_rss_mb:.1f} MB")
+
+    def regressions(self, result: InferenceBenchResult, baseline_path: Path, max_regression: float) -> list[str]:
+        """
+        Compares against a previously saved run. Returns a description of every
+        metric that got worse than the baseline by more than `max_regression`
+        (a fraction, e.g. 0.1 for 10%).
+        """
+        baseline = self.file_reader.json_from_file(baseline_path)
+        current = self.to_json(result)
+        failures = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            before, after = baseline["latency"][key], current["latency"][key]
+            if before > 0 and (after - before) / before > max_regression:
+                failures.append(f"latency {key}: {before:.2f} -> {after:.2f}")
+
+        baseline_rows = {(r["batch_size"], r["n_process"]): r for r in baseline.get("throughput", [])}
+        for row in current["throughput"]:
+            before_row = baseline_rows.get((row["batch_size"], row["n_process"]))
+            if before_row is None:
+                continue
+            before, after = before_row["messages_per_sec"], row["messages_per_sec"]
+            if before > 0 and (before - after) / before > max_regression:
+                failures.append(
+                    f"throughput batch_size={row['batch_size']} n_process={row['n_process']}: "
+                    f"{before:.1f} -> {after:.1f} msgs/sec"
+                )
+        return failures
+
+    def _load_corpus(self) -> list[str]:
+        if self.corpus is not None:
+            texts = list(self.file_reader.iter_text_lines(self.corpus))
+        else:
+            generator = SyntheticSmsGenerator(self.SYNTHETIC_SOURCE, file_reader=self.file_reader)
+            texts = generator.generate(self.synthetic_size)
+        if len(texts) < 2:
+            msg = f"Benchmark corpus needs at least 2 messages, got {len(texts)}"
+            logger.error(msg)
+            raise ValueError(msg)
+        return texts
+
+    def _measure_latency(self, nlp, texts: list[str]) -> LatencyStats:
+        timings = []
+        for text in texts:
+            start = time.perf_counter()
+            nlp(text)
+            timings.append((time.perf_counter() - start) * 1000)
+        cuts = statistics.quantiles(timings, n=100, method="inclusive")
+        return LatencyStats(
+            samples=len(timings),
+            mean_ms=statistics.fmean(timings),
+            p50_ms=cuts[49],
+            p95_ms=cuts[94],
+            p99_ms=cuts[98],
+        )
+
+    def _measure_throughput(self, nlp, texts: list[str], batch_size: int, n_process: int) -> ThroughputResult:
+        words = 0
+        start = time.perf_counter()
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            words += len(doc)
+        elapsed = time.perf_counter() - start
+        logger.debug(f"batch_size={batch_size} n_process={n_process}: {elapsed:.2f}s")
+        return ThroughputResult(
+            batch_size=batch_size,
+            n_process=n_process,
+            messages=len(texts),
+            words=words,
+            elapsed=elapsed,
+        )
+
+    def _peak_rss_mb(self) -> float | None:
+        if resource is None:
+            return None
+        peak = max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+        # ru_maxrss is kB on Linux but bytes on macOS
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
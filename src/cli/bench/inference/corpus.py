@@ -0,0 +1,76 @@
+from collections.abc import Iterator
+import logging
+from pathlib import Path
+import random
+from typing import Any
+from ....common.io import FileReader
+
+logger = logging.getLogger(__name__)
+
+
+class SyntheticSmsGenerator:
+    """
+    Generates SMS-like messages from annotated examples.
+
+    Every example becomes a template whose entity spans are slots, and slots are
+    refilled with entity values of the same label taken from other examples, so
+    the output keeps the length and shape of real traffic without repeating it
+    verbatim. Expects the spaCy-style [text, {"entities": [[start, end, label]]}]
+    format of data/examples/training_data.json.
+    """
+
+    def __init__(self, examples_path: Path, seed: int = 0, file_reader: FileReader = FileReader()):
+        self.examples_path = examples_path
+        self.random = random.Random(seed)
+        self.file_reader = file_reader
+        self.templates, self.values = self._load(examples_path)
+
+    def generate(self, count: int) -> list[str]:
+        return [text for text, _ in self.iter_annotated(count)]
+
+    def iter_annotated(self, count: int) -> Iterator[tuple[str, list[tuple[int, int, str]]]]:
+        """Lazily yields `count` messages with the (start, end, label) spans of their filled slots."""
+        if not self.templates:
+            msg = f"No usable examples found in `{self.examples_path}`"
+            logger.error(msg)
+            raise ValueError(msg)
+        for _ in range(count):
+            yield self._fill(self.random.choice(self.templates))
+
+    def _fill(self, template: list[str | tuple[str]]) -> tuple[str, list[tuple[int, int, str]]]:
+        parts = []
+        entities = []
+        cursor = 0
+        for part in template:
+            if isinstance(part, tuple):
+                value = self.random.choice(self.values[part[0]])
+                entities.append((cursor, cursor + len(value), part[0]))
+            else:
+                value = part
+            parts.append(value)
+            cursor += len(value)
+        text = "".join(parts)
+        # SMS casing is all over the place
+        roll = self.random.random()
+        cased = text.upper() if roll < 0.1 else text.lower() if roll < 0.4 else text
+        # A few characters change length when cased, which would shift the spans
+        return (cased if len(cased) == len(text) else text), entities
+
+    def _load(self, examples_path: Path) -> tuple[list[list[str | tuple[str]]], dict[str, list[str]]]:
+        data: Any = self.file_reader.json_from_file(examples_path)
+        templates: list[list[str | tuple[str]]] = []
+        values: dict[str, list[str]] = {}
+        for text, annotations in data:
+            template: list[str | tuple[str]] = []
+            cursor = 0
+            for start, end, label in sorted(annotations.get("entities", [])):
+                if start < cursor:
+                    continue
+                template.append(text[cursor:start])
+                template.append((label,))
+                values.setdefault(label, []).append(text[start:end])
+                cursor = end
+            template.append(text[cursor:])
+            templates.append(template)
+        logger.debug(f"Loaded {len(templates)} templates from `{examples_path}`")
+        return templates, values
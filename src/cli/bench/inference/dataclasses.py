@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LatencyStats:
+    samples: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class ThroughputResult:
+    batch_size: int
+    n_process: int
+    messages: int
+    words: int
+    elapsed: float
+
+    @property
+    def messages_per_sec(self) -> float:
+        return self.messages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def words_per_sec(self) -> float:
+        return self.words / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class InferenceBenchResult:
+    model_dir: str
+    corpus: str
+    messages: int
+    load_seconds: float
+    latency: LatencyStats
+    throughput: list[ThroughputResult] = field(default_factory=list)
+    peak_rss_mb: float | None = None
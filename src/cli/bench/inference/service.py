@@ -0,0 +1,50 @@
+import logging
+from typer import Exit
+from ...base_service import BaseCliService
+from .command import InferenceBenchCommand
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBenchService(BaseCliService[InferenceBenchCommand]):
+
+    command_cls = InferenceBenchCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        Kwargs = service.command_cls.Kwargs
+        command = service.build_command(**kwargs)
+        result = command.run(
+            batch_sizes=kwargs[Kwargs.BATCH_SIZES.value],
+            n_processes=kwargs[Kwargs.N_PROCESSES.value],
+            latency_samples=kwargs.get(Kwargs.LATENCY_SAMPLES.value, 1000),
+        )
+        command.print_report(result)
+        command.save(result, kwargs.get(Kwargs.OUTPUT_PATH.value))
+
+        baseline = kwargs.get(Kwargs.BASELINE.value)
+        if baseline:
+            failures = command.regressions(
+                result,
+                baseline_path=service._to_path(baseline, check=True),
+                max_regression=kwargs.get(Kwargs.MAX_REGRESSION.value, 0.1),
+            )
+            if failures:
+                for failure in failures:
+                    logger.error(f"Regression: {failure}")
+                raise Exit(code=1)
+            logger.info(f"No regressions against baseline `{baseline}`")
+
+    def build_command(self, **kwargs) -> InferenceBenchCommand:
+        Kwargs = self.command_cls.Kwargs
+        command_kwargs = {}
+        model_dir = kwargs.get(Kwargs.MODEL_DIR.value)
+        if model_dir:
+            command_kwargs[Kwargs.MODEL_DIR.value] = self._to_path(model_dir, check=True)
+        corpus = kwargs.get(Kwargs.CORPUS.value)
+        if corpus:
+            command_kwargs[Kwargs.CORPUS.value] = self._to_path(corpus, check=True)
+        if kwargs.get(Kwargs.SYNTHETIC_SIZE.value):
+            command_kwargs[Kwargs.SYNTHETIC_SIZE.value] = kwargs[Kwargs.SYNTHETIC_SIZE.value]
+        return self.command_cls(**command_kwargs)
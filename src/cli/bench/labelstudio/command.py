@@ -0,0 +1,191 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from enum import Enum
+import logging
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+from .dataclasses import FakeServerConfig, LabelStudioBenchResult, PhaseResult
+from .fake_server import FakeLabelStudioProcess, FakeLabelStudioServer
+from ..inference.corpus import SyntheticSmsGenerator
+from ...base_command import BaseCommand
+from ...export_data.command import ExportDataCommand, ExportUrls
+from ...export_data.labelstudio_to_docbin.label_studio_converter import LabelStudioConverter
+from ...import_data.command import ImportCommand
+from ...import_data.journal import ImportJournal
+from ....common.api import ApiClient
+from ....common.enums import DatasetSplit
+from ....common.io import ConsoleWriter, FileWriter
+from ....common.utils import timestamp
+from ....config.constants import BENCH_DIR, EXAMPLES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class LabelStudioBenchCommand(BaseCommand):
+    """
+    End-to-end import and export throughput against a local fake Label Studio.
+
+    For every size, a fresh fake server is started, seeded with the
+    configured seed plus the size so each one injects its own failures. Import sends that many
+    synthetic SMS, split 70/20/10 like `import` does, through ImportCommand.
+    Export then pulls the same number of synthetic annotated tasks, spread
+    over the three projects and exported concurrently like `export` does,
+    through snapshot creation, polling, streamed download and conversion to
+    spaCy records. Building DocBins is benchmarked separately, so it's left out.
+    """
+
+    class Kwargs(Enum):
+        SIZES = "sizes"
+        WORKERS = "workers"
+        CHUNK_SIZE = "chunk_size"
+        SNAPSHOT_DELAY = "snapshot_delay"
+        LATENCY_MS = "latency_ms"
+        FAILURE_RATE = "failure_rate"
+        SYNTHETIC_TASKS = "synthetic_tasks"
+        OUTPUT_PATH = "output_path"
+        SERVE = "serve"
+        PORT = "port"
+        SEED = "seed"
+
+    EXAMPLES_PATH = EXAMPLES_DIR / "training_data.json"
+    SPLIT_RATIOS = {DatasetSplit.TRAINING: 0.7, DatasetSplit.VALIDATION: 0.2, DatasetSplit.TESTING: 0.1}
+    TOKEN = "fake-labelstudio-token"
+
+    def __init__(
+            self,
+            config: FakeServerConfig = FakeServerConfig(),
+            workers: int = 4,
+            chunk_size: int = 1000,
+            file_writer: FileWriter = FileWriter(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        self.config = config
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.file_writer = file_writer
+        self.console_writer = console_writer
+
+    def serve(self, port: int = 8080):
+        """Runs the fake server until interrupted, so the real import/export commands can be pointed at it."""
+        server = FakeLabelStudioServer(("127.0.0.1", port), self.config, self.EXAMPLES_PATH)
+        logger.info(f"Fake Label Studio listening on {server.url}, Ctrl+C to stop")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            state = server.state
+            logger.info(f"Served {state.requests} requests ({state.failures} injected failures), imported {state.imported}")
+
+    def run(self, sizes: list[int]) -> list[LabelStudioBenchResult]:
+        return [self._run_size(size) for size in sizes]
+
+    def save(self, results: list[LabelStudioBenchResult], output_path: Path | None = None) -> Path:
+        if output_path is None:
+            output_path = BENCH_DIR / f"labelstudio__{timestamp(intraday=True)}.json"
+        self.file_writer.save_json(output_path, [self.to_json(result) for result in results])
+        logger.info(f"Saved benchmark results to {output_path}")
+        return output_path
+
+    def to_json(self, result: LabelStudioBenchResult) -> dict[str, Any]:
+        data = asdict(result)
+        data["import_phase"]["tasks_per_sec"] = round(result.import_phase.tasks_per_sec, 2)
+        data["export_phase"]["tasks_per_sec"] = round(result.export_phase.tasks_per_sec, 2)
+        return data
+
+    def print_report(self, results: list[LabelStudioBenchResult]):
+        c = self.config
+        self.console_writer.echo(
+            f"workers={self.workers} chunk_size={self.chunk_size} latency={c.latency_ms}ms "
+            f"failure_rate={c.failure_rate} snapshot_delay={c.snapshot_delay}s seed={c.seed}"
+        )
+        self.console_writer.echo(
+            f"\n{'tasks':>9} | {'import s':>9} | {'import/sec':>10} | {'retries':>7} | "
+            f"{'export s':>9} | {'export/sec':>10} | {'retries':>7}"
+        )
+        for r in results:
+            i, e = r.import_phase, r.export_phase
+            self.console_writer.echo(
+                f"{r.tasks:>9} | {i.elapsed:>9.2f} | {i.tasks_per_sec:>10.0f} | {i.retries:>7} | "
+                f"{e.elapsed:>9.2f} | {e.tasks_per_sec:>10.0f} | {e.retries:>7}"
+            )
+
+    def _run_size(self, size: int) -> LabelStudioBenchResult:
+        per_project = max(1, size // len(self.SPLIT_RATIOS))
+        config = replace(self.config, synthetic_tasks=per_project, seed=self.config.seed + size)
+        with FakeLabelStudioProcess(config, self.EXAMPLES_PATH) as server:
+            with tempfile.TemporaryDirectory(prefix="bench-labelstudio-") as tmp:
+                import_phase = self._bench_import(server, Path(tmp), size)
+            export_phase = self._bench_export(server)
+        logger.info(
+            f"{size} tasks: import {import_phase.tasks_per_sec:.0f} tasks/sec, "
+            f"export {export_phase.tasks_per_sec:.0f} tasks/sec"
+        )
+        return LabelStudioBenchResult(tasks=size, import_phase=import_phase, export_phase=export_phase, config=config)
+
+    def _bench_import(self, server: FakeLabelStudioProcess, tmp_dir: Path, size: int) -> PhaseResult:
+        files = self._write_split_files(tmp_dir, size)
+        api_client = self._api_client()
+        command = ImportCommand(
+            files=files,
+            chunk_size=self.chunk_size,
+            workers=self.workers,
+            api_client=api_client,
+            journal=ImportJournal(journal_dir=tmp_dir / "journal"),
+            base_url=server.url,
+        )
+        start = time.perf_counter()
+        command.import_files()
+        elapsed = time.perf_counter() - start
+        received = sum(server.stats()["imported"].values())
+        if received != size:
+            msg = f"Fake server received {received} tasks, expected {size}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        return self._phase_result(received, elapsed, [api_client])
+
+    def _bench_export(self, server: FakeLabelStudioProcess) -> PhaseResult:
+        api_clients = {split: self._api_client() for split in self.SPLIT_RATIOS}
+        converter = LabelStudioConverter(file_writer=self.file_writer)
+
+        def export_split(split: DatasetSplit) -> int:
+            command = ExportDataCommand(api_client=api_clients[split], urls=ExportUrls(server.url))
+            return sum(1 for _ in converter.iter_convert(command.export_stream(split)))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(api_clients), thread_name_prefix="export") as executor:
+            counts = list(executor.map(export_split, api_clients))
+        elapsed = time.perf_counter() - start
+        return self._phase_result(sum(counts), elapsed, list(api_clients.values()))
+
+    def _phase_result(self, tasks: int, elapsed: float, api_clients: list[ApiClient]) -> PhaseResult:
+        summaries = [s for api_client in api_clients for s in api_client.latency_summary()]
+        for api_client in api_clients:
+            api_client.close()
+        return PhaseResult(
+            tasks=tasks,
+            elapsed=elapsed,
+            requests=sum(s.requests for s in summaries),
+            retries=sum(s.retries for s in summaries),
+        )
+
+    def _api_client(self) -> ApiClient:
+        return ApiClient(pool_size=self.workers, max_retries=5, backoff=0.05, token=self.TOKEN)
+
+    def _write_split_files(self, tmp_dir: Path, size: int) -> dict[DatasetSplit, Path]:
+        files = {split: tmp_dir / f"{split.value}.txt" for split in self.SPLIT_RATIOS}
+        outs = {split: open(path, "w", encoding="utf-8") for split, path in files.items()}
+        try:
+            generator = SyntheticSmsGenerator(self.EXAMPLES_PATH, seed=self.config.seed)
+            for i, (text, _) in enumerate(generator.iter_annotated(size)):
+                # Deterministic 70/20/10 interleave
+                slot = i % 10
+                split = DatasetSplit.TRAINING if slot < 7 else DatasetSplit.VALIDATION if slot < 9 else DatasetSplit.TESTING
+                outs[split].write(text.replace("\n", " ") + "\n")
+        finally:
+            for out in outs.values():
+                out.close()
+        return files
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FakeServerConfig:
+    # Seconds between creating an export snapshot and it being downloadable
+    snapshot_delay: float = 0.0
+    # Added to every request, jittered by +/-50%
+    latency_ms: float = 0.0
+    # Fraction of requests answered with a 503 before doing any work
+    failure_rate: float = 0.0
+    # Annotated tasks every project's export snapshots contain
+    synthetic_tasks: int = 1000
+    # Drives which requests get an injected failure
+    seed: int = 0
+
+
+@dataclass
+class Snapshot:
+    id: int
+    project: str
+    tasks: int
+    ready_at: float
+
+
+@dataclass
+class PhaseResult:
+    tasks: int
+    elapsed: float
+    requests: int = 0
+    retries: int = 0
+
+    @property
+    def tasks_per_sec(self) -> float:
+        return self.tasks / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class LabelStudioBenchResult:
+    tasks: int
+    import_phase: PhaseResult
+    export_phase: PhaseResult
+    config: FakeServerConfig = field(default_factory=FakeServerConfig)
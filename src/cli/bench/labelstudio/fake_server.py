@@ -0,0 +1,317 @@
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import gzip
+import itertools
+import json
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+import random
+import re
+import threading
+import time
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+from .dataclasses import FakeServerConfig, Snapshot
+from ..inference.corpus import SyntheticSmsGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class FakeLabelStudioState:
+    """Projects, snapshots and counters shared by all request threads."""
+
+    TASK_POOL_SIZE = 10_000
+
+    def __init__(self, config: FakeServerConfig, examples_path: Path):
+        self.config = config
+        self.examples_path = examples_path
+        self.imported: dict[str, int] = {}
+        self.snapshots: dict[int, Snapshot] = {}
+        self.requests = 0
+        self.failures = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._random = random.Random(config.seed)
+        self._pool: list[str] | None = None
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self._random.random() < self.config.failure_rate:
+                self.failures += 1
+                return True
+            return False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"requests": self.requests, "failures": self.failures, "imported": dict(self.imported)}
+
+    def import_tasks(self, project: str, count: int):
+        with self._lock:
+            self.imported[project] = self.imported.get(project, 0) + count
+
+    def create_snapshot(self, project: str) -> Snapshot:
+        with self._lock:
+            snapshot = Snapshot(
+                id=next(self._ids),
+                project=project,
+                tasks=self.config.synthetic_tasks,
+                ready_at=time.monotonic() + self.config.snapshot_delay,
+            )
+            self.snapshots[snapshot.id] = snapshot
+            return snapshot
+
+    def iter_encoded_tasks(self, snapshot: Snapshot) -> Iterator[str]:
+        """
+        The snapshot's tasks, already JSON encoded, in Label Studio's export
+        format. Cycles through a pool of pre-encoded synthetic tasks, only
+        splicing in the task id, so the fake server never becomes the
+        bottleneck of what it's benchmarking.
+        """
+        pool = self._task_pool()
+        for task_id in range(1, snapshot.tasks + 1):
+            yield f'{{"id":{task_id},{pool[task_id % len(pool)]}'
+
+    def _task_pool(self) -> list[str]:
+        with self._lock:
+            if self._pool is None:
+                generator = SyntheticSmsGenerator(self.examples_path, seed=self.config.seed)
+                self._pool = [
+                    json.dumps(self._task(text, entities), separators=(",", ":"))[1:]
+                    for text, entities in generator.iter_annotated(self.TASK_POOL_SIZE)
+                ]
+            return self._pool
+
+    def _task(self, text: str, entities: list[tuple[int, int, str]]) -> dict[str, Any]:
+        result = [
+            {
+                "from_name": "label",
+                "to_name": "text",
+                "type": "labels",
+                "value": {"start": start, "end": end, "text": text[start:end], "labels": [label]},
+            }
+            for start, end, label in entities
+        ]
+        return {
+            "data": {"text": text},
+            "annotations": [{"result": result}],
+            "updated_at": "2025-01-01T00:00:00.000000Z",
+        }
+
+
+class FakeLabelStudioHandler(BaseHTTPRequestHandler):
+    """
+    Just enough of the Label Studio API for the import and export commands.
+
+    POST   /api/projects/<id>/import               -> {"task_count": n, ...}
+    POST   /api/projects/<id>/exports              -> {"id": ..., "status": "created" | "completed"}
+    GET    /api/projects/<id>/exports/<eid>        -> {"id": ..., "status": ...}
+    GET    /api/projects/<id>/exports/<eid>/download, chunked JSON array of tasks
+    DELETE /api/projects/<id>/exports/<eid>
+    GET    /_fake/stats                            -> request, failure and import counters
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    IMPORT_PATH = re.compile(r"^/api/projects/(\d+)/import$")
+    EXPORTS_PATH = re.compile(r"^/api/projects/(\d+)/exports$")
+    SNAPSHOT_PATH = re.compile(r"^/api/projects/(\d+)/exports/(\d+)$")
+    DOWNLOAD_PATH = re.compile(r"^/api/projects/(\d+)/exports/(\d+)/download$")
+    STATS_PATH = "/_fake/stats"
+    DOWNLOAD_BATCH = 500
+
+    @property
+    def state(self) -> FakeLabelStudioState:
+        return self.server.state  # type: ignore[attr-defined]
+
+    def do_POST(self):
+        body = self._read_body()
+        if self._simulate():
+            return
+        path = urlsplit(self.path).path
+        if match := self.IMPORT_PATH.match(path):
+            try:
+                tasks = json.loads(body)
+            except json.JSONDecodeError as e:
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON body: {e}"})
+                return
+            if not isinstance(tasks, list) or not all(isinstance(t, dict) and "text" in t.get("data", {}) for t in tasks):
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Expected a list of tasks with `data.text`"})
+                return
+            self.state.import_tasks(match.group(1), len(tasks))
+            predictions = sum(len(t.get("predictions", [])) for t in tasks)
+            self._send_json(HTTPStatus.CREATED, {"task_count": len(tasks), "annotation_count": 0, "prediction_count": predictions})
+        elif match := self.EXPORTS_PATH.match(path):
+            snapshot = self.state.create_snapshot(match.group(1))
+            self._send_json(HTTPStatus.CREATED, self._snapshot_json(snapshot))
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path `{path}`"})
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == self.STATS_PATH:
+            self._send_json(HTTPStatus.OK, self.state.stats())
+            return
+        if self._simulate():
+            return
+        if match := self.SNAPSHOT_PATH.match(path):
+            snapshot = self.state.snapshots.get(int(match.group(2)))
+            if snapshot is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Export not found"})
+            else:
+                self._send_json(HTTPStatus.OK, self._snapshot_json(snapshot))
+        elif match := self.DOWNLOAD_PATH.match(path):
+            snapshot = self.state.snapshots.get(int(match.group(2)))
+            if snapshot is None or time.monotonic() < snapshot.ready_at:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Export not found or not completed"})
+            else:
+                self._send_tasks(snapshot)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path `{path}`"})
+
+    def do_DELETE(self):
+        if self._simulate():
+            return
+        path = urlsplit(self.path).path
+        match = self.SNAPSHOT_PATH.match(path)
+        if match and self.state.snapshots.pop(int(match.group(2)), None) is not None:
+            self.send_response(HTTPStatus.NO_CONTENT)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path `{path}`"})
+
+    def _simulate(self) -> bool:
+        """Applies configured latency and failure injection. Returns True if the request was failed."""
+        latency_ms = self.state.config.latency_ms
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000 * random.uniform(0.5, 1.5))
+        if self.state.should_fail():
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Injected failure"})
+            return True
+        return False
+
+    def _snapshot_json(self, snapshot: Snapshot) -> dict[str, Any]:
+        status = "completed" if time.monotonic() >= snapshot.ready_at else "in_progress"
+        return {"id": snapshot.id, "status": status, "converted_formats": []}
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _send_tasks(self, snapshot: Snapshot):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        tasks = self.state.iter_encoded_tasks(snapshot)
+        first = True
+        try:
+            while batch := list(itertools.islice(tasks, self.DOWNLOAD_BATCH)):
+                self._write_chunk(("[" if first else ",") + ",".join(batch))
+                first = False
+            self._write_chunk("[]" if first else "]")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug(f"Client hung up while downloading snapshot `{snapshot.id}`")
+            self.close_connection = True
+
+    def _write_chunk(self, data: str):
+        encoded = data.encode("utf-8")
+        self.wfile.write(f"{len(encoded):X}\r\n".encode("ascii") + encoded + b"\r\n")
+
+    def _send_json(self, status: HTTPStatus, body: Any):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class FakeLabelStudioServer(ThreadingHTTPServer):
+    """
+    Stand-in for a Label Studio instance, for load-testing import and export
+    without a real one. Imported tasks are only counted; export snapshots are
+    synthetic annotated SMS generated on the fly while they are downloaded.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: FakeServerConfig, examples_path: Path):
+        self.state = FakeLabelStudioState(config, examples_path)
+        super().__init__(address, FakeLabelStudioHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def _serve(config: FakeServerConfig, examples_path: Path, host: str, port: int, conn: Connection):
+    server = FakeLabelStudioServer((host, port), config, examples_path)
+    conn.send(server.server_address[1])
+    conn.close()
+    server.serve_forever()
+
+
+class FakeLabelStudioProcess:
+    """
+    Runs a FakeLabelStudioServer in its own process, so generating and
+    parsing payloads on the server side doesn't compete for the benchmarked
+    client's GIL.
+    """
+
+    STARTUP_TIMEOUT = 30.0
+
+    def __init__(self, config: FakeServerConfig, examples_path: Path, host: str = "127.0.0.1", port: int = 0):
+        self.config = config
+        self.examples_path = examples_path
+        self.host = host
+        self.port = port
+        self._process: BaseProcess | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "FakeLabelStudioProcess":
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_serve,
+            args=(self.config, self.examples_path, self.host, self.port, child_conn),
+            name="fake-labelstudio",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        if not parent_conn.poll(self.STARTUP_TIMEOUT):
+            self._process.terminate()
+            msg = f"Fake Label Studio did not start within {self.STARTUP_TIMEOUT}s"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        self.port = parent_conn.recv()
+        logger.debug(f"Fake Label Studio listening on {self.url} (pid {self._process.pid})")
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def stats(self) -> dict[str, Any]:
+        with urlopen(f"{self.url}{FakeLabelStudioHandler.STATS_PATH}") as response:
+            return json.loads(response.read())
@@ -0,0 +1,47 @@
+import logging
+import random
+from ...base_service import BaseCliService
+from .command import LabelStudioBenchCommand
+from .dataclasses import FakeServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class LabelStudioBenchService(BaseCliService[LabelStudioBenchCommand]):
+
+    command_cls = LabelStudioBenchCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        Kwargs = service.command_cls.Kwargs
+        command = service.build_command(**kwargs)
+        if kwargs.get(Kwargs.SERVE.value):
+            command.serve(port=kwargs.get(Kwargs.PORT.value) or 8080)
+            return
+        results = command.run(sizes=kwargs[Kwargs.SIZES.value])
+        command.print_report(results)
+        output_path = kwargs.get(Kwargs.OUTPUT_PATH.value)
+        command.save(results, service._to_path(output_path) if output_path else None)
+
+    def build_command(self, **kwargs) -> LabelStudioBenchCommand:
+        Kwargs = self.command_cls.Kwargs
+        config = FakeServerConfig(
+            snapshot_delay=kwargs.get(Kwargs.SNAPSHOT_DELAY.value) or 0.0,
+            latency_ms=kwargs.get(Kwargs.LATENCY_MS.value) or 0.0,
+            failure_rate=kwargs.get(Kwargs.FAILURE_RATE.value) or 0.0,
+            synthetic_tasks=kwargs.get(Kwargs.SYNTHETIC_TASKS.value) or 1000,
+            seed=self._seed(kwargs.get(Kwargs.SEED.value)),
+        )
+        return self.command_cls(
+            config=config,
+            workers=kwargs.get(Kwargs.WORKERS.value) or 4,
+            chunk_size=kwargs.get(Kwargs.CHUNK_SIZE.value) or 1000,
+        )
+
+    @staticmethod
+    def _seed(seed: int | None) -> int:
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+            logger.info(f"Fake server seed: {seed} (pass --seed {seed} to repeat this run)")
+        return seed
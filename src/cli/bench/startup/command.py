@@ -0,0 +1,86 @@
+from enum import Enum
+import logging
+import statistics
+import subprocess
+import sys
+from .dataclasses import StartupTiming
+from ...base_command import BaseCommand
+from ...registry import CLI_MODULE, CLI_STARTUP_BUDGET_MS, COMMANDS
+from ....common.io import ConsoleWriter
+from ....config.constants import ROOT_DIR
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupBenchCommand(BaseCommand):
+    """
+    Measures the import cost of the CLI entrypoint and of each lazily loaded
+    command against its budget in `src/cli/registry.py`.
+
+    Every measurement runs in a fresh interpreter so nothing is already cached
+    in `sys.modules`, and the median over several runs is reported. Command
+    timings are measured on top of an already imported entrypoint, i.e. they
+    are the extra cost a command adds when it actually runs.
+    """
+
+    class Kwargs(Enum):
+        REPEAT = "repeat"
+
+    IMPORT_SNIPPET = (
+        "import importlib, time\n"
+        "{preload}"
+        "start = time.perf_counter()\n"
+        "importlib.import_module({module!r})\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+    )
+
+    def __init__(self, repeat: int = 5, console_writer: ConsoleWriter = ConsoleWriter()):
+        self.repeat = repeat
+        self.console_writer = console_writer
+
+    def measure_all(self) -> list[StartupTiming]:
+        timings = [self.measure("cli", CLI_MODULE, CLI_STARTUP_BUDGET_MS, preload=None)]
+        for name, entry in COMMANDS.items():
+            timings.append(self.measure(name, entry.module, entry.startup_budget_ms))
+        return timings
+
+    def measure(
+            self,
+            name: str,
+            module: str,
+            budget_ms: float,
+            preload: str | None = CLI_MODULE,
+    ) -> StartupTiming:
+        samples = [self._import_ms(module, preload) for _ in range(self.repeat)]
+        timing = StartupTiming(
+            name=name,
+            module=module,
+            import_ms=statistics.median(samples),
+            budget_ms=budget_ms,
+        )
+        logger.debug(f"Startup `{name}`: samples={[round(s, 1) for s in samples]}")
+        return timing
+
+    def print_report(self, timings: list[StartupTiming]):
+        self.console_writer.echo(f"{'command':16} | {'import ms':>10} | {'budget ms':>10} | status")
+        for t in timings:
+            status = "ok" if t.within_budget else "OVER BUDGET"
+            self.console_writer.echo(f"{t.name:16} | {t.import_ms:10.1f} | {t.budget_ms:10.1f} | {status}")
+
+    def _import_ms(self, module: str, preload: str | None) -> float:
+        snippet = self.IMPORT_SNIPPET.format(
+            preload=f"importlib.import_module({preload!r})\n" if preload else "",
+            module=module,
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", snippet],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            msg = f"Failed to import `{module}`: {result.stderr.strip()}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        return float(result.stdout.strip().splitlines()[-1])
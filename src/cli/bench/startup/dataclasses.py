@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StartupTiming:
+    name: str
+    module: str
+    import_ms: float
+    budget_ms: float
+
+    @property
+    def within_budget(self) -> bool:
+        return self.import_ms <= self.budget_ms
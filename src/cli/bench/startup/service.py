@@ -0,0 +1,25 @@
+import logging
+from typer import Exit
+from ...base_service import BaseCliService
+from .command import StartupBenchCommand
+
+logger = logging.getLogger(__name__)
+
+
+class StartupBenchService(BaseCliService[StartupBenchCommand]):
+
+    command_cls = StartupBenchCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        command = service.build_command(kwargs.get(service.command_cls.Kwargs.REPEAT.value, 5))
+        timings = command.measure_all()
+        command.print_report(timings)
+        over_budget = [t.name for t in timings if not t.within_budget]
+        if over_budget:
+            logger.error(f"Startup budget exceeded for: {', '.join(over_budget)}")
+            raise Exit(code=1)
+
+    def build_command(self, repeat: int) -> StartupBenchCommand:
+        return self.command_cls(repeat=repeat)
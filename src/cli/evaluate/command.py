@@ -0,0 +1,149 @@
+from collections.abc import Iterator
+from dataclasses import asdict
+from enum import Enum
+import logging
+from pathlib import Path
+import time
+from typing import Any
+import spacy
+from spacy.tokens import Doc, DocBin
+from .dataclasses import EntityError, EvaluationReport, ExampleErrors, LabelScores
+from ..base_command import BaseCommand
+from ...common.enums import AnnotationLabels, DatasetSplit
+from ...common.io import ConsoleWriter, FileWriter
+from ...common.utils import model_fingerprint, timestamp
+from ...config.constants import EVALUATION_DIR, MODEL_DIR, SPACY_DIR
+from ...training.corpus import resolve_shards
+
+logger = logging.getLogger(__name__)
+
+Span = tuple[int, int, str]
+
+
+class EvaluateCommand(BaseCommand):
+    """
+    Scores a trained model against the gold entities of a split's DocBin.
+
+    Gold docs are streamed shard by shard and only their text and entity
+    offsets are sent through `nlp.pipe`, so `n_process` workers never have to
+    pickle whole Docs. An entity counts as correct when its start, end and
+    label all match, the same as spaCy's `ents_f`. Missed and wrong entities
+    are written per example in the JSON format `missed_entities` reads.
+    """
+
+    class Kwargs(Enum):
+        MODEL_DIR = "model_dir"
+        SPLITS = "splits"
+        BATCH_SIZE = "batch_size"
+        N_PROCESS = "n_process"
+        OUTPUT_DIR = "output_dir"
+
+    LABELS = [label.value for label in AnnotationLabels]
+
+    def __init__(
+            self,
+            model_dir: Path = MODEL_DIR,
+            batch_size: int = 256,
+            n_process: int = 1,
+            file_writer: FileWriter = FileWriter(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        if not model_dir.exists():
+            msg = f"Model not found: {model_dir}"
+            logger.error(msg)
+            raise FileNotFoundError(msg)
+        self.nlp = spacy.load(model_dir)
+        meta = self.nlp.meta
+        self.model_name = f"{meta.get('name')}-{meta.get('version')}:{model_fingerprint(model_dir)}"
+        self.model_dir = model_dir
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.file_writer = file_writer
+        self.console_writer = console_writer
+
+    def corpus_shards(self, split: DatasetSplit, corpus_path: Path | None = None) -> list[Path]:
+        """Raises ValueError if the split has no exported corpus."""
+        return resolve_shards(corpus_path or SPACY_DIR / split.value)
+
+    def evaluate(self, split: DatasetSplit, shards: list[Path]) -> EvaluationReport:
+        report = EvaluationReport(
+            model=self.model_name,
+            split=split.value,
+            corpus=[str(shard) for shard in shards],
+            per_label={label: LabelScores() for label in self.LABELS},
+        )
+        gold = ((doc.text, self._spans(doc)) for doc in self._iter_gold_docs(shards))
+        start = time.perf_counter()
+        for doc, gold_spans in self.nlp.pipe(gold, as_tuples=True, batch_size=self.batch_size, n_process=self.n_process):
+            report.docs += 1
+            report.words += len(doc)
+            self._score(report, doc.text, gold_spans, self._spans(doc))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def save(self, report: EvaluationReport, output_dir: Path | None = None) -> Path:
+        output_path = (output_dir or EVALUATION_DIR) / f"{report.split}__{timestamp(intraday=True)}.json"
+        self.file_writer.save_json(output_path, self.to_json(report))
+        logger.info(f"Saved evaluation of split `{report.split}` to {output_path}")
+        return output_path
+
+    def to_json(self, report: EvaluationReport) -> dict[str, Any]:
+        data = asdict(report)
+        data["words_per_sec"] = round(report.words_per_sec, 2)
+        data["overall"] = self._scores_json(report.overall)
+        data["per_label"] = {label: self._scores_json(scores) for label, scores in report.per_label.items()}
+        return data
+
+    def print_report(self, report: EvaluationReport):
+        self.console_writer.echo(f"\nSplit `{report.split}`: {report.docs} docs, {report.words} words, {report.words_per_sec:.0f} words/sec")
+        self.console_writer.echo(f"{'label':>10} | {'P':>6} | {'R':>6} | {'F':>6} | {'tp':>6} | {'fp':>6} | {'fn':>6}")
+        rows = [*report.per_label.items(), ("OVERALL", report.overall)]
+        for label, s in rows:
+            self.console_writer.echo(
+                f"{label:>10} | {s.precision:6.3f} | {s.recall:6.3f} | {s.f1:6.3f} | {s.tp:>6} | {s.fp:>6} | {s.fn:>6}"
+            )
+
+    def _score(self, report: EvaluationReport, text: str, gold: set[Span], predicted: set[Span]):
+        missing = gold - predicted
+        wrong = predicted - gold
+        for start, end, label in gold & predicted:
+            self._label_scores(report, label).tp += 1
+        for start, end, label in missing:
+            self._label_scores(report, label).fn += 1
+        for start, end, label in wrong:
+            self._label_scores(report, label).fp += 1
+        report.overall.tp += len(gold & predicted)
+        report.overall.fn += len(missing)
+        report.overall.fp += len(wrong)
+        if missing or wrong:
+            report.examples.append(ExampleErrors(
+                text=text,
+                missing=[EntityError(label=label, text=text[start:end]) for start, end, label in sorted(missing)],
+                wrong=[EntityError(label=label, text=text[start:end]) for start, end, label in sorted(wrong)],
+            ))
+
+    def _label_scores(self, report: EvaluationReport, label: str) -> LabelScores:
+        # Labels outside LOCATION/RESOURCE/QUALIFIER (e.g. ADDRESS) get their own row
+        scores = report.per_label.get(label)
+        if scores is None:
+            scores = report.per_label[label] = LabelScores()
+        return scores
+
+    def _iter_gold_docs(self, shards: list[Path]) -> Iterator[Doc]:
+        for shard in shards:
+            yield from DocBin().from_disk(shard).get_docs(self.nlp.vocab)
+
+    @staticmethod
+    def _spans(doc: Doc) -> set[Span]:
+        return {(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents}
+
+    @staticmethod
+    def _scores_json(scores: LabelScores) -> dict[str, Any]:
+        return {
+            "p": round(scores.precision, 4),
+            "r": round(scores.recall, 4),
+            "f": round(scores.f1, 4),
+            "tp": scores.tp,
+            "fp": scores.fp,
+            "fn": scores.fn,
+        }
@@ -0,0 +1,52 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LabelScores:
+    tp: int = 0
+    fp: int = 0
+    fn: int = 0
+
+    @property
+    def precision(self) -> float:
+        return self.tp / (self.tp + self.fp) if self.tp + self.fp else 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.tp / (self.tp + self.fn) if self.tp + self.fn else 0.0
+
+    @property
+    def f1(self) -> float:
+        p, r = self.precision, self.recall
+        return 2 * p * r / (p + r) if p + r else 0.0
+
+
+@dataclass
+class EntityError:
+    label: str
+    text: str
+
+
+@dataclass
+class ExampleErrors:
+    text: str
+    missing: list[EntityError] = field(default_factory=list)
+    wrong: list[EntityError] = field(default_factory=list)
+
+
+@dataclass
+class EvaluationReport:
+    model: str
+    split: str
+    corpus: list[str]
+    docs: int = 0
+    words: int = 0
+    elapsed: float = 0.0
+    overall: LabelScores = field(default_factory=LabelScores)
+    per_label: dict[str, LabelScores] = field(default_factory=dict)
+    # Only docs with at least one missed or wrong entity
+    examples: list[ExampleErrors] = field(default_factory=list)
+
+    @property
+    def words_per_sec(self) -> float:
+        return self.words / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,43 @@
+import logging
+from typer import Exit
+from ..base_service import BaseCliService
+from .command import EvaluateCommand
+from ...common.enums import DatasetSplit
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluateService(BaseCliService[EvaluateCommand]):
+
+    command_cls = EvaluateCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        Kwargs = service.command_cls.Kwargs
+        command = service.build_command(**kwargs)
+        output_dir = kwargs.get(Kwargs.OUTPUT_DIR.value)
+        if output_dir:
+            output_dir = service._to_path(output_dir, create=True)
+        splits = kwargs.get(Kwargs.SPLITS.value) or [DatasetSplit.TESTING.value, DatasetSplit.VALIDATION.value]
+        for split in splits:
+            split = DatasetSplit(split)
+            try:
+                shards = command.corpus_shards(split)
+            except ValueError:
+                # resolve_shards already logged which corpus is missing
+                raise Exit(code=1)
+            report = command.evaluate(split, shards)
+            command.print_report(report)
+            command.save(report, output_dir)
+
+    def build_command(self, **kwargs) -> EvaluateCommand:
+        Kwargs = self.command_cls.Kwargs
+        command_kwargs = {
+            Kwargs.BATCH_SIZE.value: kwargs.get(Kwargs.BATCH_SIZE.value) or 256,
+            Kwargs.N_PROCESS.value: kwargs.get(Kwargs.N_PROCESS.value) or 1,
+        }
+        model_dir = kwargs.get(Kwargs.MODEL_DIR.value)
+        if model_dir:
+            command_kwargs[Kwargs.MODEL_DIR.value] = self._to_path(model_dir, check=True)
+        return self.command_cls(**command_kwargs)
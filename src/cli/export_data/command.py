@@ -1,12 +1,15 @@
+from collections.abc import Iterator
+import json
 import logging
-import os
 import time
 from typing import Any
+from .incremental.dataclasses import ExportWatermark
 from ..base_command import BaseCommand
 from ...common.enums import DatasetSplit
 from ...common.mappings import SPLIT_TO_LABELSTUDIO_NAME
-from ...common.io import FileWriter
-from ...common.api import ApiClient
+from ...common.io import FileWriter, iter_json_array
+from ...common.api import ApiClient, ApiError
+from ...config.constants import LABELSTUDIO_URL
 
 
 logger = logging.getLogger(__name__)
@@ -14,10 +17,12 @@ logger = logging.getLogger(__name__)
 
 class ExportUrls:
 
-    PROJECTS_URL = f"http://localhost:8080/api/projects"
+    def __init__(self, base_url: str = LABELSTUDIO_URL):
+        self.projects_url = f"{base_url}/api/projects"
+        self.tasks_url = f"{base_url}/api/tasks"
 
     def _base_project_url(self, split: DatasetSplit) -> str:
-        return f"{self.PROJECTS_URL}/{SPLIT_TO_LABELSTUDIO_NAME[split]}"
+        return f"{self.projects_url}/{SPLIT_TO_LABELSTUDIO_NAME[split]}"
 
     def create_snapshot(self, split: DatasetSplit) -> str:
         return f"{self._base_project_url(split)}/exports"
@@ -32,28 +37,35 @@ class ExportUrls:
     def download_snapshot(self, split: DatasetSplit, id: int) -> str:
         return f"{self.get_snapshot_by_id(split, id)}/download"
 
+    def tasks(self) -> str:
+        return self.tasks_url
+
 
 class ExportDataCommand(BaseCommand):
 
     urls = ExportUrls()
 
+    POLL_INITIAL_INTERVAL = 0.25
+    POLL_BACKOFF = 1.5
+    POLL_MAX_INTERVAL = 5.0
+    POLL_TIMEOUT = 600.0
+    TASKS_PAGE_SIZE = 500
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
     def __init__(
             self, 
             file_writer: FileWriter = FileWriter(),
             api_client: ApiClient = ApiClient(),
+            urls: ExportUrls | None = None,
     ):
         self.file_writer = file_writer
         self.api_client = api_client
-
-    def _build_headers(self) -> dict[str, str]:
-        token = os.getenv("LABELSTUDIO_API_TOKEN", "")
-        return {"Authorization": f"Token {token}"}
+        self.urls = urls or self.urls
 
     def _create_snapshot(self, split_enum: DatasetSplit) -> tuple[int, bool]:
         try:
             response = self.api_client.post(
                 url=self.urls.create_snapshot(split_enum),
-                headers=self._build_headers(),
                 json={"export_type": "json"},
             )
         except self.api_client.ApiError as e:
@@ -68,36 +80,126 @@ class ExportDataCommand(BaseCommand):
             return snapshot_id, completed
 
     def _wait_for_snapshot(self, split: DatasetSplit, snapshot_id: int):
-        snapshot_completed = False
-        counter = 0
-        counter_limit = 100
-        while snapshot_completed is False and counter <= counter_limit:
+        """
+        Polls until Label Studio finishes building the snapshot.
+
+        Small exports usually finish within a second, so polling starts fast and
+        backs off geometrically up to POLL_MAX_INTERVAL to avoid hammering the
+        server while a large export is being built.
+        """
+        interval = self.POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + self.POLL_TIMEOUT
+        while time.monotonic() < deadline:
             response = self.api_client.get(
-                url=self.urls.get_snapshot_by_id(split=split, id=snapshot_id)
+                url=self.urls.get_snapshot_by_id(split=split, id=snapshot_id),
             )
-            data = response.json()
-            for result in data["converted_formats"]:
-                if result["id"] == snapshot_id:
-                    if result["status"] == "completed":
-                        logger.debug(f"Snapshot `{snapshot_id}` created successfully. Waiting complete.")
-                        snapshot_completed = True
-                    else:
-                        logger.debug(f"Snapshot `{snapshot_id}` current status: `{result["status"]}`. Waiting...")
-            counter += 1
-            time.sleep(2)
-        if counter_limit >= 100:
-            msg = f"Snapshot API counter limit exceeded. Snapshot id `{snapshot_id}` for split `{split.value}`"
-            logger.error(msg)
-            raise ConnectionError(msg)
+            status = self._snapshot_status(response.json(), snapshot_id)
+            if status == "completed":
+                logger.debug(f"Snapshot `{snapshot_id}` created successfully. Waiting complete.")
+                return
+            if status == "failed":
+                msg = f"Label Studio failed to build snapshot `{snapshot_id}` for split `{split.value}`"
+                logger.error(msg)
+                raise RuntimeError(msg)
+            logger.debug(f"Snapshot `{snapshot_id}` current status: `{status}`. Polling again in {interval:.2f}s")
+            time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            interval = min(interval * self.POLL_BACKOFF, self.POLL_MAX_INTERVAL)
+
+        msg = f"Timed out after {self.POLL_TIMEOUT}s waiting for snapshot id `{snapshot_id}` for split `{split.value}`"
+        logger.error(msg)
+        raise ConnectionError(msg)
+
+    def _snapshot_status(self, data: dict[str, Any], snapshot_id: int) -> str | None:
+        if data.get("status") in ("completed", "failed"):
+            return data["status"]
+        for result in data.get("converted_formats", []):
+            if result["id"] == snapshot_id:
+                return result["status"]
+        return data.get("status")
 
     def _download_snapshot(self, split_enun: DatasetSplit, snapshot_id: int) -> list[dict[str, Any]]:
         response = self.api_client.get(
             url=self.urls.download_snapshot(split_enun, snapshot_id),
-            headers=self._build_headers(),
             params={"exportFormat": "json"},
         )
         return response.json()
 
+    def stream_snapshot(self, split_enum: DatasetSplit, snapshot_id: int) -> Iterator[dict[str, Any]]:
+        """
+        Downloads the snapshot as a stream and yields tasks one at a time as
+        they are parsed, so the export is never held in memory as a whole.
+        """
+        count = 0
+        with self.api_client.stream(
+            "GET",
+            url=self.urls.download_snapshot(split_enum, snapshot_id),
+            params={"exportFormat": "json"},
+        ) as response:
+            for task in iter_json_array(response.iter_bytes(chunk_size=self.DOWNLOAD_CHUNK_SIZE)):
+                count += 1
+                yield task
+        logger.debug(f"Streamed {count} tasks from snapshot `{snapshot_id}` for split `{split_enum.value}`")
+
+    def fetch_changed_tasks(self, split_enum: DatasetSplit, watermark: ExportWatermark) -> Iterator[dict[str, Any]]:
+        """
+        Pages through the split's tasks (with annotations) that were created or
+        updated after the watermark, oldest id first.
+        """
+        query = json.dumps(self._changed_since_query(watermark))
+        page = 1
+        fetched = 0
+        while True:
+            try:
+                response = self.api_client.get(
+                    url=self.urls.tasks(),
+                    params={
+                        "project": SPLIT_TO_LABELSTUDIO_NAME[split_enum],
+                        "fields": "all",
+                        "page": page,
+                        "page_size": self.TASKS_PAGE_SIZE,
+                        "query": query,
+                    },
+                )
+            except ApiError as e:
+                # Page-number pagination answers a page past the end with 404
+                if page > 1 and e.status_code == 404:
+                    return
+                raise
+            data = response.json()
+            tasks = data.get("tasks", [])
+            fetched += len(tasks)
+            logger.debug(f"Fetched page {page} ({len(tasks)} tasks) for split `{split_enum.value}`")
+            yield from tasks
+            total = data.get("total")
+            if len(tasks) < self.TASKS_PAGE_SIZE or (total is not None and fetched >= total):
+                return
+            page += 1
+
+    def _changed_since_query(self, watermark: ExportWatermark) -> dict[str, Any]:
+        query: dict[str, Any] = {"ordering": ["tasks:id"]}
+        if watermark.last_updated_at is None:
+            return query
+        query["filters"] = {
+            "conjunction": "or",
+            "items": [
+                {
+                    "filter": "filter:tasks:id",
+                    "operator": "greater",
+                    "type": "Number",
+                    "value": watermark.last_task_id,
+                },
+                {
+                    "filter": "filter:tasks:updated_at",
+                    # Inclusive: a task updated within the watermark's timestamp after
+                    # its page was read would otherwise be skipped for good
+                    "operator": "greater_or_equal",
+                    "type": "Datetime",
+                    "value": watermark.last_updated_at,
+                },
+            ],
+        }
+        return query
+
     def export_data(self, split_enum: DatasetSplit) -> list[dict[str, Any]]:
         snapshot_id, completed = self._create_snapshot(split_enum)
         if not completed:
@@ -115,4 +217,11 @@ class ExportDataCommand(BaseCommand):
         # else:
         #     data = response.json()
         #     logger.debug(f"Successfully exported {len(data)} inquiries")
-        #     return data
\ No newline at end of file
+        #     return data
+
+    def export_stream(self, split_enum: DatasetSplit) -> Iterator[dict[str, Any]]:
+        """Same as export_data, but yields the snapshot's tasks as they are downloaded."""
+        snapshot_id, completed = self._create_snapshot(split_enum)
+        if not completed:
+            self._wait_for_snapshot(split=split_enum, snapshot_id=snapshot_id)
+        yield from self.stream_snapshot(split_enum, snapshot_id)
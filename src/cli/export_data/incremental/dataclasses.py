@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ExportWatermark:
+    """Newest task id and update time already merged into the local dataset for one split."""
+    last_task_id: int = 0
+    last_updated_at: str | None = None
+
+    def advance(self, task: dict[str, Any]):
+        """
+        Moves the watermark past `task`. The next run asks for tasks updated
+        at or after `last_updated_at`, so the tasks updated at exactly that
+        time are fetched again; that overlap is harmless because the store
+        overwrites records by task id.
+        """
+        self.last_task_id = max(self.last_task_id, task["id"])
+        updated_at = task.get("updated_at")
+        if updated_at and (self.last_updated_at is None or updated_at > self.last_updated_at):
+            self.last_updated_at = updated_at
@@ -0,0 +1,62 @@
+import logging
+from .store import IncrementalExportStore
+from ..command import ExportDataCommand
+from ..labelstudio_to_docbin.docbin import DocbinBuilder
+from ..labelstudio_to_docbin.label_studio_converter import LabelStudioConverter
+from ....common.enums import DatasetSplit
+from ....common.io import FileReader, FileWriter
+from ....common.types import SpacyFormattedJson
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalExportService:
+    """
+    Pulls only the tasks created or updated since the split's last export,
+    merges them into the local store and rebuilds only the affected DocBin
+    buckets before reassembling the split's .spacy file.
+
+    Tasks deleted in Label Studio can't be seen this way; reset the store
+    (export --incremental --reset) to drop them.
+    """
+
+    def __init__(
+            self,
+            split_enum: DatasetSplit,
+            command: ExportDataCommand,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        self.split_enum = split_enum
+        self.command = command
+        self.store = IncrementalExportStore(split_enum, file_reader=file_reader, file_writer=file_writer)
+        self.labelstudio_converter = LabelStudioConverter(file_writer=file_writer, file_reader=file_reader)
+        self.docbin_builder = DocbinBuilder(file_writer=file_writer, file_reader=file_reader)
+
+    def export(self, reset: bool = False):
+        if reset:
+            self.store.reset()
+        watermark = self.store.load_watermark()
+        changes: dict[int, SpacyFormattedJson | None] = {}
+        for task in self.command.fetch_changed_tasks(self.split_enum, watermark):
+            changes[task["id"]] = self.labelstudio_converter.convert_task(task)
+            watermark.advance(task)
+        logger.info(f"Split `{self.split_enum.value}`: {len(changes)} new or updated tasks since last export")
+
+        dirty = self.store.apply(changes)
+        # Also covers buckets whose DocBin never got written, e.g. after a crash
+        dirty |= {bucket for bucket in self.store.buckets() if not self.store.docbin_path(bucket).exists()}
+        for bucket in sorted(dirty):
+            records = self.store.bucket_records(bucket)
+            if records:
+                self.docbin_builder.write_docbin(records, self.store.docbin_path(bucket))
+
+        output_path = self.docbin_builder.output_path(self.split_enum)
+        if dirty or not output_path.exists():
+            bucket_paths = [self.store.docbin_path(bucket) for bucket in self.store.buckets()]
+            self.docbin_builder.merge_docbins(bucket_paths, output_path)
+            self.docbin_builder.remove_stale_output(output_path, sharded=False)
+        else:
+            logger.info(f"Split `{self.split_enum.value}` unchanged, keeping `{output_path}`")
+        # Saved last, so a failed run is simply retried from the old watermark
+        self.store.save_watermark(watermark)
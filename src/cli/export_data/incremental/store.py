@@ -0,0 +1,105 @@
+from dataclasses import asdict
+import logging
+from pathlib import Path
+import shutil
+from .dataclasses import ExportWatermark
+from ....common.enums import DatasetSplit
+from ....common.io import FileReader, FileWriter
+from ....common.types import SpacyFormattedJson
+from ....config.constants import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalExportStore:
+    """
+    Local copy of one split's converted dataset, kept up to date between exports.
+
+    Records are keyed by Label Studio task id and grouped into fixed-size id
+    buckets, each with its own JSON file and its own DocBin. Merging in a batch
+    of changed tasks marks only their buckets dirty, so only those DocBins
+    have to be rebuilt; the final .spacy file is a cheap concatenation of all
+    bucket DocBins.
+    """
+
+    ROOT_DIR = DATA_DIR / "converted" / "incremental"
+    BUCKET_SIZE = 1000
+
+    def __init__(
+            self,
+            split: DatasetSplit,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        self.split = split
+        self.split_dir = self.ROOT_DIR / split.value
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+
+    @property
+    def state_path(self) -> Path:
+        return self.split_dir / "watermark.json"
+
+    def records_path(self, bucket: int) -> Path:
+        return self.split_dir / "records" / f"{bucket:06d}.json"
+
+    def docbin_path(self, bucket: int) -> Path:
+        return self.split_dir / "docbins" / f"{bucket:06d}.spacy"
+
+    def reset(self):
+        if self.split_dir.exists():
+            shutil.rmtree(self.split_dir)
+            logger.info(f"Cleared incremental export state for split `{self.split.value}`")
+
+    def load_watermark(self) -> ExportWatermark:
+        if not self.state_path.exists():
+            return ExportWatermark()
+        return ExportWatermark(**self.file_reader.json_from_file(self.state_path))
+
+    def save_watermark(self, watermark: ExportWatermark):
+        self.file_writer.save_json(self.state_path, asdict(watermark))
+
+    def buckets(self) -> list[int]:
+        records_dir = self.split_dir / "records"
+        if not records_dir.exists():
+            return []
+        return sorted(int(path.stem) for path in records_dir.glob("*.json"))
+
+    def bucket_records(self, bucket: int) -> list[SpacyFormattedJson]:
+        records = self._load_bucket(bucket)
+        return [records[task_id] for task_id in sorted(records, key=int)]
+
+    def apply(self, changes: dict[int, SpacyFormattedJson | None]) -> set[int]:
+        """
+        Upserts changed records (None removes a task, e.g. its annotation was
+        deleted). Returns the buckets whose contents changed.
+        """
+        by_bucket: dict[int, dict[int, SpacyFormattedJson | None]] = {}
+        for task_id, record in changes.items():
+            by_bucket.setdefault(task_id // self.BUCKET_SIZE, {})[task_id] = record
+
+        dirty = set()
+        for bucket, bucket_changes in by_bucket.items():
+            records = self._load_bucket(bucket)
+            before = dict(records)
+            for task_id, record in bucket_changes.items():
+                if record is None:
+                    records.pop(str(task_id), None)
+                else:
+                    records[str(task_id)] = record
+            if records == before:
+                continue
+            dirty.add(bucket)
+            if records:
+                self.file_writer.save_json(self.records_path(bucket), records, indent=None)
+            else:
+                self.records_path(bucket).unlink(missing_ok=True)
+                self.docbin_path(bucket).unlink(missing_ok=True)
+        logger.debug(f"Split `{self.split.value}`: {len(changes)} changed tasks touched {len(dirty)} buckets")
+        return dirty
+
+    def _load_bucket(self, bucket: int) -> dict[str, SpacyFormattedJson]:
+        path = self.records_path(bucket)
+        if not path.exists():
+            return {}
+        return self.file_reader.json_from_file(path)
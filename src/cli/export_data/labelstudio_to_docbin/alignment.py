@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right
+from enum import Enum
+from spacy.tokens import Doc, Span
+from .dataclasses import SpanIssue
+from ....common.enums import AnnotationLabels
+
+KNOWN_LABELS = frozenset(AnnotationLabels.values())
+
+
+class IssueKind(Enum):
+    UNKNOWN_LABEL = "unknown_label"
+    OUT_OF_BOUNDS = "out_of_bounds"
+    MISALIGNED = "misaligned"
+    OVERLAP = "overlap"
+
+
+class AlignMode(Enum):
+    STRICT = "strict"
+    EXPAND = "expand"
+    CONTRACT = "contract"
+
+
+class TokenBoundaries:
+    """
+    Character offsets of every token start and end in a doc, computed once,
+    so each entity is checked with a dict lookup (or a bisect when it has to
+    be snapped) instead of a scan over the tokens per `doc.char_span` call.
+    """
+
+    def __init__(self, doc: Doc):
+        self.starts = [token.idx for token in doc]
+        self.ends = [token.idx + len(token.text) for token in doc]
+        self.token_by_start = {start: i for i, start in enumerate(self.starts)}
+        self.token_by_end = {end: i + 1 for i, end in enumerate(self.ends)}
+
+    def exact(self, start: int, end: int) -> tuple[int, int] | None:
+        first = self.token_by_start.get(start)
+        last = self.token_by_end.get(end)
+        if first is None or last is None or first >= last:
+            return None
+        return first, last
+
+    def expand(self, start: int, end: int) -> tuple[int, int] | None:
+        """Smallest token span covering [start, end)."""
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end)
+        return (first, last) if first < last else None
+
+    def contract(self, start: int, end: int) -> tuple[int, int] | None:
+        """Largest token span inside [start, end)."""
+        first = bisect_left(self.starts, start)
+        last = bisect_right(self.ends, end)
+        return (first, last) if first < last else None
+
+    def char_offsets(self, tokens: tuple[int, int] | None) -> tuple[int, int] | None:
+        if tokens is None:
+            return None
+        return self.starts[tokens[0]], self.ends[tokens[1] - 1]
+
+
+def align_entities(
+        doc: Doc,
+        entities: list[list],
+        mode: AlignMode = AlignMode.STRICT,
+) -> tuple[list[Span], list[SpanIssue]]:
+    """
+    Turns [start, end, label] character annotations into Spans on `doc`,
+    reporting every entity that has an unknown label, falls outside the
+    text, doesn't line up with token boundaries or overlaps another one.
+
+    Misaligned entities are dropped in STRICT mode and snapped to the
+    expanded or contracted token span otherwise. Overlapping spans are
+    reported but still returned, so the caller decides whether to fail.
+
+    Export builds cache the resulting Docs, so changing these rules needs a
+    bump of doc_cache.DOC_BUILD_VERSION.
+    """
+    boundaries = TokenBoundaries(doc)
+    text = doc.text
+    spans: list[Span] = []
+    issues: list[SpanIssue] = []
+    for start, end, label in entities:
+        if label not in KNOWN_LABELS:
+            issues.append(SpanIssue(IssueKind.UNKNOWN_LABEL.value, start, end, label, text[start:end]))
+            continue
+        if not 0 <= start < end <= len(text):
+            issues.append(SpanIssue(IssueKind.OUT_OF_BOUNDS.value, start, end, label, text[start:end]))
+            continue
+        tokens = boundaries.exact(start, end)
+        if tokens is None:
+            expanded = boundaries.expand(start, end)
+            contracted = boundaries.contract(start, end)
+            issues.append(SpanIssue(
+                IssueKind.MISALIGNED.value,
+                start,
+                end,
+                label,
+                text[start:end],
+                expanded=boundaries.char_offsets(expanded),
+                contracted=boundaries.char_offsets(contracted),
+            ))
+            if mode == AlignMode.EXPAND:
+                tokens = expanded
+            elif mode == AlignMode.CONTRACT:
+                tokens = contracted
+            if tokens is None:
+                continue
+        spans.append(Span(doc, tokens[0], tokens[1], label=label))
+
+    spans.sort(key=lambda span: (span.start, span.end))
+    covered_until = 0
+    for span in spans:
+        if span.start < covered_until:
+            issues.append(SpanIssue(
+                IssueKind.OVERLAP.value,
+                span.start_char,
+                span.end_char,
+                span.label_,
+                span.text,
+            ))
+        covered_until = max(covered_until, span.end)
+    return spans, issues
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DocbinBuildStats:
+    split: str
+    docs: int
+    shards: int
+    workers: int
+    elapsed: float
+    output_path: str
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def docs_per_sec(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.docs / self.elapsed
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+
+@dataclass
+class SpanIssue:
+    """
+    A problem with one annotated entity. `expanded` / `contracted` are the
+    character offsets of the nearest token-aligned spans that cover, or fit
+    inside, the annotation, where one exists.
+    """
+    kind: str
+    start: int
+    end: int
+    label: str
+    text: str
+    expanded: tuple[int, int] | None = None
+    contracted: tuple[int, int] | None = None
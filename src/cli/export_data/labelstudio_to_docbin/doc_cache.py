@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import time
+import spacy
+from spacy.language import Language
+from ....common.enums import AnnotationLabels
+from ....common.types import SpacyFormattedJson
+from ....config.constants import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever sharding.make_doc or alignment.align_entities change how a Doc
+# is built from an example, so shards built by the old code stop matching.
+DOC_BUILD_VERSION = 1
+
+
+def tokenizer_fingerprint(nlp: Language) -> str:
+    """
+    Identity of everything that shapes a cached Doc besides its example: the
+    Doc building code's version, spaCy version, language, tokenizer rules and
+    the set of labels kept.
+    """
+    digest = hashlib.sha1()
+    digest.update(f"{DOC_BUILD_VERSION}:{spacy.__version__}:{nlp.lang}:{','.join(sorted(AnnotationLabels.values()))}".encode())
+    digest.update(nlp.tokenizer.to_bytes(exclude=["vocab"]))
+    return digest.hexdigest()
+
+
+def shard_key(records: list[SpacyFormattedJson], fingerprint: str) -> str:
+    digest = hashlib.sha1(fingerprint.encode())
+    for example in records:
+        payload = json.dumps([example["text"], example["entities"]], ensure_ascii=False, separators=(",", ":"))
+        digest.update(payload.encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class DocCache:
+    """
+    On-disk, content-addressed cache of built Docs, keyed on a hash of the
+    examples' text and entities plus the tokenizer fingerprint. Editing an
+    annotation or changing the tokenizer simply produces a new key.
+
+    Entries are serialized DocBins of whole shards rather than single Docs:
+    for SMS-length texts, Doc.from_bytes costs an order of magnitude more
+    than tokenizing again, while a DocBin shard loads and merges in a few
+    microseconds per doc. Shards are cut at content-defined boundaries
+    (sharding.iter_shards), so an edit only invalidates the shard it is in.
+
+    Backed by SQLite so worker processes building DocBin shards can share it.
+    Hits and new entries are buffered and written in batches; evict() trims
+    the least recently used entries once the cache exceeds `max_bytes`.
+    """
+
+    DEFAULT_PATH = CACHE_DIR / "docs.sqlite3"
+    FLUSH_EVERY = 20
+
+    def __init__(self, path: Path = DEFAULT_PATH, max_bytes: int = 1024 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._touched: list[str] = []
+        self._pending: list[tuple[str, bytes, int, int]] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS docs_last_used ON docs (last_used)")
+        self._conn.commit()
+
+    def get(self, key: str) -> bytes | None:
+        row = self._conn.execute("SELECT data FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched.append(key)
+        if len(self._touched) >= self.FLUSH_EVERY:
+            self.flush()
+        return row[0]
+
+    def put(self, key: str, data: bytes):
+        self._pending.append((key, data, len(data), time.time_ns()))
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if not self._touched and not self._pending:
+            return
+        now = time.time_ns()
+        with self._conn:
+            self._conn.executemany("UPDATE docs SET last_used = ? WHERE key = ?", [(now, key) for key in self._touched])
+            self._conn.executemany("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)", self._pending)
+        self._touched.clear()
+        self._pending.clear()
+
+    def evict(self) -> int:
+        """Drops least recently used entries until the cache fits in max_bytes. Returns entries removed."""
+        self.flush()
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM docs ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        with self._conn:
+            self._conn.executemany("DELETE FROM docs WHERE key = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} cached docs from `{self.path}`, {total / 1e6:.1f} MB left")
+        return len(evicted)
+
+    def total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM docs").fetchone()[0]
+
+    def entries(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self):
+        self.flush()
+        self._conn.close()
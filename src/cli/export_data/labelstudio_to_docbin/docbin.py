@@ -1,9 +1,15 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import spacy
 from typing import Any, cast
 from spacy.tokens import DocBin
 import logging
-from ....common.enums import AnnotationLabels, DatasetSplit
+import time
+from .dataclasses import DocbinBuildStats
+from .doc_cache import DocCache
+from .sharding import ShardedDocbinBuilder, build_shard_bytes, iter_shards, make_doc
+from ....training.corpus import MANIFEST_NAME
+from ....common.enums import DatasetSplit
 from ....common.io import FileReader, FileWriter
 from ....common.types import SpacyFormattedJson
 from ....config.constants import DATA_DIR
@@ -19,22 +25,120 @@ class DocbinBuilder:
         DatasetSplit.TRAINING : "train.spacy",
         DatasetSplit.VALIDATION : "val.spacy",
     }
+    # Only train is streamed shard by shard; the dev corpus (spacy.Corpus.v1),
+    # sweep and evaluate read val.spacy and test.spacy as single files
+    SHARDABLE_SPLITS = {DatasetSplit.TRAINING}
 
     def __init__(self, file_writer: FileWriter, file_reader: FileReader = FileReader()):
         self.file_writer = file_writer
         self.file_reader = file_reader
 
-    def _output_path(self, split: DatasetSplit) -> Path:
+    def output_path(self, split: DatasetSplit) -> Path:
         return self.OUTPUT_DIR / self.split_to_filename[split]
 
     def build_docbin(self, input_path: Path, split: DatasetSplit):
         json_data = self._get_json_data(input_path)
-        output_path = self._output_path(split)
+        output_path = self.output_path(split)
         self._convert_json_to_spacy(json_data, output_path)
         logger.info(f"Built docbin of `{len(json_data)}` records at `{output_path}`")
         
         # self._update_latest_copy(output_path, split)
 
+    def build_docbin_from_records(
+            self,
+            records: Iterable[Any],
+            split: DatasetSplit,
+            workers: int = 1,
+            shard_size: int = 2000,
+            sharded: bool = False,
+            doc_cache: DocCache | None = None,
+    ) -> DocbinBuildStats:
+        """
+        Builds the split's DocBin from an iterable of spaCy formatted records,
+        validating and tokenizing each one as it arrives. With more than one
+        worker, or `sharded`, the docs are built by ShardedDocbinBuilder.
+        Records found in `doc_cache` are deserialized instead of rebuilt.
+
+        `sharded` only applies to SHARDABLE_SPLITS, other splits are always
+        merged. Once built, the split's output in the other layout (a stale
+        shard directory or merged file from an earlier export) is removed, so
+        readers never pick up outdated data.
+        """
+        output_path = self.output_path(split)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if sharded and split not in self.SHARDABLE_SPLITS:
+            logger.debug(f"Split `{split.value}` is always merged, ignoring sharded")
+            sharded = False
+        entries = self._iter_valid_entries(records)
+        if workers > 1 or sharded:
+            builder = ShardedDocbinBuilder(workers=workers, shard_size=shard_size)
+            stats = builder.build(entries, output_path, sharded, doc_cache=doc_cache)
+        else:
+            start = time.perf_counter()
+            count, cached = self._convert_json_to_spacy(entries, output_path, doc_cache=doc_cache, shard_size=shard_size)
+            stats = DocbinBuildStats(
+                split=output_path.stem,
+                docs=count,
+                shards=1,
+                workers=1,
+                elapsed=time.perf_counter() - start,
+                output_path=str(output_path),
+                cache_hits=cached,
+                cache_misses=count - cached if doc_cache else 0,
+            )
+        self.remove_stale_output(output_path, sharded)
+        logger.info(
+            f"Built docbin of `{stats.docs}` records at `{stats.output_path}` "
+            f"({stats.shards} shards, {stats.workers} workers, {stats.docs_per_sec:.0f} docs/sec)"
+        )
+        if doc_cache is not None:
+            logger.info(
+                f"Doc cache for split `{split.value}`: {stats.cache_hits} docs cached, {stats.cache_misses} built "
+                f"({stats.cache_hit_rate:.1%} hit rate)"
+            )
+        return stats
+
+    def write_docbin(self, json_data: Any, output_path: Path):
+        json_data = self._validate_spacy_json(json_data)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._convert_json_to_spacy(json_data, output_path)
+        logger.debug(f"Built docbin of `{len(json_data)}` records at `{output_path}`")
+
+    def merge_docbins(self, input_paths: list[Path], output_path: Path) -> int:
+        """
+        Concatenates already built DocBins without re-tokenizing anything.
+        Returns the number of docs written.
+        """
+        merged = DocBin()
+        for input_path in input_paths:
+            merged.merge(DocBin().from_disk(input_path))
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        merged.to_disk(output_path)
+        logger.info(f"Merged {len(input_paths)} docbins ({len(merged)} docs) into `{output_path}`")
+        return len(merged)
+
+    def remove_stale_output(self, output_path: Path, sharded: bool):
+        """
+        Removes the merged file after a sharded build, or the shard directory
+        (its shards and manifest) after a merged one. The corpus reader
+        prefers a shard directory over the merged file, so one left behind
+        by an earlier export would otherwise shadow the new data.
+        """
+        if sharded:
+            if output_path.exists():
+                output_path.unlink()
+                logger.info(f"Removed stale merged docbin `{output_path}`")
+            return
+        shard_dir = ShardedDocbinBuilder.shard_dir(output_path)
+        if not shard_dir.is_dir():
+            return
+        for stale in shard_dir.glob("shard-*.spacy"):
+            stale.unlink()
+        (shard_dir / MANIFEST_NAME).unlink(missing_ok=True)
+        if not any(shard_dir.iterdir()):
+            shard_dir.rmdir()
+        logger.info(f"Removed stale docbin shards in `{shard_dir}`")
+
     # def _update_latest_copy(self, spacy_file: Path, split: DatasetSplit):
     #     copy_path = self.OUTPUT_DIR / self.split_to_filename[split]
     #     self.file_writer.copy_file(src=spacy_file, dst=copy_path)
@@ -48,39 +152,45 @@ class DocbinBuilder:
             raise ValueError("Expected a list of training examples")
         
         for entry in data:
-            if not isinstance(entry, dict):
-                raise ValueError("Each item must be a dict")
-            if "text" not in entry or "entities" not in entry:
-                raise ValueError("Missing required keys in training example")
-            if not isinstance(entry["entities"], list):
-                raise ValueError("'entities' must be a list")
+            self._validate_entry(entry)
         
         return cast(list[SpacyFormattedJson], data)
 
-    def _convert_json_to_spacy(self, json_data: list[SpacyFormattedJson], output_path: Path):
+    def _validate_entry(self, entry: Any) -> SpacyFormattedJson:
+        if not isinstance(entry, dict):
+            raise ValueError("Each item must be a dict")
+        if "text" not in entry or "entities" not in entry:
+            raise ValueError("Missing required keys in training example")
+        if not isinstance(entry["entities"], list):
+            raise ValueError("'entities' must be a list")
+        return cast(SpacyFormattedJson, entry)
+
+    def _iter_valid_entries(self, records: Iterable[Any]) -> Iterator[SpacyFormattedJson]:
+        for entry in records:
+            yield self._validate_entry(entry)
+
+    def _convert_json_to_spacy(
+            self,
+            json_data: Iterable[SpacyFormattedJson],
+            output_path: Path,
+            doc_cache: DocCache | None = None,
+            shard_size: int = 2000,
+    ) -> tuple[int, int]:
+        """Returns the number of docs written and how many of them came from the doc cache."""
         nlp = spacy.blank("en")
         doc_bin = DocBin()
-
-        for example in json_data:
-            text = example["text"]
-            entities = example["entities"]
-            doc = nlp.make_doc(text)
-            spans = []
-            for start, end, label in entities:
-                if label not in AnnotationLabels.values():
-                    continue
-                span = doc.char_span(start, end, label=label)
-                if span is None:
-                    logger.debug(f"Skipping bad span: '{text[start:end]}'")
-                    continue
-                spans.append(span)
-            try:
-                doc.ents = spans
-            except ValueError:
-                logger.error(f"Invalid entity spans. Text: '{text}'")
-                logger.error(f"Invalid entity spans. Entities: {entities}")
-                logger.error(f"Failed to build docbin at {output_path}")
-                raise
-            doc_bin.add(doc)
+        cached_docs = 0
+        try:
+            if doc_cache is None:
+                for example in json_data:
+                    doc_bin.add(make_doc(nlp, example))
+            else:
+                for shard in iter_shards(json_data, shard_size):
+                    data, cached = build_shard_bytes(nlp, shard, doc_cache)
+                    doc_bin.merge(DocBin().from_bytes(data))
+                    cached_docs += len(shard) if cached else 0
+        except ValueError:
+            logger.error(f"Failed to build docbin at {output_path}")
+            raise
         doc_bin.to_disk(output_path)
-
+        return len(doc_bin), cached_docs
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 import logging
 from pathlib import Path
 from typing import Any, cast
@@ -63,21 +64,33 @@ class LabelStudioConverter:
 
         return cast(list[LabelStudioAnnotatedJson], data)
     
+    def convert_task(self, item: LabelStudioAnnotatedJson) -> SpacyFormattedJson | None:
+        """Convert a single Label Studio task. Returns None for tasks with no annotations yet."""
+        annotations = item.get("annotations", [])
+        if not annotations:
+            return None
+        text = item["data"]["text"]
+        entities = []
+        results = annotations[0].get("result", [])
+        for r in results:
+            start = r["value"]["start"]
+            end = r["value"]["end"]
+            label = r["value"]["labels"][0]
+            entities.append([start, end, label])
+        return {
+            "text": text,
+            "entities": entities
+        }
+
+    def iter_convert(self, json_data: Iterable[LabelStudioAnnotatedJson]) -> Iterator[SpacyFormattedJson]:
+        """Lazily converts tasks one at a time, skipping unannotated ones."""
+        for item in json_data:
+            converted = self.convert_task(item)
+            if converted is None:
+                logger.debug(f"Skipping unannotated task: '{item['data']['text']}'")
+                continue
+            yield converted
+
     def _convert(self, json_data: list[LabelStudioAnnotatedJson]) -> list[SpacyFormattedJson]:
         """Convert Label Studio JSON to spaCy training format."""
-        converted_data: list[SpacyFormattedJson] = []
-        for item in json_data:
-            text = item["data"]["text"]
-            entities = []
-            results = item.get("annotations", [])[0].get("result", [])
-            for r in results:
-                start = r["value"]["start"]
-                end = r["value"]["end"]
-                label = r["value"]["labels"][0]
-                entities.append([start, end, label])
-            converted_data.append({
-                "text": text,
-                "entities": entities
-            })
-
-        return converted_data
+        return list(self.iter_convert(json_data))
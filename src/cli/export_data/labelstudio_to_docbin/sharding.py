@@ -0,0 +1,213 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+import logging
+import multiprocessing
+from pathlib import Path
+import time
+import zlib
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc, DocBin
+from .alignment import IssueKind, align_entities
+from .dataclasses import DocbinBuildStats
+from .doc_cache import DocCache, shard_key, tokenizer_fingerprint
+from ....common.types import SpacyFormattedJson
+from ....training.corpus import MANIFEST_NAME, CorpusManifest, CorpusShard
+
+logger = logging.getLogger(__name__)
+
+# One blank pipeline (and doc cache connection) per worker process, built on its first shard
+_worker_nlp: Language | None = None
+_worker_cache: DocCache | None = None
+
+
+def make_doc(nlp: Language, example: SpacyFormattedJson) -> Doc:
+    # Cached by DocCache: bump doc_cache.DOC_BUILD_VERSION when changing how a Doc is built
+    text = example["text"]
+    entities = example["entities"]
+    doc = nlp.make_doc(text)
+    spans, issues = align_entities(doc, entities)
+    for issue in issues:
+        if issue.kind == IssueKind.MISALIGNED.value:
+            logger.warning(f"Skipping span not aligned to tokens: {issue.label} '{issue.text}' in: '{text}'")
+        elif issue.kind != IssueKind.OVERLAP.value:
+            logger.debug(f"Skipping {issue.kind} span: {issue.label} '{issue.text}'")
+    try:
+        doc.ents = spans
+    except ValueError:
+        logger.error(f"Invalid entity spans. Text: '{text}'")
+        logger.error(f"Invalid entity spans. Entities: {entities}")
+        raise
+    return doc
+
+
+def iter_shards(records: Iterable[SpacyFormattedJson], shard_size: int) -> Iterator[list[SpacyFormattedJson]]:
+    """
+    Cuts records into shards of about `shard_size` (at most twice that) at
+    content-defined boundaries: after the first shard_size / 2 records, a
+    shard ends wherever a record's text hashes to 0 modulo shard_size / 2.
+    Inserting or editing a record therefore only changes the shard it lands
+    in, and every other shard keeps its contents and its DocCache key.
+    """
+    min_size = shard_size // 2
+    modulus = max(1, shard_size // 2)
+    shard: list[SpacyFormattedJson] = []
+    for record in records:
+        shard.append(record)
+        at_boundary = zlib.crc32(record["text"].encode("utf-8")) % modulus == 0
+        if (len(shard) >= min_size and at_boundary) or len(shard) >= 2 * shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def build_shard_bytes(
+        nlp: Language,
+        records: list[SpacyFormattedJson],
+        doc_cache: DocCache | None = None,
+) -> tuple[bytes, bool]:
+    """
+    Serialized DocBin of one shard and whether it came from the cache.
+    Every record becomes exactly one doc.
+    """
+    key = None
+    if doc_cache is not None:
+        key = shard_key(records, tokenizer_fingerprint(nlp))
+        data = doc_cache.get(key)
+        if data is not None:
+            return data, True
+    doc_bin = DocBin()
+    for example in records:
+        doc_bin.add(make_doc(nlp, example))
+    data = doc_bin.to_bytes()
+    if doc_cache is not None and key is not None:
+        doc_cache.put(key, data)
+    return data, False
+
+
+def build_shard(records: list[SpacyFormattedJson], cache_path: Path | None = None) -> tuple[int, bytes, bool]:
+    """
+    Worker entry point: tokenizes one shard (or takes it from the doc cache)
+    and returns its doc count, serialized DocBin and whether it was cached.
+    """
+    global _worker_nlp, _worker_cache
+    if _worker_nlp is None:
+        _worker_nlp = spacy.blank("en")
+    doc_cache = None
+    if cache_path is not None:
+        if _worker_cache is None or _worker_cache.path != cache_path:
+            _worker_cache = DocCache(cache_path)
+        doc_cache = _worker_cache
+    data, cached = build_shard_bytes(_worker_nlp, records, doc_cache)
+    if doc_cache is not None:
+        # Pool workers are never closed explicitly, so persist new entries per shard
+        doc_cache.flush()
+    return len(records), data, cached
+
+
+class ShardedDocbinBuilder:
+    """
+    Builds a DocBin with a pool of worker processes.
+
+    Records are cut into shards of about `shard_size` (see iter_shards) and
+    each shard is tokenized and serialized in a worker. Shards are collected strictly in submission
+    order, so the output is identical to a single-process build no matter
+    which worker finishes first. At most MAX_PENDING_PER_WORKER shards per
+    worker are in flight, which keeps memory bounded when records are
+    streamed in.
+
+    The shards are either merged into one .spacy file or, with `sharded`,
+    left as numbered files plus a manifest in a directory named after it
+    (data/spacy/train/ for train.spacy), which is what the training
+    config's street_ninja.StreamingCorpus.v1 reader streams from.
+    """
+
+    MAX_PENDING_PER_WORKER = 2
+
+    def __init__(self, workers: int, shard_size: int = 2000):
+        if workers < 1 or shard_size < 1:
+            msg = f"{self.__class__.__name__} needs workers >= 1 and shard_size >= 1, got {workers} and {shard_size}"
+            logger.error(msg)
+            raise ValueError(msg)
+        self.workers = workers
+        self.shard_size = shard_size
+
+    @staticmethod
+    def shard_dir(output_path: Path) -> Path:
+        return output_path.with_suffix("")
+
+    def build(
+            self,
+            records: Iterable[SpacyFormattedJson],
+            output_path: Path,
+            sharded: bool = False,
+            doc_cache: DocCache | None = None,
+    ) -> DocbinBuildStats:
+        start = time.perf_counter()
+        shard_dir = self.shard_dir(output_path)
+        if sharded:
+            self._clear_shards(shard_dir)
+        merged = DocBin()
+        cache_path = doc_cache.path if doc_cache is not None else None
+        pending: deque[Future[tuple[int, bytes, bool]]] = deque()
+        docs = 0
+        shards = 0
+        hits = 0
+        misses = 0
+        manifest = CorpusManifest(docs=0, shards=[])
+
+        def collect():
+            nonlocal docs, hits, misses
+            index = shards - len(pending)
+            try:
+                count, data, cached = pending.popleft().result()
+            except Exception:
+                logger.error(f"Failed to build docbin shard {index} for `{output_path}`")
+                raise
+            docs += count
+            if cached:
+                hits += count
+            elif cache_path is not None:
+                misses += count
+            if sharded:
+                shard_name = f"shard-{index:05d}.spacy"
+                (shard_dir / shard_name).write_bytes(data)
+                manifest.shards.append(CorpusShard(path=shard_name, docs=count, bytes=len(data)))
+            else:
+                merged.merge(DocBin().from_bytes(data))
+
+        # spawn rather than fork: splits are exported from threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+            for shard in iter_shards(records, self.shard_size):
+                pending.append(executor.submit(build_shard, shard, cache_path))
+                shards += 1
+                if len(pending) >= self.workers * self.MAX_PENDING_PER_WORKER:
+                    collect()
+            while pending:
+                collect()
+
+        if sharded:
+            manifest.docs = docs
+            manifest.save(shard_dir)
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            merged.to_disk(output_path)
+        return DocbinBuildStats(
+            split=output_path.stem,
+            docs=docs,
+            shards=shards,
+            workers=self.workers,
+            elapsed=time.perf_counter() - start,
+            output_path=str(shard_dir if sharded else output_path),
+            cache_hits=hits,
+            cache_misses=misses,
+        )
+
+    def _clear_shards(self, shard_dir: Path):
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        for stale in shard_dir.glob("shard-*.spacy"):
+            stale.unlink()
+        (shard_dir / MANIFEST_NAME).unlink(missing_ok=True)
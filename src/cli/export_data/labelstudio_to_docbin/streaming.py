@@ -0,0 +1,82 @@
+from collections.abc import Iterable, Iterator
+import logging
+from typing import Any
+from .dataclasses import DocbinBuildStats
+from .doc_cache import DocCache
+from .docbin import DocbinBuilder
+from .label_studio_converter import LabelStudioConverter
+from ....common.enums import DatasetSplit
+from ....common.io import FileReader, FileWriter, RecordWriter
+from ....common.types import LabelStudioAnnotatedJson, SpacyFormattedJson
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingDocbinService:
+    """
+    Converts Label Studio tasks straight into the split's DocBin as they
+    arrive, without materializing the raw export or the intermediate spaCy
+    JSON. Peak memory is the DocBin itself (compact token/entity arrays)
+    rather than the export plus its converted copy plus the DocBin.
+
+    With `save_converted`, the converted records are also streamed to
+    data/converted/ as they pass through, for inspection. `workers`,
+    `shard_size` and `sharded` are passed on to DocbinBuilder. With a
+    `doc_cache_mb` limit, unchanged examples are taken from the DocCache and
+    the cache is trimmed back to that size afterwards.
+    """
+
+    def __init__(
+            self,
+            split_enum: DatasetSplit,
+            save_converted: bool = False,
+            workers: int = 1,
+            shard_size: int = 2000,
+            sharded: bool = False,
+            doc_cache_mb: int | None = None,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        self.split_enum = split_enum
+        self.save_converted = save_converted
+        self.workers = workers
+        self.shard_size = shard_size
+        self.sharded = sharded
+        self.doc_cache_mb = doc_cache_mb
+        self.file_writer = file_writer
+        self.labelstudio_converter = LabelStudioConverter(file_writer=file_writer, file_reader=file_reader)
+        self.docbin_builder = DocbinBuilder(file_writer=file_writer, file_reader=file_reader)
+
+    def convert(self, tasks: Iterable[LabelStudioAnnotatedJson | dict[str, Any]]) -> DocbinBuildStats:
+        records = self.labelstudio_converter.iter_convert(tasks)
+        if not self.save_converted:
+            return self._build(records)
+
+        output_path = self.file_writer.output_path_from_split(
+            self.split_enum, self.labelstudio_converter.OUTPUT_DIR, "json"
+        )
+        with self.file_writer.open_records(output_path) as writer:
+            stats = self._build(self._tee(records, writer))
+        logger.info(f"Saved {stats.docs} records to {output_path}")
+        return stats
+
+    def _build(self, records: Iterable[SpacyFormattedJson]) -> DocbinBuildStats:
+        doc_cache = DocCache(max_bytes=self.doc_cache_mb * 1024 * 1024) if self.doc_cache_mb else None
+        try:
+            return self.docbin_builder.build_docbin_from_records(
+                records,
+                self.split_enum,
+                workers=self.workers,
+                shard_size=self.shard_size,
+                sharded=self.sharded,
+                doc_cache=doc_cache,
+            )
+        finally:
+            if doc_cache is not None:
+                doc_cache.evict()
+                doc_cache.close()
+
+    def _tee(self, records: Iterator[SpacyFormattedJson], writer: RecordWriter) -> Iterator[SpacyFormattedJson]:
+        for record in records:
+            writer.write(record)
+            yield record
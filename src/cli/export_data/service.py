@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Any
+import time
+from typer import Exit
 from ..base_service import BaseCliService
 from .command import ExportDataCommand
+from .incremental.service import IncrementalExportService
+from ...common.api import ApiClient
 from ...common.enums import DatasetSplit
-from .labelstudio_to_docbin.service import LabelStudioToDocbinService
+from .labelstudio_to_docbin.streaming import StreamingDocbinService
 
 logger = logging.getLogger(__name__)
 
@@ -11,24 +15,126 @@ class ExportDataService(BaseCliService):
 
     command_cls = ExportDataCommand
 
+    DEFAULT_SHARD_SIZE = 2000
+    DEFAULT_DOC_CACHE_MB = 1024
+
     @classmethod
-    def run(cls):
+    def run(
+            cls,
+            incremental: bool = False,
+            reset: bool = False,
+            save_converted: bool = False,
+            workers: int = 1,
+            shard_size: int | None = None,
+            sharded: bool = False,
+            doc_cache_mb: int | None = None,
+    ):
+        """
+        Exports every split concurrently. Each split's snapshot creation,
+        polling, download and conversion run in their own thread, so total
+        wall time approaches that of the slowest split rather than their sum.
+
+        With `incremental`, only tasks changed since the last incremental run
+        are fetched and merged into the locally cached dataset. Otherwise each
+        snapshot is streamed straight into the split's DocBin, built by
+        `workers` processes per split when more than one is given.
+        `shard_size` and `doc_cache_mb` default to 2000 and 1024 (None).
+        """
+        if incremental:
+            ignored = [
+                option for option, given in (
+                    ("--workers", workers > 1),
+                    ("--shard-size", shard_size is not None),
+                    ("--sharded", sharded),
+                    ("--doc-cache-mb", doc_cache_mb is not None),
+                )
+                if given
+            ]
+            if ignored:
+                # Incremental exports rebuild their own per-bucket DocBins in process
+                logger.error(f"{', '.join(ignored)} can't be combined with --incremental")
+                raise Exit(code=1)
+        shard_size = cls.DEFAULT_SHARD_SIZE if shard_size is None else shard_size
+        doc_cache_mb = cls.DEFAULT_DOC_CACHE_MB if doc_cache_mb is None else doc_cache_mb
         export_service = cls()
-        command = export_service.build_command()
-        for split_enum in DatasetSplit:
-            exported_data = command.export_data(DatasetSplit(split_enum))
-            conversion_service = export_service.build_conversion_service(split_enum, exported_data)
-            conversion_service.convert()
-            logger.debug(f"Successfully exported data for split `{split_enum.value}`")
-        logger.debug("Label-Studio export complete")
-
-    def build_conversion_service(self, split_enum: DatasetSplit, json: list[dict[str, Any]]) -> LabelStudioToDocbinService:
-        conversion_service = LabelStudioToDocbinService(
-            input_data=json,
+        splits = list(DatasetSplit)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(splits), thread_name_prefix="export") as executor:
+            futures = {
+                split_enum: executor.submit(
+                    export_service.export_split,
+                    split_enum,
+                    incremental,
+                    reset,
+                    save_converted,
+                    workers,
+                    shard_size,
+                    sharded,
+                    doc_cache_mb,
+                )
+                for split_enum in splits
+            }
+
+        failed = []
+        for split_enum, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Export failed for split `{split_enum.value}`: {error}", exc_info=error)
+                failed.append(split_enum.value)
+        if failed:
+            msg = f"Label-Studio export failed for splits: {', '.join(failed)}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        logger.debug(f"Label-Studio export complete in {time.perf_counter() - start:.2f}s")
+
+    def export_split(
+            self,
+            split_enum: DatasetSplit,
+            incremental: bool = False,
+            reset: bool = False,
+            save_converted: bool = False,
+            workers: int = 1,
+            shard_size: int = 2000,
+            sharded: bool = False,
+            doc_cache_mb: int | None = 1024,
+    ):
+        start = time.perf_counter()
+        # One command (and connection pool) per split, so latency metrics are reported per split
+        command = self.build_command()
+        try:
+            if incremental:
+                IncrementalExportService(split_enum, command).export(reset=reset)
+                logger.debug(f"Incrementally exported split `{split_enum.value}` in {time.perf_counter() - start:.2f}s")
+                return
+            conversion_service = self.build_conversion_service(
+                split_enum, save_converted, workers, shard_size, sharded, doc_cache_mb
+            )
+            stats = conversion_service.convert(command.export_stream(split_enum))
+            logger.debug(f"Successfully exported {stats.docs} records for split `{split_enum.value}` in {time.perf_counter() - start:.2f}s")
+        finally:
+            # Also reported for failed splits, retries and errors included
+            command.api_client.log_latency_summary()
+            command.api_client.close()
+
+    def build_conversion_service(
+            self,
+            split_enum: DatasetSplit,
+            save_converted: bool = False,
+            workers: int = 1,
+            shard_size: int = 2000,
+            sharded: bool = False,
+            doc_cache_mb: int | None = 1024,
+    ) -> StreamingDocbinService:
+        conversion_service = StreamingDocbinService(
             split_enum=split_enum,
+            save_converted=save_converted,
+            workers=workers,
+            shard_size=shard_size,
+            sharded=sharded,
+            doc_cache_mb=doc_cache_mb,
         )
         logger.debug(f"Successfully built {conversion_service.__class__.__name__}")
         return conversion_service
 
     def build_command(self) -> ExportDataCommand:
-        return self.command_cls()
\ No newline at end of file
+        return self.command_cls(api_client=ApiClient())
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SelectionStats:
+    split: str
+    candidates: int
+    selected: int
+    # Mean uncertainty of the selected messages vs the whole pool
+    selected_uncertainty: float
+    pool_uncertainty: float
+    elapsed: float
+    pool_path: str | None = None
+
+    @property
+    def messages_per_sec(self) -> float:
+        return self.candidates / self.elapsed if self.elapsed > 0 else 0.0
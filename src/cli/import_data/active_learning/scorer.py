@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Iterator
+import logging
+from pathlib import Path
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+logger = logging.getLogger(__name__)
+
+_worker_scorer: "UncertaintyScorer | None" = None
+
+
+class UncertaintyScorer:
+    """
+    Scores how unsure the model is about each message, from 0 (certain) to 1.
+
+    With a single model, the NER component re-parses each message with a
+    beam and the score is 1 minus the probability margin between the two
+    best entity analyses. With a `compare_model_dir`, the score is instead
+    the disagreement between the two models' entities: 1 minus the Jaccard
+    overlap of their (start, end, label) spans.
+    """
+
+    BEAM_DENSITY = 0.0001
+
+    def __init__(
+            self,
+            model_dir: Path,
+            compare_model_dir: Path | None = None,
+            beam_width: int = 8,
+            batch_size: int = 256,
+    ):
+        self.nlp = spacy.load(model_dir)
+        self.compare_nlp = spacy.load(compare_model_dir) if compare_model_dir is not None else None
+        self.beam_width = beam_width
+        self.batch_size = batch_size
+        self.ner_name = self._ner_name(self.nlp)
+
+    def score(self, texts: list[str]) -> list[float]:
+        if self.compare_nlp is not None:
+            return list(self._disagreement(texts))
+        return list(self._beam_margin(texts))
+
+    def _beam_margin(self, texts: list[str]) -> Iterator[float]:
+        ner = self.nlp.get_pipe(self.ner_name)
+        docs = list(self.nlp.pipe(texts, batch_size=self.batch_size, disable=[self.ner_name]))
+        for start in range(0, len(docs), self.batch_size):
+            beams = ner.beam_parse(docs[start:start + self.batch_size], beam_width=self.beam_width, beam_density=self.BEAM_DENSITY)
+            for beam in beams:
+                probs = sorted(beam.probs, reverse=True)
+                margin = probs[0] - probs[1] if len(probs) > 1 else 1.0
+                yield 1.0 - margin
+
+    def _disagreement(self, texts: list[str]) -> Iterator[float]:
+        docs = self.nlp.pipe(texts, batch_size=self.batch_size)
+        compare_docs = self.compare_nlp.pipe(texts, batch_size=self.batch_size)
+        for doc, compare_doc in zip(docs, compare_docs):
+            spans, compare_spans = self._spans(doc), self._spans(compare_doc)
+            union = spans | compare_spans
+            yield 1.0 - len(spans & compare_spans) / len(union) if union else 0.0
+
+    @staticmethod
+    def _spans(doc: Doc) -> set[tuple[int, int, str]]:
+        return {(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents}
+
+    @staticmethod
+    def _ner_name(nlp: Language) -> str:
+        for name, component in nlp.pipeline:
+            if hasattr(component, "beam_parse"):
+                return name
+        msg = f"Pipeline {nlp.pipe_names} has no NER component to score with"
+        logger.error(msg)
+        raise ValueError(msg)
+
+
+def init_worker(model_dir: Path, compare_model_dir: Path | None, beam_width: int, batch_size: int):
+    global _worker_scorer
+    _worker_scorer = UncertaintyScorer(model_dir, compare_model_dir, beam_width, batch_size)
+
+
+def score_batch(texts: list[str]) -> list[float]:
+    """Worker entry point, the scorer is loaded once per worker by init_worker."""
+    if _worker_scorer is None:
+        raise RuntimeError("Scoring worker used before init_worker")
+    return _worker_scorer.score(texts)
+
+
+def iter_batches(texts: Iterable[str], batch_size: int) -> Iterator[list[str]]:
+    batch: list[str] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,159 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict
+import heapq
+import logging
+import multiprocessing
+from pathlib import Path
+import time
+from .dataclasses import SelectionStats
+from .scorer import UncertaintyScorer, init_worker, iter_batches, score_batch
+from ....common.enums import DatasetSplit
+from ....common.io import FileReader, FileWriter
+from ....common.utils import timestamp
+from ....config.constants import AL_POOL_DIR, MODEL_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveLearningService:
+    """
+    Keeps only the `top_k` messages the model is least sure about in each
+    split file, so annotation effort goes where it teaches the model most.
+
+    Every message is scored (see UncertaintyScorer) in batches, by a pool of
+    `workers` processes that each load the model once. Only the current top
+    k are kept in memory while scoring. The split file is rewritten with the
+    selected messages, most uncertain first; the rest are moved to
+    data/al_pool/<split>/ so a later round, with a retrained model, can pick
+    from them again.
+    """
+
+    MAX_PENDING_PER_WORKER = 2
+
+    def __init__(
+            self,
+            top_k: int,
+            model_dir: Path = MODEL_DIR,
+            compare_model_dir: Path | None = None,
+            beam_width: int = 8,
+            batch_size: int = 256,
+            workers: int = 1,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        if top_k < 1 or workers < 1:
+            msg = f"{self.__class__.__name__} needs top_k >= 1 and workers >= 1, got {top_k} and {workers}"
+            logger.error(msg)
+            raise ValueError(msg)
+        for path in (model_dir, compare_model_dir):
+            if path is not None and not path.exists():
+                msg = f"Model not found: {path}"
+                logger.error(msg)
+                raise FileNotFoundError(msg)
+        self.top_k = top_k
+        self.model_dir = model_dir
+        self.compare_model_dir = compare_model_dir
+        self.beam_width = beam_width
+        self.batch_size = batch_size
+        self.workers = workers
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+        self._local_scorer: UncertaintyScorer | None = None
+
+    def select(self, files: dict[DatasetSplit, Path]) -> list[SelectionStats]:
+        all_stats = []
+        for split, path in files.items():
+            stats = self.select_file(split, path)
+            all_stats.append(stats)
+            logger.info(
+                f"Split `{split.value}`: selected {stats.selected} of {stats.candidates} messages "
+                f"(mean uncertainty {stats.selected_uncertainty:.3f} vs {stats.pool_uncertainty:.3f}) "
+                f"in {stats.elapsed:.2f}s ({stats.messages_per_sec:.0f} msgs/sec)"
+            )
+        return all_stats
+
+    def select_file(self, split: DatasetSplit, path: Path) -> SelectionStats:
+        start = time.perf_counter()
+        # Min-heap of (uncertainty, -index): the root is the least uncertain of the current top k
+        top: list[tuple[float, int]] = []
+        total = 0.0
+        candidates = 0
+        for index, uncertainty in enumerate(self._iter_scores(self.file_reader.iter_text_lines(path))):
+            candidates += 1
+            total += uncertainty
+            item = (uncertainty, -index)
+            if len(top) < self.top_k:
+                heapq.heappush(top, item)
+            elif item > top[0]:
+                heapq.heapreplace(top, item)
+
+        ranked = sorted(top, reverse=True)
+        order = {-neg_index: rank for rank, (_, neg_index) in enumerate(ranked)}
+        selected: list[str | None] = [None] * len(ranked)
+        pool_path = None
+        if candidates > len(ranked):
+            pool_path = AL_POOL_DIR / split.value / f"{path.stem}__pool{path.suffix}"
+        tmp_path = path.with_name(f"{path.stem}__selecting{path.suffix}")
+        with self.file_writer.open_text(tmp_path) as pool:
+            for index, line in enumerate(self.file_reader.iter_text_lines(path)):
+                rank = order.get(index)
+                if rank is not None:
+                    selected[rank] = line
+                else:
+                    pool.write(line)
+                    pool.write("\n")
+        if pool_path is not None:
+            pool_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.replace(pool_path)
+        else:
+            tmp_path.unlink()
+        with self.file_writer.open_text(path) as out:
+            for line in selected:
+                out.write(f"{line}\n")
+
+        return SelectionStats(
+            split=split.value,
+            candidates=candidates,
+            selected=len(ranked),
+            selected_uncertainty=sum(u for u, _ in ranked) / len(ranked) if ranked else 0.0,
+            pool_uncertainty=total / candidates if candidates else 0.0,
+            elapsed=time.perf_counter() - start,
+            pool_path=str(pool_path) if pool_path is not None else None,
+        )
+
+    def save_report(self, all_stats: list[SelectionStats]) -> Path:
+        output_path = AL_POOL_DIR / f"selection__{timestamp(intraday=True)}.json"
+        self.file_writer.save_json(output_path, [asdict(stats) for stats in all_stats])
+        logger.info(f"Saved active learning selection report to {output_path}")
+        return output_path
+
+    def _iter_scores(self, texts: Iterable[str]) -> Iterator[float]:
+        batches = iter_batches(texts, self.batch_size)
+        if self.workers == 1:
+            scorer = self._scorer()
+            for batch in batches:
+                yield from scorer.score(batch)
+            return
+
+        pending: deque[Future[list[float]]] = deque()
+        # spawn rather than fork, forking a process with a loaded model isn't safe with BLAS threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=init_worker,
+                initargs=(self.model_dir, self.compare_model_dir, self.beam_width, self.batch_size),
+        ) as executor:
+            for batch in batches:
+                pending.append(executor.submit(score_batch, batch))
+                if len(pending) >= self.workers * self.MAX_PENDING_PER_WORKER:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _scorer(self) -> UncertaintyScorer:
+        if self._local_scorer is None:
+            self._local_scorer = UncertaintyScorer(self.model_dir, self.compare_model_dir, self.beam_width, self.batch_size)
+        return self._local_scorer
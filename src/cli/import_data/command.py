@@ -1,72 +1,178 @@
+import asyncio
+import itertools
 import logging
-import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+from .dataclasses import ChunkFailure, ImportProgress
+from .journal import ImportJournal
 from ..base_command import BaseCommand
 from ...common.api import ApiClient
 from ...common.enums import DatasetSplit
 from ...common.io import FileReader
 from ...common.mappings import SPLIT_TO_LABELSTUDIO_NAME
+from ...config.constants import LABELSTUDIO_URL
 
+if TYPE_CHECKING:
+    # spaCy is only imported when pre-annotating
+    from .pre_annotate import PreAnnotator
 
 logger = logging.getLogger(__name__)
 
 
 class ImportCommand(BaseCommand):
-    
-    PROJECTS_URL = f"http://localhost:8080/api/projects"
+    """
+    Uploads split files to their Label Studio projects in chunks.
+
+    Chunks of every split are posted concurrently from one event loop, at
+    most `workers` in flight, over the API client's connection pool, which
+    retries chunks Label Studio turned away (no connection, 429/503) with
+    jittered backoff. Other failures aren't re-sent blindly, since the
+    import may have been committed before the response was lost. Every
+    chunk Label Studio confirms is recorded in the import journal, so
+    re-running an interrupted import only sends the chunks that never made it.
+
+    With a `pre_annotator`, every task carries the model's predicted spans.
+    Chunks are built in a worker thread, so inference on the next chunk
+    overlaps with uploading the previous ones.
+    """
+
     SPLIT_TO_LABELSTUDIO_NAME = SPLIT_TO_LABELSTUDIO_NAME
 
     def __init__(
-            self, 
+            self,
             files: dict[DatasetSplit, Path],
+            chunk_size: int = 1000,
+            workers: int = 4,
+            max_retries: int = 5,
+            backoff: float = 1.0,
             file_reader: FileReader = FileReader(),
-            api_client: ApiClient = ApiClient(),
+            api_client: ApiClient | None = None,
+            journal: ImportJournal | None = None,
+            base_url: str = LABELSTUDIO_URL,
+            pre_annotator: "PreAnnotator | None" = None,
     ):
         self.files = files
+        self.projects_url = f"{base_url}/api/projects"
+        self.chunk_size = chunk_size
+        self.workers = workers
         self.file_reader = file_reader
-        self.api_client = api_client
-
-    def import_files(self):
-        for split, path in self.files.items():
-            project_name = self._project_name(split)
-            label_studio_import_path = self._label_studio_import_url(project_name)
-            data = self._txt_to_labelstudio_json(path)
-            self._import_to_labelstudio(
-                import_url=label_studio_import_path,
-                tasks=data,
-            )
-            logger.debug(f"Successfully imported `{path}` to split `{split.value}`")
-
-    def _import_to_labelstudio(self, import_url: str, tasks: list[dict[str, Any]]):
-        token = os.getenv("LABELSTUDIO_API_TOKEN", "")
-        if not token:
+        self.api_client = api_client or ApiClient(pool_size=workers, max_retries=max_retries, backoff=backoff)
+        self.journal = journal or ImportJournal(file_reader=file_reader)
+        self.pre_annotator = pre_annotator
+
+    def import_files(self, progresses: list[ImportProgress] | None = None):
+        """
+        Imports `self.files`, or the given unfinished imports when resuming.
+        Raises once every chunk has been tried if any of them still failed.
+        """
+        if not self.api_client.token:
             msg = f"Missing label-studio API token. Did you forget to set an environment variable?"
             logger.error(msg)
             raise RuntimeError(msg)
-
-        headers = {"Authorization": f"Token {token}"}
-        response = self.api_client.post(
-            url=import_url,
-            json=tasks,
-            headers=headers,
+        if progresses is None:
+            progresses = [
+                self.journal.load(split, path, self.chunk_size) for split, path in self.files.items()
+            ]
+        start = time.perf_counter()
+        tasks_sent, failures = asyncio.run(self._import_all(progresses))
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Imported {tasks_sent} tasks in {elapsed:.2f}s "
+            f"({tasks_sent / elapsed if elapsed > 0 else 0.0:.0f} tasks/sec)"
         )
-        response.raise_for_status()
+        self.api_client.log_latency_summary()
+        if failures:
+            for failure in failures:
+                logger.error(f"Chunk {failure.chunk} of split `{failure.split}` failed: {failure.error}")
+            msg = f"{len(failures)} chunks failed to import, re-run `import --resume` to retry them"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+    async def _import_all(self, progresses: list[ImportProgress]) -> tuple[int, list[ChunkFailure]]:
+        failures: list[ChunkFailure] = []
+        tasks_sent = 0
+        in_flight: dict[asyncio.Task, tuple[ImportProgress, int]] = {}
+
+        def collect(finished: set[asyncio.Task]):
+            nonlocal tasks_sent
+            for task in finished:
+                progress, chunk = in_flight.pop(task)
+                error = task.exception()
+                if error is not None:
+                    failures.append(ChunkFailure(split=progress.split, chunk=chunk, error=str(error)))
+                    continue
+                tasks_sent += task.result()
+                self.journal.confirm(progress, chunk)
+
+        totals: list[tuple[ImportProgress, int]] = []
+        try:
+            for progress in progresses:
+                split = DatasetSplit(progress.split)
+                import_url = self._label_studio_import_url(self._project_name(split))
+                done = set(progress.done)
+                total_chunks = 0
+                chunks = self._iter_chunks(Path(progress.path), progress.chunk_size, skip=done)
+                while (item := await asyncio.to_thread(next, chunks, None)) is not None:
+                    chunk, tasks = item
+                    total_chunks = chunk + 1
+                    if tasks is None:
+                        continue
+                    # Bounded, so only `workers` chunks are ever held in memory
+                    if len(in_flight) >= self.workers:
+                        finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        collect(finished)
+                    task = asyncio.create_task(self._import_to_labelstudio(import_url, tasks))
+                    in_flight[task] = (progress, chunk)
+                totals.append((progress, total_chunks))
+            if in_flight:
+                finished, _ = await asyncio.wait(in_flight)
+                collect(finished)
+        finally:
+            await self.api_client.aclose()
+
+        for progress, total_chunks in totals:
+            self.journal.finish(progress, total_chunks)
+            logger.debug(f"Imported `{progress.path}` to split `{progress.split}` ({total_chunks} chunks)")
+        return tasks_sent, failures
+
+    async def _import_to_labelstudio(self, import_url: str, tasks: list[dict[str, Any]]) -> int:
+        await self.api_client.apost(url=import_url, json=tasks)
+        return len(tasks)
 
     def _label_studio_import_url(self, project_name: str) -> str:
-        return f"{self.PROJECTS_URL}/{project_name}/import"
+        return f"{self.projects_url}/{project_name}/import"
 
     def _project_name(self, split: DatasetSplit) -> str:
         return self.SPLIT_TO_LABELSTUDIO_NAME[split]
 
-    def _txt_to_labelstudio_json(self, path: Path) -> list[dict[str, Any]]:
+    def _iter_chunks(
+            self,
+            path: Path,
+            chunk_size: int,
+            skip: set[int] | None = None,
+    ) -> Iterator[tuple[int, list[dict[str, Any]] | None]]:
         """
-        Convert .txt data to expected LabelStudio input format:
+        Streams .txt data as numbered chunks in the expected LabelStudio input format:
         [
             {"data": {"text": "need food at 222 main st"}},
             {"data": {"text": "where's shelter near hastings?"}},
         ]
+        Chunks in `skip` (already imported) are yielded as None, without
+        running the model on them.
         """
-        data = self.file_reader.read_text(path)
-        tasks = [{"data": {"text": line.strip()}} for line in data.split("\n") if line.strip()]
-        return tasks
\ No newline at end of file
+        skip = skip or set()
+        lines = self.file_reader.iter_text_lines(path)
+
+        def text_chunks() -> Iterator[tuple[int, list[str] | None]]:
+            for chunk in itertools.count():
+                texts = list(itertools.islice(lines, chunk_size))
+                if not texts:
+                    return
+                yield chunk, None if chunk in skip else texts
+
+        if self.pre_annotator is not None:
+            yield from self.pre_annotator.iter_chunks(text_chunks())
+            return
+        for chunk, texts in text_chunks():
+            yield chunk, None if texts is None else [{"data": {"text": text}} for text in texts]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ImportProgress:
+    """Chunks of one split file confirmed by Label Studio, so an interrupted import can resume."""
+    split: str
+    path: str
+    digest: str
+    chunk_size: int
+    done: list[int] = field(default_factory=list)
+    # Only known once the whole file has been chunked
+    total_chunks: int | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self.total_chunks is not None and len(self.done) >= self.total_chunks
+
+
+@dataclass
+class ChunkFailure:
+    split: str
+    chunk: int
+    error: str
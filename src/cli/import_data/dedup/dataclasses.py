@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DuplicateCluster:
+    representative: str
+    size: int = 1
+    # A few of the dropped messages, for eyeballing the threshold
+    examples: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DedupStats:
+    messages: int = 0
+    kept: int = 0
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+    already_imported: int = 0
+    clusters: int = 0
+    largest_clusters: list[DuplicateCluster] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def dropped(self) -> int:
+        return self.messages - self.kept
@@ -0,0 +1,98 @@
+import re
+import zlib
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+
+def normalize_message(text: str) -> str:
+    """Casefolds, drops punctuation and collapses whitespace, so "FOOD PLS!!" == "food pls"."""
+    return " ".join(_PUNCTUATION.sub(" ", text.casefold()).split())
+
+
+def lsh_params(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    Bands and rows per band whose S-curve midpoint (1/bands) ** (1/rows)
+    lies closest to `threshold`, using as many of the permutations as possible.
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """
+    MinHash signatures over character shingles, vectorized with numpy.
+
+    Each shingle is hashed once with crc32 and the `num_perm` universal hash
+    permutations (a * x + b) mod p are applied to all shingles at once.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 4, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, normalized: str) -> set[str]:
+        k = self.shingle_size
+        if len(normalized) <= k:
+            return {normalized}
+        return {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+
+    def signature(self, normalized: str) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in self.shingles(normalized)),
+            dtype=np.uint64,
+        )
+        # uint64 products wrap around, as in datasketch; only the low 32 bits are kept
+        permuted = (np.outer(hashes, self.a) + self.b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+class LshIndex:
+    """
+    Banded locality-sensitive hashing index of MinHash signatures.
+
+    Signatures that agree on every row of at least one band land in the same
+    bucket and become candidates; candidates are then confirmed by their
+    estimated Jaccard similarity. Inserting and querying are both
+    proportional to the number of bands, so indexing n messages is O(n).
+    """
+
+    def __init__(self, num_perm: int = 128, threshold: float = 0.8):
+        self.threshold = threshold
+        self.bands, self.rows = lsh_params(num_perm, threshold)
+        self.signatures: list[np.ndarray] = []
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def query(self, signature: np.ndarray) -> int | None:
+        """Id of the most similar indexed signature at or above the threshold, if any."""
+        candidates: set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        best_id, best_similarity = None, self.threshold
+        for candidate in candidates:
+            similarity = float(np.count_nonzero(self.signatures[candidate] == signature)) / len(signature)
+            if similarity >= best_similarity:
+                best_id, best_similarity = candidate, similarity
+        return best_id
+
+    def add(self, signature: np.ndarray) -> int:
+        item_id = len(self.signatures)
+        self.signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(item_id)
+        return item_id
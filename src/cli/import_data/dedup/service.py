@@ -0,0 +1,129 @@
+from dataclasses import asdict
+import hashlib
+import heapq
+import logging
+from pathlib import Path
+import time
+from .dataclasses import DedupStats, DuplicateCluster
+from .minhash import LshIndex, MinHasher, normalize_message
+from ....common.io import FileReader, FileWriter
+from ....common.utils import timestamp
+from ....config.constants import DEDUP_DIR, RAW_TESTING_DIR, RAW_TRAINING_DIR, RAW_VALIDATION_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class DedupService:
+    """
+    Drops exact and near-duplicate messages from a raw SMS dump before it is
+    split, in a single streaming pass.
+
+    Messages are normalized (casefolded, punctuation stripped, whitespace
+    collapsed). Exact repeats are caught by a hash of the normalized text;
+    the rest are checked against a MinHash/LSH index of character shingles
+    and dropped when their estimated Jaccard similarity to an earlier
+    message reaches `threshold`. The first message of each cluster is kept.
+
+    With `against_imported`, everything already in data/raw/ is indexed
+    first, so messages that were imported before are dropped too.
+    """
+
+    TOP_CLUSTERS = 20
+    CLUSTER_EXAMPLES = 3
+
+    def __init__(
+            self,
+            input_path: Path,
+            threshold: float = 0.8,
+            against_imported: bool = False,
+            num_perm: int = 128,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        self.input_path = input_path
+        self.against_imported = against_imported
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.index = LshIndex(num_perm=num_perm, threshold=threshold)
+        self._exact: dict[bytes, int] = {}
+        self._texts: list[str] = []
+        self._clusters: dict[int, DuplicateCluster] = {}
+        self._imported = 0
+
+    @property
+    def output_path(self) -> Path:
+        return self.input_path.with_name(f"{self.input_path.stem}__dedup{self.input_path.suffix}")
+
+    def deduplicate(self) -> tuple[Path, DedupStats]:
+        start = time.perf_counter()
+        if self.against_imported:
+            self._index_imported()
+        stats = DedupStats()
+        with self.file_writer.open_text(self.output_path) as out:
+            for line in self.file_reader.iter_text_lines(self.input_path):
+                stats.messages += 1
+                if self._add(line, stats):
+                    out.write(line)
+                    out.write("\n")
+                    stats.kept += 1
+
+        stats.clusters = len(self._clusters)
+        largest = heapq.nlargest(self.TOP_CLUSTERS, self._clusters.values(), key=lambda cluster: cluster.size)
+        stats.largest_clusters = largest
+        stats.elapsed = time.perf_counter() - start
+        logger.info(
+            f"Dedup: kept {stats.kept} of {stats.messages} messages, dropped {stats.exact_duplicates} exact and "
+            f"{stats.near_duplicates} near duplicates ({stats.already_imported} already imported) "
+            f"in {stats.elapsed:.2f}s"
+        )
+        for cluster in largest[:5]:
+            logger.info(f"Dedup cluster x{cluster.size}: '{cluster.representative}'")
+        return self.output_path, stats
+
+    def save_report(self, stats: DedupStats) -> Path:
+        output_path = DEDUP_DIR / f"report__{timestamp(intraday=True)}.json"
+        report = asdict(stats)
+        report["dropped"] = stats.dropped
+        self.file_writer.save_json(output_path, report)
+        logger.info(f"Saved dedup report to {output_path}")
+        return output_path
+
+    def _add(self, text: str, stats: DedupStats | None = None) -> bool:
+        """Indexes `text` unless it duplicates something already indexed. Returns whether it was new."""
+        normalized = normalize_message(text)
+        key = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+        match = self._exact.get(key)
+        exact = match is not None
+        signature = None
+        if not exact:
+            signature = self.hasher.signature(normalized)
+            match = self.index.query(signature)
+        if match is None:
+            item_id = self.index.add(signature)
+            self._exact[key] = item_id
+            self._texts.append(text)
+            return True
+
+        if stats is not None:
+            if match < self._imported:
+                stats.already_imported += 1
+            elif exact:
+                stats.exact_duplicates += 1
+            else:
+                stats.near_duplicates += 1
+            cluster = self._clusters.get(match)
+            if cluster is None:
+                cluster = self._clusters[match] = DuplicateCluster(representative=self._texts[match])
+            cluster.size += 1
+            if len(cluster.examples) < self.CLUSTER_EXAMPLES and text != cluster.representative:
+                cluster.examples.append(text)
+        return False
+
+    def _index_imported(self):
+        for raw_dir in (RAW_TRAINING_DIR, RAW_VALIDATION_DIR, RAW_TESTING_DIR):
+            for path in sorted(raw_dir.glob("*.txt")):
+                for line in self.file_reader.iter_text_lines(path):
+                    self._add(line)
+        self._imported = len(self._texts)
+        logger.debug(f"Indexed {self._imported} already imported messages for dedup")
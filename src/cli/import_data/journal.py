@@ -0,0 +1,94 @@
+from dataclasses import asdict
+import hashlib
+import logging
+import os
+from pathlib import Path
+import threading
+from .dataclasses import ImportProgress
+from ...common.enums import DatasetSplit
+from ...common.io import FileReader, FileWriter
+from ...config.constants import IMPORT_JOURNAL_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJournal:
+    """
+    Local record of which chunks of each split file Label Studio has accepted.
+
+    One JSON file per split file, keyed by a hash of the file's contents, is
+    rewritten (atomically) after every confirmed chunk. Re-importing the same
+    file skips those chunks instead of sending, and duplicating, their tasks
+    again. Journals of finished imports are deleted.
+    """
+
+    DIGEST_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+            self,
+            journal_dir: Path = IMPORT_JOURNAL_DIR,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+    ):
+        self.journal_dir = journal_dir
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+        self._lock = threading.Lock()
+
+    def load(self, split: DatasetSplit, path: Path, chunk_size: int) -> ImportProgress:
+        digest = self._digest(path)
+        journal_path = self._journal_path(digest)
+        if journal_path.exists():
+            progress = ImportProgress(**self.file_reader.json_from_file(journal_path))
+            logger.info(
+                f"Resuming import of `{path}`: {len(progress.done)} chunks of {progress.chunk_size} "
+                f"tasks already confirmed"
+            )
+            return progress
+        return ImportProgress(split=split.value, path=str(path), digest=digest, chunk_size=chunk_size)
+
+    def pending(self) -> list[ImportProgress]:
+        """Imports that were interrupted, whose split files are still on disk."""
+        if not self.journal_dir.exists():
+            return []
+        pending = []
+        for journal_path in sorted(self.journal_dir.glob("*.json")):
+            if journal_path.name.endswith(".tmp.json"):
+                continue
+            progress = ImportProgress(**self.file_reader.json_from_file(journal_path))
+            if Path(progress.path).exists():
+                pending.append(progress)
+            else:
+                logger.warning(f"Split file `{progress.path}` of unfinished import is gone, skipping it")
+        return pending
+
+    def confirm(self, progress: ImportProgress, chunk: int):
+        with self._lock:
+            progress.done.append(chunk)
+            self._save(progress)
+
+    def finish(self, progress: ImportProgress, total_chunks: int):
+        with self._lock:
+            progress.total_chunks = total_chunks
+            if progress.complete:
+                self._journal_path(progress.digest).unlink(missing_ok=True)
+                logger.debug(f"Import of `{progress.path}` complete, removed its journal")
+            else:
+                self._save(progress)
+
+    def _save(self, progress: ImportProgress):
+        journal_path = self._journal_path(progress.digest)
+        tmp_path = journal_path.with_suffix(".tmp.json")
+        self.file_writer.save_json(tmp_path, asdict(progress), indent=None)
+        # A crash mid-write must never leave a truncated journal behind
+        os.replace(tmp_path, journal_path)
+
+    def _journal_path(self, digest: str) -> Path:
+        return self.journal_dir / f"{digest}.json"
+
+    def _digest(self, path: Path) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            while chunk := f.read(self.DIGEST_CHUNK_SIZE):
+                h.update(chunk)
+        return h.hexdigest()
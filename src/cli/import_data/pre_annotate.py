@@ -0,0 +1,101 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+import itertools
+import logging
+from pathlib import Path
+from typing import Any
+import spacy
+from spacy.tokens import Doc
+from ...common.utils import model_fingerprint
+from ...config.constants import MODEL_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class PreAnnotator:
+    """
+    Attaches the current model's entities to import tasks as Label Studio
+    `predictions`, so annotators correct pre-filled spans instead of
+    labelling from scratch.
+
+    Messages are streamed through a single `nlp.pipe` per split file, so
+    batching (and with `n_process` > 1, worker processes) is set up once,
+    not per upload chunk.
+    """
+
+    # Names of the <Labels> and <Text> tags in the Label Studio labelling config
+    FROM_NAME = "label"
+    TO_NAME = "text"
+
+    def __init__(self, model_dir: Path = MODEL_DIR, batch_size: int = 256, n_process: int = 1):
+        if not model_dir.exists():
+            msg = f"Model not found: {model_dir}"
+            logger.error(msg)
+            raise FileNotFoundError(msg)
+        self.nlp = spacy.load(model_dir)
+        self.batch_size = batch_size
+        self.n_process = n_process
+        meta = self.nlp.meta
+        self.model_version = f"{meta.get('name')}-{meta.get('version')}:{model_fingerprint(model_dir)}"
+        logger.debug(f"Pre-annotating with model `{self.model_version}`")
+
+    def iter_tasks(self, texts: Iterable[str]) -> Iterator[dict[str, Any]]:
+        for doc in self.nlp.pipe(texts, batch_size=self.batch_size, n_process=self.n_process):
+            yield {"data": {"text": doc.text}, "predictions": [self._prediction(doc)]}
+
+    def iter_chunks(
+            self,
+            chunks: Iterable[tuple[int, list[str] | None]],
+    ) -> Iterator[tuple[int, list[dict[str, Any]] | None]]:
+        """
+        Turns numbered chunks of texts into chunks of pre-annotated tasks,
+        feeding all of them through one `nlp.pipe`. Chunks given as None
+        (already imported) pass through as None.
+        """
+        # Chunks read ahead by nlp.pipe but not yet handed out, with their sizes
+        plan: deque[tuple[int, int | None]] = deque()
+
+        def texts() -> Iterator[str]:
+            for chunk, chunk_texts in chunks:
+                plan.append((chunk, None if chunk_texts is None else len(chunk_texts)))
+                if chunk_texts is not None:
+                    yield from chunk_texts
+
+        tasks = self.iter_tasks(texts())
+        buffered: list[dict[str, Any]] = []
+        while True:
+            if not plan:
+                # Pulling a task through the pipe reads, and plans, its chunk
+                task = next(tasks, None)
+                if task is not None:
+                    buffered.append(task)
+                elif not plan:
+                    return
+                continue
+            chunk, size = plan.popleft()
+            if size is None:
+                yield chunk, None
+                continue
+            batch = buffered[:size]
+            buffered = buffered[size:]
+            batch.extend(itertools.islice(tasks, size - len(batch)))
+            yield chunk, batch
+
+    def _prediction(self, doc: Doc) -> dict[str, Any]:
+        return {
+            "model_version": self.model_version,
+            "result": [
+                {
+                    "from_name": self.FROM_NAME,
+                    "to_name": self.TO_NAME,
+                    "type": "labels",
+                    "value": {
+                        "start": ent.start_char,
+                        "end": ent.end_char,
+                        "text": ent.text,
+                        "labels": [ent.label_],
+                    },
+                }
+                for ent in doc.ents
+            ],
+        }
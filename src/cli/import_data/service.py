@@ -1,10 +1,15 @@
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 from ...common.enums import DatasetSplit
 from .command import ImportCommand
 from ..base_service import BaseCliService
 from .split_data.service import SplitDataService
 
+if TYPE_CHECKING:
+    from .active_learning.service import ActiveLearningService
+    from .pre_annotate import PreAnnotator
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,18 +18,125 @@ class ImportService(BaseCliService):
     command_cls = ImportCommand
 
     @classmethod
-    def run(cls, input_path: Path, ratios: dict[str, float]):
+    def run(
+            cls,
+            input_path: Path | None,
+            ratios: dict[str, float],
+            streaming: bool = False,
+            seed: int = 0,
+            dedup: bool = False,
+            dedup_threshold: float = 0.8,
+            dedup_against_imported: bool = False,
+            chunk_size: int = 1000,
+            workers: int = 4,
+            resume: bool = False,
+            pre_annotate: bool = False,
+            model_dir: Path | None = None,
+            batch_size: int = 256,
+            n_process: int = 1,
+            select_top_k: int | None = None,
+            compare_model_dir: Path | None = None,
+            beam_width: int = 8,
+    ):
         service = cls()
+        # Loaded before anything is split or deleted, so a missing model fails early
+        pre_annotator = service.build_pre_annotator(model_dir, batch_size, n_process) if pre_annotate else None
+        selector = None
+        if select_top_k is not None:
+            selector = service.build_selector(select_top_k, model_dir, compare_model_dir, beam_width, batch_size, n_process)
+        if resume:
+            service.resume(chunk_size=chunk_size, workers=workers, pre_annotator=pre_annotator)
+        if input_path is None:
+            if not resume:
+                msg = "Nothing to import: give an input file or --resume"
+                logger.error(msg)
+                raise ValueError(msg)
+            return
+
+        split_input_path = input_path
+        if dedup:
+            # numpy is only worth importing when deduplicating
+            from .dedup.service import DedupService
+            dedup_service = DedupService(
+                input_path=input_path,
+                threshold=dedup_threshold,
+                against_imported=dedup_against_imported,
+            )
+            split_input_path, stats = dedup_service.deduplicate()
+            dedup_service.save_report(stats)
 
-        split_data_service = SplitDataService(input_path=input_path, ratios=ratios)
-        split_data_service.split_and_save_data()
+        split_data_service = SplitDataService(input_path=split_input_path, ratios=ratios, streaming=streaming, seed=seed)
+        if streaming:
+            counts = split_data_service.split_and_save_streaming()
+            logger.info(", ".join(f"{split.value}: {count}" for split, count in counts.items()))
+        else:
+            split_data_service.split_and_save_data()
+        if split_input_path != input_path:
+            service._delete_input_path(split_input_path)
         service._delete_input_path(input_path)
 
-        command = service.build_command(split_data_service.file_paths)
+        if selector is not None:
+            selector.save_report(selector.select(split_data_service.file_paths))
+
+        command = service.build_command(
+            split_data_service.file_paths,
+            chunk_size=chunk_size,
+            workers=workers,
+            pre_annotator=pre_annotator,
+        )
         command.import_files()
-        
-    def build_command(self, files: dict[DatasetSplit, Path]) -> ImportCommand:
-        return self.command_cls(files=files)
+
+    def resume(self, chunk_size: int = 1000, workers: int = 4, pre_annotator: "PreAnnotator | None" = None):
+        command = self.build_command({}, chunk_size=chunk_size, workers=workers, pre_annotator=pre_annotator)
+        pending = command.journal.pending()
+        if not pending:
+            logger.info("No interrupted imports to resume")
+            return
+        logger.info(f"Resuming {len(pending)} interrupted imports")
+        command.import_files(pending)
+
+    def build_command(
+            self,
+            files: dict[DatasetSplit, Path],
+            chunk_size: int = 1000,
+            workers: int = 4,
+            pre_annotator: "PreAnnotator | None" = None,
+    ) -> ImportCommand:
+        return self.command_cls(files=files, chunk_size=chunk_size, workers=workers, pre_annotator=pre_annotator)
+
+    def build_pre_annotator(self, model_dir: Path | None, batch_size: int, n_process: int) -> "PreAnnotator":
+        # spaCy is only worth importing when pre-annotating
+        from .pre_annotate import PreAnnotator
+        kwargs = {"batch_size": batch_size, "n_process": n_process}
+        if model_dir is not None:
+            kwargs["model_dir"] = self._to_path(model_dir, check=True)
+        pre_annotator = PreAnnotator(**kwargs)
+        logger.info(f"Pre-annotating imported tasks with `{pre_annotator.model_version}`")
+        return pre_annotator
+
+    def build_selector(
+            self,
+            top_k: int,
+            model_dir: Path | None,
+            compare_model_dir: Path | None,
+            beam_width: int,
+            batch_size: int,
+            n_process: int,
+    ) -> "ActiveLearningService":
+        # spaCy is only worth importing when selecting
+        from .active_learning.service import ActiveLearningService
+        kwargs = {}
+        if model_dir is not None:
+            kwargs["model_dir"] = self._to_path(model_dir, check=True)
+        if compare_model_dir is not None:
+            kwargs["compare_model_dir"] = self._to_path(compare_model_dir, check=True)
+        return ActiveLearningService(
+            top_k=top_k,
+            beam_width=beam_width,
+            batch_size=batch_size,
+            workers=n_process,
+            **kwargs,
+        )
 
     def _delete_input_path(self, input_path: Path):
         input_path.unlink()
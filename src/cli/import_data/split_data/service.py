@@ -1,3 +1,5 @@
+from contextlib import ExitStack
+import hashlib
 import logging
 from pathlib import Path
 import random
@@ -18,14 +20,19 @@ class SplitDataService:
             input_path: Path, 
             ratios: dict[str, float],
             file_writer: FileWriter = FileWriter(),
-            file_reader: FileReader = FileReader()
+            file_reader: FileReader = FileReader(),
+            streaming: bool = False,
+            seed: int = 0,
     ):
         self.input_path = input_path
         self.ratios = self._build_ratio_split(ratios)
         self._validate_ratios()
         self.file_writer = file_writer
         self.file_reader = file_reader
-        self.input_data = self._input_data()
+        self.streaming = streaming
+        self.seed = seed
+        # The streaming split never loads the input
+        self.input_data = [] if streaming else self._input_data()
         self.file_paths: dict[DatasetSplit, Path] = {}
 
     def split_and_save_data(self):
@@ -43,6 +50,41 @@ class SplitDataService:
         self._save_data(data.testing, testing_outfile)
         logger.debug(f"Successfully saved TESTING data ({len(data.training)}) records to {testing_outfile}")
 
+    def split_and_save_streaming(self) -> dict[DatasetSplit, int]:
+        """
+        Single pass over the input: each line goes to the split picked by a
+        seeded hash of its normalized text and is written straight to that
+        split's buffered output. Only the current line is held in memory.
+
+        The same message (up to case and whitespace) always lands in the same
+        split for a given seed, so re-importing overlapping dumps can't leak
+        a test message into train.
+        """
+        counts = {split: 0 for split in DatasetSplit}
+        with ExitStack() as stack:
+            outputs = {
+                split: stack.enter_context(self.file_writer.open_text(self._outfile_path(split)))
+                for split in DatasetSplit
+            }
+            for line in self.file_reader.iter_text_lines(self.input_path):
+                split = self._split_for(line)
+                outputs[split].write(line)
+                outputs[split].write("\n")
+                counts[split] += 1
+        for split, count in counts.items():
+            logger.debug(f"Successfully saved {split.name} data ({count} records) to {self.file_paths[split]}")
+        return counts
+
+    def _split_for(self, line: str) -> DatasetSplit:
+        normalized = " ".join(line.casefold().split())
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8, key=str(self.seed).encode())
+        position = int.from_bytes(digest.digest(), "big") / 2**64
+        if position < self.ratios.training:
+            return DatasetSplit.TRAINING
+        if position < self.ratios.training + self.ratios.validation:
+            return DatasetSplit.VALIDATION
+        return DatasetSplit.TESTING
+
     def _build_ratio_split(self, ratios: dict[str, float]) -> RatioSplit:
         ratio_split = RatioSplit(
             training=ratios["train_ratio"],
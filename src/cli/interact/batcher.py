@@ -0,0 +1,124 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ParseMany = Callable[[list[str]], list[list[tuple[str, str]]]]
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-message requests into one `nlp.pipe` call.
+
+    Each caller awaits `submit(text)`. Queued texts are flushed as a single batch
+    as soon as either `max_batch` texts are waiting or `max_wait_ms` has passed
+    since the first one arrived, and each caller's future is resolved with its
+    own result. Inference runs on a dedicated worker thread so the event loop
+    keeps accepting requests while a batch is being processed; whatever queues
+    up in the meantime forms the next batch.
+
+    Usage:
+        batcher = MicroBatcher(command.parse_many, max_batch=32, max_wait_ms=5)
+        await batcher.start()
+        entities = await batcher.submit("need shelter near main and hastings")
+    """
+
+    def __init__(self, parse_many: ParseMany, max_batch: int = 32, max_wait_ms: float = 5.0):
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be >= 1, got {max_batch}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {max_wait_ms}")
+        self.parse_many = parse_many
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batcher")
+        self.batches = 0
+        self.messages = 0
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._collect())
+        logger.debug(f"Micro-batcher started (max_batch={self.max_batch}, max_wait={self.max_wait * 1000:.1f}ms)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, text: str) -> list[tuple[str, str]]:
+        if self._queue is None or self._loop is None:
+            raise RuntimeError(f"{self.__class__.__name__}.start() must be awaited before submitting")
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def start_in_thread(self):
+        """Runs the batcher on its own event loop thread, for use from synchronous code."""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, name="micro-batcher-loop", daemon=True).start()
+        started.wait()
+
+    def submit_threadsafe(self, text: str, timeout: float | None = None) -> list[tuple[str, str]]:
+        if self._loop is None:
+            raise RuntimeError(f"{self.__class__.__name__} is not running")
+        return asyncio.run_coroutine_threadsafe(self.submit(text), self._loop).result(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "mean_batch_size": round(self.messages / self.batches, 2) if self.batches else 0.0,
+        }
+
+    async def _collect(self):
+        assert self._queue is not None and self._loop is not None
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]):
+        assert self._loop is not None
+        texts = [text for text, _ in batch]
+        try:
+            results = await self._loop.run_in_executor(self._executor, self.parse_many, texts)
+        except Exception as e:
+            logger.error(f"Batch of {len(texts)} messages failed: {e}", exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            # A caller may have given up (cancelled) while the batch was running
+            if not future.done():
+                future.set_result(result)
+        self.batches += 1
+        self.messages += len(batch)
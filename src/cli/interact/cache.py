@@ -0,0 +1,135 @@
+from collections import OrderedDict
+import logging
+import threading
+from typing import Any
+from .dataclasses import NormalizedText
+from ...common.types import EntityPrediction
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_inquiry(text: str) -> NormalizedText:
+    """
+    Casefolds text, strips it and collapses whitespace runs to a single space,
+    recording where every character came from.
+    """
+    chars: list[str] = []
+    source_index: list[int] = []
+    offsets: list[int] = []
+    pending_space = -1
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            if chars and pending_space < 0:
+                pending_space = i
+            offsets.append(len(chars))
+            continue
+        if pending_space >= 0:
+            chars.append(" ")
+            source_index.append(pending_space)
+            pending_space = -1
+        offsets.append(len(chars))
+        for folded in ch.casefold():
+            chars.append(folded)
+            source_index.append(i)
+    offsets.append(len(chars))
+    return NormalizedText(text="".join(chars), source_index=source_index, offsets=offsets)
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of entity predictions keyed on normalized inquiry text.
+
+    The normalized text is only the key: on a miss the model runs on the
+    caller's own inquiry, exactly as without a cache, and its entities are
+    stored as offsets into the normalized text. "FOOD  near Main" and
+    "food near main" therefore share one entry, holding the entities
+    predicted for whichever of them was seen first, while each caller still
+    gets entity offsets and text taken from their own, unnormalized inquiry.
+
+    The cache is bound to one model at a time. Binding a different model key
+    (e.g. after model-best was retrained and reloaded) drops every entry, and
+    lookups or results from any other model key are ignored, so requests
+    still running on a replaced model can't repopulate it.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        self.max_size = max_size
+        self.model_key: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, list[tuple[int, int, str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bind_model(self, model_key: str):
+        with self._lock:
+            if model_key == self.model_key:
+                return
+            if self._entries:
+                logger.info(f"Model changed ({self.model_key} -> {model_key}), clearing {len(self._entries)} cached results")
+            self._entries.clear()
+            self.model_key = model_key
+
+    def get(self, text: str, model_key: str) -> tuple[NormalizedText, list[EntityPrediction] | None]:
+        """
+        The normalized inquiry, to pass back to `put` after a miss, and the
+        cached entities mapped onto `text`, or None.
+        """
+        normalized = normalize_inquiry(text)
+        with self._lock:
+            spans = self._entries.get(normalized.text) if model_key == self.model_key else None
+            if spans is None:
+                self.misses += 1
+                return normalized, None
+            self._entries.move_to_end(normalized.text)
+            self.hits += 1
+        return normalized, self._to_original(text, normalized, spans)
+
+    def put(self, normalized: NormalizedText, entities: list[EntityPrediction], model_key: str):
+        """Stores entities predicted on the original inquiry `normalized` was made from."""
+        spans = []
+        for ent in entities:
+            start, end = normalized.offsets[ent["start"]], normalized.offsets[ent["end"]]
+            if end > start:
+                spans.append((start, end, ent["label"]))
+        with self._lock:
+            if model_key != self.model_key:
+                return
+            self._entries[normalized.text] = spans
+            self._entries.move_to_end(normalized.text)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "model": self.model_key,
+        }
+
+    def _to_original(
+            self,
+            text: str,
+            normalized: NormalizedText,
+            spans: list[tuple[int, int, str]],
+    ) -> list[EntityPrediction]:
+        entities: list[EntityPrediction] = []
+        for start, end, label in spans:
+            orig_start = normalized.source_index[start]
+            orig_end = normalized.source_index[end - 1] + 1
+            entities.append({
+                "text": text[orig_start:orig_end],
+                "label": label,
+                "start": orig_start,
+                "end": orig_end,
+            })
+        return entities
@@ -1,9 +1,19 @@
+from collections.abc import Iterable, Iterator
 from enum import Enum
+import json
 import logging
 from pathlib import Path
+import time
+from typing import TextIO
 import spacy
+from spacy.tokens import Doc
+from .cache import ResultCache
+from .dataclasses import BatchStats
+from .profiler import PipelineProfiler
 from ..base_command import BaseCommand
 from ...common.io import ConsoleWriter
+from ...common.types import EntityPrediction, InferenceResult
+from ...common.utils import model_fingerprint
 from ...config.constants import MODEL_DIR
 
 
@@ -31,11 +41,20 @@ class InteractCommand(BaseCommand):
 
     class Kwargs(Enum):
         MODEL_DIR = "model_dir"
+        INPUT_FILE = "input_file"
+        STDIN = "stdin"
+        OUTPUT_PATH = "output_path"
+        BATCH_SIZE = "batch_size"
+        N_PROCESS = "n_process"
+        PROFILE = "profile"
 
     def __init__(
             self, 
             model_dir: Path = MODEL_DIR, 
             console_writer: ConsoleWriter = ConsoleWriter(),
+            cache: ResultCache | None = None,
+            profiler: PipelineProfiler | None = None,
+            bind_cache: bool = True,
     ):
         if not model_dir.exists():
             msg = f"Model not found: {model_dir}"
@@ -43,13 +62,50 @@ class InteractCommand(BaseCommand):
             raise FileNotFoundError(msg)
         self.nlp = spacy.load(model_dir)
         self.console_writer = console_writer
+        self.cache = cache
+        self.profiler = profiler
+        self.model_key = self._model_key(model_dir)
+        if bind_cache:
+            self.bind_cache()
+
+    def bind_cache(self):
+        """
+        Points the cache at this command's model, dropping other models' results.
+        Until then this command's results bypass the cache.
+        """
+        if self.cache is not None:
+            self.cache.bind_model(self.model_key)
 
     def parse(self, inquiry: str) -> list[tuple[str, str]]:
         """
         Returns a list of (entity_text, entity_label) for the given input text.
         """
-        doc = self.nlp(inquiry)
-        return [(ent.text, ent.label_) for ent in doc.ents]
+        if self.cache is None:
+            doc = self._run(inquiry)
+            return [(ent.text, ent.label_) for ent in doc.ents]
+        normalized, entities = self.cache.get(inquiry, self.model_key)
+        if entities is None:
+            entities = self._doc_to_result(self._run(inquiry))["entities"]
+            self.cache.put(normalized, entities, self.model_key)
+        return [(ent["text"], ent["label"]) for ent in entities]
+
+    def parse_many(self, texts: list[str]) -> list[list[tuple[str, str]]]:
+        """
+        Batched equivalent of `parse`: one (entity_text, entity_label) list per input text.
+        """
+        if self.cache is None:
+            docs = self._pipe(texts, batch_size=max(len(texts), 1))
+            return [[(ent.text, ent.label_) for ent in doc.ents] for doc in docs]
+
+        lookups = [self.cache.get(text, self.model_key) for text in texts]
+        results: list[list[EntityPrediction] | None] = [entities for _, entities in lookups]
+        missed = [i for i, entities in enumerate(results) if entities is None]
+        docs = self._pipe((texts[i] for i in missed), batch_size=max(len(missed), 1))
+        for i, doc in zip(missed, docs):
+            entities = self._doc_to_result(doc)["entities"]
+            self.cache.put(lookups[i][0], entities, self.model_key)
+            results[i] = entities
+        return [[(ent["text"], ent["label"]) for ent in entities or []] for entities in results]
 
     def parse_and_print(self, text: str) -> None:
         """
@@ -61,3 +117,68 @@ class InteractCommand(BaseCommand):
             return
         for ent_text, label in results:
             self.console_writer.echo(f"{label:10} | {ent_text}")
+
+    def pipe(
+            self,
+            texts: Iterable[str],
+            batch_size: int = 256,
+            n_process: int = 1,
+    ) -> Iterator[InferenceResult]:
+        """
+        Streams texts through `nlp.pipe`, yielding one result per input text.
+
+        Input is consumed lazily, so memory stays flat regardless of how many
+        texts are passed in.
+        """
+        for doc in self._pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._doc_to_result(doc)
+
+    def pipe_to_jsonl(
+            self,
+            texts: Iterable[str],
+            output: TextIO,
+            batch_size: int = 256,
+            n_process: int = 1,
+    ) -> BatchStats:
+        """
+        Writes one JSON line per input text to `output` as results are produced.
+        """
+        count = 0
+        start = time.perf_counter()
+        for result in self.pipe(texts, batch_size=batch_size, n_process=n_process):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+        stats = BatchStats(messages=count, elapsed=time.perf_counter() - start)
+        logger.debug(f"Parsed {stats.messages} messages in {stats.elapsed:.2f}s")
+        return stats
+
+    def _run(self, text: str) -> Doc:
+        if self.profiler is not None:
+            return self.profiler.run(self.nlp, text)
+        return self.nlp(text)
+
+    def _pipe(self, texts: Iterable[str], batch_size: int, n_process: int = 1) -> Iterator[Doc]:
+        if self.profiler is not None:
+            if n_process > 1:
+                logger.warning("Per-component profiling is not available with n_process > 1, running unprofiled")
+            else:
+                return self.profiler.pipe(self.nlp, texts, batch_size=batch_size)
+        return self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+
+    def _model_key(self, model_dir: Path) -> str:
+        meta = self.nlp.meta
+        return f"{meta.get('name')}-{meta.get('version')}:{model_fingerprint(model_dir)}"
+
+    def _doc_to_result(self, doc: Doc) -> InferenceResult:
+        return {
+            "text": doc.text,
+            "entities": [
+                {
+                    "text": ent.text,
+                    "label": ent.label_,
+                    "start": ent.start_char,
+                    "end": ent.end_char,
+                }
+                for ent in doc.ents
+            ],
+        }
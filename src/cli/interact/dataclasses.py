@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BatchStats:
+    messages: int
+    elapsed: float
+
+    @property
+    def messages_per_sec(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.messages / self.elapsed
+
+
+@dataclass
+class NormalizedText:
+    """
+    Case/whitespace folded text plus the index maps needed to move entity
+    offsets between the folded and the original string.
+
+    source_index[j] is the original index that produced normalized char j.
+    offsets[i] is the normalized position where original char i begins
+    (with one trailing entry for the end of the string).
+    """
+    text: str
+    source_index: list[int]
+    offsets: list[int]
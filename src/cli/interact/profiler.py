@@ -0,0 +1,150 @@
+from collections.abc import Iterable, Iterator
+import bisect
+import logging
+import math
+import threading
+import time
+from typing import Any
+from spacy.language import Language
+from spacy.tokens import Doc
+from spacy.util import minibatch
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Fixed-bucket histogram of per-doc milliseconds."""
+
+    BUCKETS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0, math.inf)
+
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, value_ms: float, count: int = 1):
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, value_ms)] += count
+        self.count += count
+        self.total_ms += value_ms * count
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKETS_MS, self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return bound
+        return math.inf
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else str(bound)): bucket_count
+                for bound, bucket_count in zip(self.BUCKETS_MS, self.counts)
+            },
+        }
+
+
+class ComponentTimings:
+
+    def __init__(self):
+        self.calls = 0
+        self.docs = 0
+        self.seconds = 0.0
+        self.histogram = Histogram()
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.docs / self.seconds if self.seconds > 0 else 0.0
+
+    def record(self, seconds: float, docs: int):
+        self.calls += 1
+        self.docs += docs
+        self.seconds += seconds
+        if docs:
+            self.histogram.observe(seconds * 1000 / docs, count=docs)
+
+
+class PipelineProfiler:
+    """
+    Opt-in per-component timing for a loaded spaCy pipeline.
+
+    Instead of calling `nlp(text)` / `nlp.pipe(texts)`, callers route through
+    `run` / `pipe`, which execute the tokenizer and then each pipeline
+    component (`tok2vec`, `ner`, ...) individually and record wall time and
+    doc counts for each. When profiling is off nothing here is on the hot
+    path: InteractCommand only calls into the profiler if one was given.
+
+    Multi-process `nlp.pipe` runs in worker processes and can't be profiled.
+    """
+
+    TOKENIZER = "tokenizer"
+
+    def __init__(self):
+        self.components: dict[str, ComponentTimings] = {}
+        self._lock = threading.Lock()
+
+    def run(self, nlp: Language, text: str) -> Doc:
+        start = time.perf_counter()
+        doc = nlp.make_doc(text)
+        self._record(self.TOKENIZER, time.perf_counter() - start, 1)
+        for name, proc in nlp.pipeline:
+            start = time.perf_counter()
+            doc = proc(doc)
+            self._record(name, time.perf_counter() - start, 1)
+        return doc
+
+    def pipe(self, nlp: Language, texts: Iterable[str], batch_size: int = 256) -> Iterator[Doc]:
+        for batch in minibatch(texts, size=batch_size):
+            start = time.perf_counter()
+            docs = [nlp.make_doc(text) for text in batch]
+            self._record(self.TOKENIZER, time.perf_counter() - start, len(docs))
+            for name, proc in nlp.pipeline:
+                start = time.perf_counter()
+                if hasattr(proc, "pipe"):
+                    docs = list(proc.pipe(docs, batch_size=batch_size))
+                else:
+                    docs = [proc(doc) for doc in docs]
+                self._record(name, time.perf_counter() - start, len(docs))
+            yield from docs
+
+    def reset(self):
+        with self._lock:
+            self.components.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                name: {
+                    "calls": timings.calls,
+                    "docs": timings.docs,
+                    "seconds": round(timings.seconds, 6),
+                    "docs_per_sec": round(timings.docs_per_sec, 2),
+                    "histogram_ms": timings.histogram.to_dict(),
+                }
+                for name, timings in self.components.items()
+            }
+
+    def report(self) -> str:
+        with self._lock:
+            total = sum(t.seconds for t in self.components.values())
+            lines = [f"{'component':12} | {'docs':>8} | {'total s':>9} | {'share':>6} | {'docs/sec':>10} | {'~p50 ms':>8} | {'~p99 ms':>8}"]
+            for name, t in self.components.items():
+                share = t.seconds / total if total else 0.0
+                lines.append(
+                    f"{name:12} | {t.docs:>8} | {t.seconds:>9.4f} | {share:>6.1%} | {t.docs_per_sec:>10.1f} | "
+                    f"{t.histogram.quantile(0.5):>8} | {t.histogram.quantile(0.99):>8}"
+                )
+        return "\n".join(lines)
+
+    def _record(self, name: str, seconds: float, docs: int):
+        with self._lock:
+            timings = self.components.get(name)
+            if timings is None:
+                timings = self.components[name] = ComponentTimings()
+            timings.record(seconds, docs)
@@ -1,8 +1,13 @@
 from ..base_service import BaseCliService
 from .command import InteractCommand
+from .dataclasses import BatchStats
+from .profiler import PipelineProfiler
+from collections.abc import Iterable, Iterator
 import logging
 from pathlib import Path
+import sys
 from typer import Exit
+from ...common.io import ConsoleWriter, FileReader
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +15,15 @@ class InteractService(BaseCliService[InteractCommand]):
 
     command_cls = InteractCommand
 
+    def __init__(
+            self,
+            file_reader: FileReader = FileReader(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        super().__init__()
+        self.file_reader = file_reader
+        self.console_writer = console_writer
+
     def _inquiry_length_valid(self, inquiry: str) -> bool:
         if 1 <= len(inquiry) <= 256:
             return True
@@ -18,21 +32,88 @@ class InteractService(BaseCliService[InteractCommand]):
     @classmethod
     def run(cls, **kwargs):
         service = cls()
-        inquiry = kwargs[service.command_cls.Args.INQUIRY.value].strip()
-        model_dir = kwargs.get(service.command_cls.Kwargs.MODEL_DIR.value)
+        Kwargs = service.command_cls.Kwargs
+        model_dir = kwargs.get(Kwargs.MODEL_DIR.value)
+        input_file = kwargs.get(Kwargs.INPUT_FILE.value)
+        use_stdin = kwargs.get(Kwargs.STDIN.value, False)
+        inquiry = kwargs.get(service.command_cls.Args.INQUIRY.value)
+        profiler = PipelineProfiler() if kwargs.get(Kwargs.PROFILE.value) else None
+
+        if sum([bool(inquiry), bool(input_file), bool(use_stdin)]) != 1:
+            logger.error("Provide exactly one of an inquiry, --input-file or --stdin.")
+            raise Exit(code=1)
 
+        if input_file or use_stdin:
+            texts = service._iter_file(input_file) if input_file else service._iter_stdin()
+            command = service.build_command(model_dir, profiler)
+            stats = service.execute_batch(
+                command=command,
+                texts=texts,
+                output_path=kwargs.get(Kwargs.OUTPUT_PATH.value),
+                batch_size=kwargs.get(Kwargs.BATCH_SIZE.value, 256),
+                n_process=kwargs.get(Kwargs.N_PROCESS.value, 1),
+            )
+            service._report(stats)
+            service._report_profile(profiler)
+            return
+
+        inquiry = inquiry.strip()
         if not service._inquiry_length_valid(inquiry):
             logger.error(f"Inquiry length `{len(inquiry)}` invalid. Must be between 1 <= 256 chars.")
-            Exit(code=1)
+            raise Exit(code=1)
 
-        command = service.build_command(model_dir)
+        command = service.build_command(model_dir, profiler)
         service.execute_command(command, inquiry)
+        service._report_profile(profiler)
 
-    def build_command(self, model_dir: Path | None = None) -> InteractCommand:
+    def build_command(
+            self,
+            model_dir: Path | None = None,
+            profiler: PipelineProfiler | None = None,
+    ) -> InteractCommand:
         if model_dir:
-            return InteractCommand(model_dir=model_dir)
+            return InteractCommand(model_dir=model_dir, profiler=profiler)
         else:
-            return InteractCommand()
+            return InteractCommand(profiler=profiler)
 
     def execute_command(self, command: InteractCommand, inquiry: str):
-        command.parse_and_print(inquiry)
\ No newline at end of file
+        command.parse_and_print(inquiry)
+
+    def execute_batch(
+            self,
+            command: InteractCommand,
+            texts: Iterable[str],
+            output_path: Path | None,
+            batch_size: int,
+            n_process: int,
+    ) -> BatchStats:
+        if output_path is None:
+            return command.pipe_to_jsonl(texts, sys.stdout, batch_size=batch_size, n_process=n_process)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as out:
+            stats = command.pipe_to_jsonl(texts, out, batch_size=batch_size, n_process=n_process)
+        logger.info(f"Saved {stats.messages} results to {output_path}")
+        return stats
+
+    def _iter_file(self, input_file: Path) -> Iterator[str]:
+        input_path = self._to_path(input_file, check=True)
+        return self.file_reader.iter_text_lines(input_path)
+
+    def _iter_stdin(self) -> Iterator[str]:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                yield line
+
+    def _report(self, stats: BatchStats):
+        # stderr, so the report never ends up mixed into JSONL written to stdout
+        self.console_writer.echo(
+            f"Processed {stats.messages} messages in {stats.elapsed:.2f}s "
+            f"({stats.messages_per_sec:.1f} messages/sec)",
+            err=True,
+        )
+
+    def _report_profile(self, profiler: PipelineProfiler | None):
+        if profiler is not None:
+            self.console_writer.echo(f"\n{profiler.report()}", err=True)
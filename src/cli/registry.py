@@ -0,0 +1,52 @@
+"""
+Lazy registry of CLI commands.
+
+main.py only imports this module at startup. Each command's service module
+(and with it spaCy, httpx, DocBin code, ...) is imported the first time
+that command actually runs, so cheap commands never pay for heavy ones.
+
+Keep this module free of third-party imports.
+"""
+from dataclasses import dataclass
+import importlib
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CommandEntry:
+    module: str
+    service: str
+    startup_budget_ms: float
+
+
+CLI_MODULE = "main"
+CLI_STARTUP_BUDGET_MS = 300.0
+
+COMMANDS: dict[str, CommandEntry] = {
+    "import": CommandEntry("src.cli.import_data.service", "ImportService", 300.0),
+    "export": CommandEntry("src.cli.export_data.service", "ExportDataService", 2000.0),
+    "interact": CommandEntry("src.cli.interact.service", "InteractService", 2000.0),
+    "serve": CommandEntry("src.cli.serve.service", "ServeService", 2000.0),
+    "validate": CommandEntry("src.cli.validate.service", "ValidateService", 2000.0),
+    "evaluate": CommandEntry("src.cli.evaluate.service", "EvaluateService", 2000.0),
+    "missed_entities": CommandEntry("src.cli.missed_entities.service", "MissEntitiesService", 50.0),
+    "sweep": CommandEntry("src.cli.sweep.service", "SweepService", 2000.0),
+    "bench_startup": CommandEntry("src.cli.bench.startup.service", "StartupBenchService", 50.0),
+    "bench_inference": CommandEntry("src.cli.bench.inference.service", "InferenceBenchService", 2000.0),
+    "bench_labelstudio": CommandEntry("src.cli.bench.labelstudio.service", "LabelStudioBenchService", 300.0),
+}
+
+
+def load_service(name: str) -> Any:
+    try:
+        entry = COMMANDS[name]
+    except KeyError as e:
+        msg = f"No command registered under `{name}`"
+        logger.error(msg)
+        raise KeyError(msg) from e
+    module = importlib.import_module(entry.module)
+    logger.debug(f"Lazily loaded `{entry.module}` for command `{name}`")
+    return getattr(module, entry.service)
@@ -0,0 +1,187 @@
+from enum import Enum
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any
+from .prefork import PreforkSupervisor
+from .server import InferenceHTTPServer, UnixInferenceHTTPServer
+from ..base_command import BaseCommand
+from ..interact.batcher import MicroBatcher
+from ..interact.cache import ResultCache
+from ..interact.command import InteractCommand
+from ..interact.profiler import PipelineProfiler
+from ...common.utils import model_fingerprint
+from ...config.constants import MODEL_DIR
+
+
+logger = logging.getLogger(__name__)
+
+
+class ServeCommand(BaseCommand):
+    """
+    Long-running inference server that keeps one spaCy pipeline warm in memory.
+
+    The model is loaded once at startup and shared by every request. A watcher
+    thread polls the model directory and hot-swaps in a freshly loaded pipeline
+    when `model-best` is rewritten, so retraining never requires a restart.
+    In-flight requests finish on whichever pipeline they started with.
+
+    With `max_batch` > 1, concurrent requests are coalesced by a MicroBatcher
+    into single `nlp.pipe` calls instead of each running the pipeline alone.
+    With `cache_size` > 0, results for repeated (case/whitespace-folded)
+    inquiries are served from an LRU cache that is cleared on model reload.
+    With `workers` > 1, requests are handled by a pre-forked worker pool that
+    shares this process's loaded model copy-on-write (see PreforkSupervisor).
+    With `profile`, per-component pipeline timings are served on /metrics.
+    """
+
+    class Kwargs(Enum):
+        MODEL_DIR = "model_dir"
+        HOST = "host"
+        PORT = "port"
+        SOCKET_PATH = "socket_path"
+        RELOAD_INTERVAL = "reload_interval"
+        MAX_BATCH = "max_batch"
+        MAX_WAIT_MS = "max_wait_ms"
+        CACHE_SIZE = "cache_size"
+        WORKERS = "workers"
+        WORKER_THREADS = "worker_threads"
+        PROFILE = "profile"
+
+    WARMUP_TEXT = "need shelter near main and hastings"
+
+    def __init__(
+            self,
+            model_dir: Path = MODEL_DIR,
+            host: str = "127.0.0.1",
+            port: int = 8000,
+            socket_path: Path | None = None,
+            reload_interval: float = 5.0,
+            max_batch: int = 1,
+            max_wait_ms: float = 5.0,
+            cache_size: int = 0,
+            workers: int = 1,
+            worker_threads: int = 1,
+            profile: bool = False,
+    ):
+        self.model_dir = model_dir
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.reload_interval = reload_interval
+        self.workers = workers
+        self.worker_threads = worker_threads
+        self.cache = ResultCache(max_size=cache_size) if cache_size > 0 else None
+        self.profiler = PipelineProfiler() if profile else None
+        self.fingerprint = model_fingerprint(model_dir)
+        self.interact_command = self._load()
+        self.interact_command.bind_cache()
+        self._pending_fingerprint: str | None = None
+        self._stop_event = threading.Event()
+        self.batcher = MicroBatcher(self._parse_many, max_batch, max_wait_ms) if max_batch > 1 else None
+
+    def parse(self, text: str) -> list[tuple[str, str]]:
+        if self.batcher is not None:
+            return self.batcher.submit_threadsafe(text)
+        return self.interact_command.parse(text)
+
+    def health(self) -> dict[str, Any]:
+        health: dict[str, Any] = {"status": "ok", "model": self.fingerprint, "pid": os.getpid()}
+        if self.batcher is not None:
+            health["batching"] = self.batcher.stats()
+        if self.cache is not None:
+            health["cache"] = self.cache.stats()
+        return health
+
+    def metrics(self) -> dict[str, Any] | None:
+        if self.profiler is None:
+            return None
+        return {"pid": os.getpid(), "model": self.fingerprint, "components": self.profiler.to_dict()}
+
+    def serve_forever(self):
+        if self.workers > 1:
+            PreforkSupervisor(self, workers=self.workers, worker_threads=self.worker_threads).run()
+            return
+        server = self.build_server()
+        if self.batcher is not None:
+            self.batcher.start_in_thread()
+        watcher = threading.Thread(target=self._watch_model_dir, name="model-watcher", daemon=True)
+        watcher.start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down inference server")
+        finally:
+            self._stop_event.set()
+            server.server_close()
+            self.cleanup()
+
+    def cleanup(self):
+        if self.socket_path is not None and self.socket_path.exists():
+            self.socket_path.unlink()
+
+    def reload_if_changed(self) -> bool:
+        """
+        Swap in a freshly loaded pipeline if the model directory changed.
+
+        A new fingerprint must be seen on two consecutive polls before reloading,
+        so a model that spaCy is still writing to disk is never picked up half-written.
+        """
+        fingerprint = model_fingerprint(self.model_dir)
+        if fingerprint == self.fingerprint:
+            self._pending_fingerprint = None
+            return False
+        if fingerprint != self._pending_fingerprint:
+            logger.debug(f"Model directory changed ({fingerprint}), waiting for it to settle")
+            self._pending_fingerprint = fingerprint
+            return False
+        try:
+            interact_command = self._load()
+        except Exception as e:
+            logger.error(f"Failed to reload model from `{self.model_dir}`, keeping current model: {e}", exc_info=True)
+            return False
+        # Attribute assignment is atomic; requests already holding the old
+        # pipeline finish on it and the next request picks up the new one.
+        self.interact_command = interact_command
+        # Only now, so results of requests still finishing on the old model aren't cached under the new one
+        interact_command.bind_cache()
+        self.fingerprint = fingerprint
+        self._pending_fingerprint = None
+        logger.info(f"Reloaded model from `{self.model_dir}` ({fingerprint})")
+        return True
+
+    def _parse_many(self, texts: list[str]) -> list[list[tuple[str, str]]]:
+        # Looked up per batch so a reload is picked up by the next flush
+        return self.interact_command.parse_many(texts)
+
+    def _load(self) -> InteractCommand:
+        interact_command = InteractCommand(
+            model_dir=self.model_dir,
+            cache=self.cache,
+            profiler=self.profiler,
+            bind_cache=False,
+        )
+        interact_command.parse(self.WARMUP_TEXT)
+        if self.profiler is not None:
+            self.profiler.reset()
+        logger.debug(f"Loaded and warmed model from `{self.model_dir}`")
+        return interact_command
+
+    def _watch_model_dir(self):
+        while not self._stop_event.wait(self.reload_interval):
+            try:
+                self.reload_if_changed()
+            except FileNotFoundError:
+                logger.debug(f"Model directory `{self.model_dir}` missing, keeping current model")
+
+    def build_server(self) -> InferenceHTTPServer | UnixInferenceHTTPServer:
+        if self.socket_path is not None:
+            if self.socket_path.exists():
+                os.unlink(self.socket_path)
+            server = UnixInferenceHTTPServer(str(self.socket_path), backend=self)
+            logger.info(f"Serving NER model on unix socket `{self.socket_path}`")
+            return server
+        server = InferenceHTTPServer((self.host, self.port), backend=self)
+        logger.info(f"Serving NER model on http://{self.host}:{self.port}")
+        return server
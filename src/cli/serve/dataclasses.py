@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class MemoryUsage:
+    """
+    Memory of one process, in kB, from /proc/<pid>/smaps_rollup.
+
+    unique (USS) is memory only this process maps: what killing it would free.
+    shared is mapped by at least one other process, e.g. model weights
+    inherited copy-on-write from the pre-fork parent.
+    pss splits every shared page evenly between the processes mapping it, so
+    summing pss across processes gives their true combined footprint.
+    """
+    pid: int
+    role: str
+    rss: int
+    pss: int
+    unique: int
+    shared: int
@@ -0,0 +1,50 @@
+import logging
+from pathlib import Path
+from .dataclasses import MemoryUsage
+
+logger = logging.getLogger(__name__)
+
+SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def read_memory_usage(pid: int, role: str) -> MemoryUsage | None:
+    smaps = Path(f"/proc/{pid}/smaps_rollup")
+    try:
+        lines = smaps.read_text().splitlines()
+    except OSError as e:
+        logger.debug(f"Could not read {smaps}: {e}")
+        return None
+    fields: dict[str, int] = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        if key in SMAPS_FIELDS:
+            fields[key] = int(value.split()[0])
+    return MemoryUsage(
+        pid=pid,
+        role=role,
+        rss=fields.get("Rss", 0),
+        pss=fields.get("Pss", 0),
+        unique=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        shared=fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    )
+
+
+def _mb(kb: int) -> float:
+    return kb / 1024
+
+
+def format_memory_report(usages: list[MemoryUsage]) -> str:
+    if not usages:
+        return "Memory report unavailable (requires Linux /proc/<pid>/smaps_rollup)"
+    lines = [f"{'pid':>8} | {'role':8} | {'rss MB':>8} | {'pss MB':>8} | {'unique MB':>9} | {'shared MB':>9}"]
+    for u in usages:
+        lines.append(
+            f"{u.pid:>8} | {u.role:8} | {_mb(u.rss):8.1f} | {_mb(u.pss):8.1f} | {_mb(u.unique):9.1f} | {_mb(u.shared):9.1f}"
+        )
+    parent_rss = next((u.rss for u in usages if u.role == "parent"), 0)
+    workers = sum(1 for u in usages if u.role != "parent")
+    lines.append(
+        f"Total (sum of PSS): {_mb(sum(u.pss for u in usages)):.1f} MB vs "
+        f"{_mb(parent_rss * (workers + 1)):.1f} MB if each of the {workers + 1} processes loaded its own model"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,155 @@
+import gc
+import logging
+import os
+import signal
+import threading
+from typing import TYPE_CHECKING
+from .memory import format_memory_report, read_memory_usage
+
+if TYPE_CHECKING:
+    from .command import ServeCommand
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+logger = logging.getLogger(__name__)
+
+
+class PreforkSupervisor:
+    """
+    Runs a ServeCommand as N forked worker processes sharing one loaded model.
+
+    The parent loads and warms the pipeline and binds the listening socket, then
+    forks the workers. Model weights and vocab live in pages inherited
+    copy-on-write, so each extra worker only costs the memory it dirties itself
+    rather than a full `spacy.load`. Each worker caps its BLAS/OpenMP thread
+    pools so N workers don't oversubscribe the machine's cores.
+
+    The parent only supervises: it restarts crashed workers, reloads the model
+    when it changes on disk and rolls the workers over onto it, and logs a
+    per-process memory report at startup and on SIGUSR1.
+    """
+
+    def __init__(self, command: "ServeCommand", workers: int, worker_threads: int = 1):
+        if not hasattr(os, "fork"):
+            msg = "Pre-fork worker mode requires os.fork(), which this platform does not provide"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        self.command = command
+        self.workers = workers
+        self.worker_threads = worker_threads
+        self.worker_pids: set[int] = set()
+        self._stop_event = threading.Event()
+        self._report_requested = threading.Event()
+
+    def run(self):
+        server = self.command.build_server()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGUSR1, self._handle_report)
+        try:
+            self._spawn_generation(server)
+            self._report_requested.set()
+            self._supervise(server)
+        finally:
+            self._stop_workers(self.worker_pids)
+            server.server_close()
+            self.command.cleanup()
+
+    def memory_report(self) -> str:
+        usages = [read_memory_usage(os.getpid(), "parent")]
+        usages += [read_memory_usage(pid, "worker") for pid in sorted(self.worker_pids)]
+        return format_memory_report([u for u in usages if u is not None])
+
+    def _supervise(self, server):
+        while not self._stop_event.wait(self.command.reload_interval):
+            self._reap_workers(server)
+            if self._report_requested.is_set():
+                self._report_requested.clear()
+                logger.info(f"Worker memory report:\n{self.memory_report()}")
+            try:
+                reloaded = self.command.reload_if_changed()
+            except FileNotFoundError:
+                logger.debug(f"Model directory `{self.command.model_dir}` missing, keeping current model")
+                continue
+            if reloaded:
+                previous = set(self.worker_pids)
+                self._spawn_generation(server)
+                self._stop_workers(previous)
+                self._report_requested.set()
+
+    def _spawn_generation(self, server):
+        # Move everything allocated so far out of the GC's generations, so the
+        # collector never writes to (and un-shares) the model's pages in workers.
+        # Unfreeze first so a pipeline replaced by a reload can be collected
+        # instead of staying in the permanent generation for good.
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+        pids = [self._spawn_worker(server) for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} workers: {sorted(pids)}")
+
+    def _spawn_worker(self, server) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._worker_main(server)
+        self.worker_pids.add(pid)
+        return pid
+
+    def _worker_main(self, server):
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            # Ignored, so a group-wide `kill -USR1` for the memory report doesn't kill workers
+            signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+            # serve_forever() runs in this thread, so shut it down from another
+            signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+            self._limit_threads()
+            if self.command.batcher is not None:
+                self.command.batcher.start_in_thread()
+            server.serve_forever()
+        except Exception as e:
+            logger.error(f"Worker {os.getpid()} crashed: {e}", exc_info=True)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _limit_threads(self):
+        if threadpool_limits is None:
+            logger.warning("threadpoolctl is not installed, worker BLAS threads are not limited")
+            return
+        threadpool_limits(limits=self.worker_threads)
+        logger.debug(f"Worker {os.getpid()} limited to {self.worker_threads} BLAS/OpenMP threads")
+
+    def _reap_workers(self, server):
+        for pid in list(self.worker_pids):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done == 0:
+                continue
+            self.worker_pids.discard(pid)
+            if not self._stop_event.is_set():
+                logger.error(f"Worker {pid} exited unexpectedly (status {status}), restarting it")
+                self._spawn_worker(server)
+
+    def _stop_workers(self, pids: set[int]):
+        pids = set(pids)
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self.worker_pids.discard(pid)
+
+    def _handle_stop(self, signum, frame):
+        logger.info("Shutting down worker pool")
+        self._stop_event.set()
+
+    def _handle_report(self, signum, frame):
+        self._report_requested.set()
@@ -0,0 +1,119 @@
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import socketserver
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBackend(Protocol):
+
+    def parse(self, text: str) -> list[tuple[str, str]]: ...
+
+    def health(self) -> dict[str, Any]: ...
+
+    def metrics(self) -> dict[str, Any] | None: ...
+
+
+class InferenceRequestHandler(BaseHTTPRequestHandler):
+    """
+    Minimal JSON API in front of the loaded NER model.
+
+    POST /parse   {"text": "need shelter near main and hastings"}
+                  -> {"text": ..., "entities": [["shelter", "RESOURCE"], ...]}
+    GET  /health  -> {"status": "ok", "model": <fingerprint>}
+    GET  /metrics -> per-component pipeline timings (when profiling is enabled)
+    """
+
+    # Keep-alive lets a caller reuse one connection across requests,
+    # which matters far more for warm latency than the handler itself.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body can sit behind a delayed ACK for ~40ms.
+    disable_nagle_algorithm = True
+
+    MAX_TEXT_LENGTH = 256
+
+    @property
+    def backend(self) -> InferenceBackend:
+        return self.server.backend  # type: ignore[attr-defined]
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, self.backend.health())
+        elif self.path == "/metrics":
+            metrics = self.backend.metrics()
+            if metrics is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Profiling is disabled, start the server with --profile"})
+            else:
+                self._send_json(HTTPStatus.OK, metrics)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path `{self.path}`"})
+
+    def do_POST(self):
+        if self.path != "/parse":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path `{self.path}`"})
+            return
+        try:
+            text = self._read_text()
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        try:
+            entities = self.backend.parse(text)
+        except Exception as e:
+            logger.error(f"Inference failed for `{text}`: {e}", exc_info=True)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Inference failed"})
+            return
+        self._send_json(HTTPStatus.OK, {"text": text, "entities": entities})
+
+    def _read_text(self) -> str:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON body: {e}") from e
+        text = payload.get("text") if isinstance(payload, dict) else None
+        if not isinstance(text, str):
+            raise ValueError("Body must be a JSON object with a string `text` field")
+        text = text.strip()
+        if not 1 <= len(text) <= self.MAX_TEXT_LENGTH:
+            raise ValueError(f"Text length `{len(text)}` invalid. Must be between 1 <= {self.MAX_TEXT_LENGTH} chars.")
+        return text
+
+    def _send_json(self, status: HTTPStatus, body: Any):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class UnixInferenceRequestHandler(InferenceRequestHandler):
+
+    disable_nagle_algorithm = False
+
+    def address_string(self) -> str:
+        return "unix-socket"
+
+
+class InferenceHTTPServer(ThreadingHTTPServer):
+
+    def __init__(self, address: tuple[str, int], backend: InferenceBackend):
+        self.backend = backend
+        super().__init__(address, InferenceRequestHandler)
+
+
+class UnixInferenceHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, backend: InferenceBackend):
+        self.backend = backend
+        super().__init__(socket_path, UnixInferenceRequestHandler)
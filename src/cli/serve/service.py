@@ -0,0 +1,44 @@
+import logging
+from ..base_service import BaseCliService
+from .command import ServeCommand
+
+logger = logging.getLogger(__name__)
+
+
+class ServeService(BaseCliService[ServeCommand]):
+
+    command_cls = ServeCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        command = service.build_command(**kwargs)
+        service.execute_command(command)
+
+    def build_command(self, **kwargs) -> ServeCommand:
+        Kwargs = self.command_cls.Kwargs
+        command_kwargs = {}
+        model_dir = kwargs.get(Kwargs.MODEL_DIR.value)
+        if model_dir:
+            command_kwargs[Kwargs.MODEL_DIR.value] = self._to_path(model_dir, check=True)
+        socket_path = kwargs.get(Kwargs.SOCKET_PATH.value)
+        if socket_path:
+            command_kwargs[Kwargs.SOCKET_PATH.value] = self._to_path(socket_path)
+        passthrough = (
+            Kwargs.HOST,
+            Kwargs.PORT,
+            Kwargs.RELOAD_INTERVAL,
+            Kwargs.MAX_BATCH,
+            Kwargs.MAX_WAIT_MS,
+            Kwargs.CACHE_SIZE,
+            Kwargs.WORKERS,
+            Kwargs.WORKER_THREADS,
+            Kwargs.PROFILE,
+        )
+        for kwarg in passthrough:
+            if kwargs.get(kwarg.value) is not None:
+                command_kwargs[kwarg.value] = kwargs[kwarg.value]
+        return self.command_cls(**command_kwargs)
+
+    def execute_command(self, command: ServeCommand):
+        command.serve_forever()
@@ -0,0 +1,216 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from enum import Enum
+import itertools
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+from typing import Any
+import spacy
+from spacy.tokens import DocBin
+from spacy.training import Example
+from spacy.util import load_config
+from .dataclasses import SweepVariant, VariantResult
+from ..base_command import BaseCommand
+from ...common.io import ConsoleWriter, FileWriter
+from ...common.utils import timestamp
+from ...config.constants import CONFIG_PATH, ROOT_DIR, SPACY_DIR, SWEEP_DIR, TRAINING_CODE_PATH
+
+
+logger = logging.getLogger(__name__)
+
+
+class SweepCommand(BaseCommand):
+    """
+    Speed/accuracy sweep over the NER architecture settings in config.cfg.
+
+    Every combination of the grid is written out as its own config and trained
+    with `spacy train` in parallel, each job pinned to `threads_per_job` BLAS
+    threads so jobs share the machine's cores instead of fighting over them.
+    Once all training is done, each model is evaluated one at a time, so speed
+    measurements aren't skewed by concurrent training, for entity P/R/F on
+    the test DocBin and for inference words/sec. The non-dominated variants
+    form the Pareto front.
+
+    The "shared" tok2vec variant replaces the NER model's own HashEmbedCNN with
+    a Tok2VecListener on the pipeline's tok2vec component, so the embedding
+    work is done once per doc instead of twice.
+    """
+
+    class Kwargs(Enum):
+        HIDDEN_WIDTHS = "hidden_widths"
+        WIDTHS = "widths"
+        DEPTHS = "depths"
+        EMBED_SIZES = "embed_sizes"
+        TOK2VEC_MODES = "tok2vec_modes"
+        JOBS = "jobs"
+        THREADS_PER_JOB = "threads_per_job"
+        MAX_STEPS = "max_steps"
+        MIN_F1 = "min_f1"
+
+    class Tok2VecMode(Enum):
+        SEPARATE = "separate"
+        SHARED = "shared"
+
+    # Sharded corpus directory, the streaming reader falls back to train.spacy
+    TRAIN_PATH = SPACY_DIR / "train"
+    DEV_PATH = SPACY_DIR / "val.spacy"
+    TEST_PATH = SPACY_DIR / "test.spacy"
+    SPEED_REPEATS = 3
+
+    def __init__(
+            self,
+            base_config: Path = CONFIG_PATH,
+            output_dir: Path | None = None,
+            jobs: int | None = None,
+            threads_per_job: int = 1,
+            max_steps: int | None = None,
+            file_writer: FileWriter = FileWriter(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        self.base_config = base_config
+        self.output_dir = output_dir or SWEEP_DIR / timestamp(intraday=True)
+        self.threads_per_job = threads_per_job
+        self.jobs = jobs or max(1, (os.cpu_count() or 1) // threads_per_job)
+        self.max_steps = max_steps
+        self.file_writer = file_writer
+        self.console_writer = console_writer
+
+    @staticmethod
+    def build_grid(
+            hidden_widths: list[int],
+            widths: list[int],
+            depths: list[int],
+            embed_sizes: list[int],
+            tok2vec_modes: list[str],
+    ) -> list[SweepVariant]:
+        shared_options = [SweepCommand.Tok2VecMode(mode) == SweepCommand.Tok2VecMode.SHARED for mode in tok2vec_modes]
+        return [
+            SweepVariant(hidden_width=hw, width=w, depth=d, embed_size=e, shared_tok2vec=shared)
+            for hw, w, d, e, shared in itertools.product(hidden_widths, widths, depths, embed_sizes, shared_options)
+        ]
+
+    def run(self, variants: list[SweepVariant]) -> list[VariantResult]:
+        logger.info(f"Training {len(variants)} variants, {self.jobs} at a time, in `{self.output_dir}`")
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(self._train, variants))
+        for result in results:
+            if result.error is None:
+                self._evaluate(result)
+        self._mark_pareto(results)
+        return results
+
+    def save(self, results: list[VariantResult]) -> Path:
+        output_path = self.output_dir / "results.json"
+        self.file_writer.save_json(output_path, [asdict(result) for result in results])
+        logger.info(f"Saved sweep results to {output_path}")
+        return output_path
+
+    def print_table(self, results: list[VariantResult], min_f1: float | None = None):
+        self.console_writer.echo(
+            f"{'variant':36} | {'ents_f':>6} | {'ents_p':>6} | {'ents_r':>6} | {'words/sec':>10} | {'train s':>8} | pareto"
+        )
+        ranked = sorted(results, key=lambda r: (r.error is None, r.words_per_sec), reverse=True)
+        for r in ranked:
+            if r.error is not None:
+                self.console_writer.echo(f"{r.variant.name:36} | FAILED: {r.error}")
+                continue
+            self.console_writer.echo(
+                f"{r.variant.name:36} | {r.ents_f:6.3f} | {r.ents_p:6.3f} | {r.ents_r:6.3f} | "
+                f"{r.words_per_sec:10.0f} | {r.train_seconds:8.0f} | {'*' if r.pareto else ''}"
+            )
+        if min_f1 is not None:
+            eligible = [r for r in ranked if r.error is None and r.ents_f >= min_f1]
+            if eligible:
+                best = eligible[0]
+                self.console_writer.echo(
+                    f"\nFastest variant with ents_f >= {min_f1}: {best.variant.name} "
+                    f"({best.words_per_sec:.0f} words/sec, ents_f={best.ents_f:.3f}) -> {best.model_dir}"
+                )
+            else:
+                self.console_writer.echo(f"\nNo variant reached ents_f >= {min_f1}")
+
+    def _variant_config(self, variant: SweepVariant) -> Path:
+        config = load_config(self.base_config, interpolate=False)
+        components = config["components"]
+        components["ner"]["model"]["hidden_width"] = variant.hidden_width
+        embed_settings = {"width": variant.width, "depth": variant.depth, "embed_size": variant.embed_size}
+        components["tok2vec"]["model"].update(embed_settings)
+        if variant.shared_tok2vec:
+            components["ner"]["model"]["tok2vec"] = {
+                "@architectures": "spacy.Tok2VecListener.v1",
+                "width": variant.width,
+                "upstream": "*",
+            }
+        else:
+            components["ner"]["model"]["tok2vec"].update(embed_settings)
+        # Sweeps run many trainings in parallel, keep them out of W&B
+        config["training"]["logger"] = {"@loggers": "spacy.ConsoleLogger.v1", "progress_bar": False}
+        if self.max_steps is not None:
+            config["training"]["max_steps"] = self.max_steps
+
+        config_path = self.output_dir / variant.name / "config.cfg"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config.to_disk(config_path)
+        return config_path
+
+    def _train(self, variant: SweepVariant) -> VariantResult:
+        config_path = self._variant_config(variant)
+        variant_dir = config_path.parent
+        env = os.environ.copy()
+        for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+            env[var] = str(self.threads_per_job)
+        cmd = [
+            sys.executable, "-m", "spacy", "train", str(config_path),
+            "--output", str(variant_dir),
+            "--paths.train", str(self.TRAIN_PATH),
+            "--paths.dev", str(self.DEV_PATH),
+            "--code", str(TRAINING_CODE_PATH),
+        ]
+        logger.debug(f"Training `{variant.name}`: {' '.join(cmd)}")
+        start = time.perf_counter()
+        with open(variant_dir / "train.log", "w", encoding="utf-8") as log:
+            completed = subprocess.run(cmd, cwd=ROOT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        result = VariantResult(
+            variant=variant,
+            model_dir=str(variant_dir / "model-best"),
+            train_seconds=time.perf_counter() - start,
+        )
+        if completed.returncode != 0:
+            result.error = f"spacy train exited with {completed.returncode}, see {variant_dir / 'train.log'}"
+            logger.error(f"Variant `{variant.name}` failed: {result.error}")
+        else:
+            logger.info(f"Trained `{variant.name}` in {result.train_seconds:.0f}s")
+        return result
+
+    def _evaluate(self, result: VariantResult):
+        nlp = spacy.load(result.model_dir)
+        gold_docs = list(DocBin().from_disk(self.TEST_PATH).get_docs(nlp.vocab))
+        examples = [Example(nlp.make_doc(doc.text), doc) for doc in gold_docs]
+        scores: dict[str, Any] = nlp.evaluate(examples)
+        result.ents_f = scores.get("ents_f") or 0.0
+        result.ents_p = scores.get("ents_p") or 0.0
+        result.ents_r = scores.get("ents_r") or 0.0
+
+        texts = [doc.text for doc in gold_docs]
+        words = 0
+        start = time.perf_counter()
+        for _ in range(self.SPEED_REPEATS):
+            for doc in nlp.pipe(texts):
+                words += len(doc)
+        elapsed = time.perf_counter() - start
+        result.words_per_sec = words / elapsed if elapsed > 0 else 0.0
+        logger.debug(f"Evaluated `{result.variant.name}`: ents_f={result.ents_f:.3f} {result.words_per_sec:.0f} words/sec")
+
+    def _mark_pareto(self, results: list[VariantResult]):
+        scored = [r for r in results if r.error is None]
+        for r in scored:
+            r.pareto = not any(
+                other.ents_f >= r.ents_f
+                and other.words_per_sec >= r.words_per_sec
+                and (other.ents_f > r.ents_f or other.words_per_sec > r.words_per_sec)
+                for other in scored
+            )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SweepVariant:
+    hidden_width: int
+    width: int
+    depth: int
+    embed_size: int
+    shared_tok2vec: bool
+
+    @property
+    def name(self) -> str:
+        tok2vec = "shared" if self.shared_tok2vec else "separate"
+        return f"hw{self.hidden_width}_w{self.width}_d{self.depth}_e{self.embed_size}_{tok2vec}"
+
+
+@dataclass
+class VariantResult:
+    variant: SweepVariant
+    model_dir: str
+    train_seconds: float
+    ents_f: float = 0.0
+    ents_p: float = 0.0
+    ents_r: float = 0.0
+    words_per_sec: float = 0.0
+    pareto: bool = False
+    error: str | None = None
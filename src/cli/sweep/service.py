@@ -0,0 +1,34 @@
+import logging
+from ..base_service import BaseCliService
+from .command import SweepCommand
+
+logger = logging.getLogger(__name__)
+
+
+class SweepService(BaseCliService[SweepCommand]):
+
+    command_cls = SweepCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        Kwargs = service.command_cls.Kwargs
+        command = service.build_command(**kwargs)
+        variants = command.build_grid(
+            hidden_widths=kwargs[Kwargs.HIDDEN_WIDTHS.value],
+            widths=kwargs[Kwargs.WIDTHS.value],
+            depths=kwargs[Kwargs.DEPTHS.value],
+            embed_sizes=kwargs[Kwargs.EMBED_SIZES.value],
+            tok2vec_modes=kwargs[Kwargs.TOK2VEC_MODES.value],
+        )
+        results = command.run(variants)
+        command.save(results)
+        command.print_table(results, min_f1=kwargs.get(Kwargs.MIN_F1.value))
+
+    def build_command(self, **kwargs) -> SweepCommand:
+        Kwargs = self.command_cls.Kwargs
+        return self.command_cls(
+            jobs=kwargs.get(Kwargs.JOBS.value),
+            threads_per_job=kwargs.get(Kwargs.THREADS_PER_JOB.value) or 1,
+            max_steps=kwargs.get(Kwargs.MAX_STEPS.value),
+        )
@@ -0,0 +1,115 @@
+from collections.abc import Iterator
+from dataclasses import asdict
+from enum import Enum
+import itertools
+import logging
+from pathlib import Path
+import time
+from typing import Any
+import spacy
+from .dataclasses import RecordIssue, ValidationReport
+from ..base_command import BaseCommand
+from ..export_data.labelstudio_to_docbin.alignment import IssueKind, align_entities
+from ..export_data.labelstudio_to_docbin.label_studio_converter import LabelStudioConverter
+from ...common.enums import DatasetSplit
+from ...common.io import ConsoleWriter, FileReader, FileWriter
+from ...common.types import SpacyFormattedJson
+from ...common.utils import timestamp
+from ...config.constants import VALIDATION_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ValidateCommand(BaseCommand):
+    """
+    Checks every annotated entity in converted (or raw Label Studio) JSON
+    against the tokenizer's token boundaries, in bulk.
+
+    Texts are tokenized with `nlp.tokenizer.pipe` and each doc's token start
+    and end offsets are computed once, so checking a span is a dict lookup.
+    Reports unknown labels, out of bounds and overlapping spans, and for
+    misaligned spans the nearest expanded and contracted token-aligned
+    offsets.
+    """
+
+    class Kwargs(Enum):
+        INPUT_PATHS = "input_paths"
+        OUTPUT_PATH = "output_path"
+        BATCH_SIZE = "batch_size"
+        STRICT = "strict"
+
+    # Issues that make the build drop or reject an annotated entity
+    BLOCKING_KINDS = (IssueKind.MISALIGNED.value, IssueKind.OUT_OF_BOUNDS.value, IssueKind.OVERLAP.value)
+
+    def __init__(
+            self,
+            batch_size: int = 1000,
+            file_reader: FileReader = FileReader(),
+            file_writer: FileWriter = FileWriter(),
+            console_writer: ConsoleWriter = ConsoleWriter(),
+    ):
+        self.batch_size = batch_size
+        self.file_reader = file_reader
+        self.file_writer = file_writer
+        self.console_writer = console_writer
+        self.labelstudio_converter = LabelStudioConverter(file_writer=file_writer, file_reader=file_reader)
+
+    def default_input_paths(self) -> list[Path]:
+        """The most recent converted JSON of each split in data/converted/."""
+        paths = []
+        for split in DatasetSplit:
+            candidates = sorted(self.labelstudio_converter.OUTPUT_DIR.glob(f"{split.value}__*.json"))
+            if candidates:
+                paths.append(candidates[-1])
+        return paths
+
+    def validate(self, input_paths: list[Path]) -> ValidationReport:
+        nlp = spacy.blank("en")
+        report = ValidationReport(files=[str(path) for path in input_paths])
+        start = time.perf_counter()
+        for input_path in input_paths:
+            records, texts = itertools.tee(self._iter_records(input_path))
+            texts = (record["text"] for _, record in texts)
+            for (index, record), doc in zip(records, nlp.tokenizer.pipe(texts, batch_size=self.batch_size)):
+                _, issues = align_entities(doc, record["entities"])
+                report.records += 1
+                report.spans += len(record["entities"])
+                for issue in issues:
+                    report.issue_counts[issue.kind] = report.issue_counts.get(issue.kind, 0) + 1
+                    report.issues.append(RecordIssue(file=input_path.name, record=index, text=record["text"], issue=issue))
+        report.elapsed = time.perf_counter() - start
+        logger.debug(f"Validated {report.records} records in {report.elapsed:.2f}s")
+        return report
+
+    def blocking_issues(self, report: ValidationReport) -> int:
+        return sum(report.issue_counts.get(kind, 0) for kind in self.BLOCKING_KINDS)
+
+    def save(self, report: ValidationReport, output_path: Path | None = None) -> Path:
+        output_path = output_path or VALIDATION_DIR / f"report__{timestamp(intraday=True)}.json"
+        data: dict[str, Any] = asdict(report)
+        data["records_per_sec"] = report.records_per_sec
+        self.file_writer.save_json(output_path, data)
+        logger.info(f"Saved validation report to {output_path}")
+        return output_path
+
+    def print_summary(self, report: ValidationReport):
+        self.console_writer.echo(
+            f"Checked {report.spans} spans in {report.records} records in {report.elapsed:.2f}s "
+            f"({report.records_per_sec:.0f} records/sec)"
+        )
+        if not report.issue_counts:
+            self.console_writer.echo("No issues found")
+            return
+        for kind, count in sorted(report.issue_counts.items()):
+            self.console_writer.echo(f"{kind:14} {count}")
+
+    def _iter_records(self, input_path: Path) -> Iterator[tuple[int, SpacyFormattedJson]]:
+        """Yields (index, record), converting Label Studio tasks on the fly."""
+        for index, entry in enumerate(self.file_reader.iter_records(input_path)):
+            if "data" in entry:
+                record = self.labelstudio_converter.convert_task(entry)
+                if record is None:
+                    continue
+                yield index, record
+            else:
+                yield index, entry
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from ..export_data.labelstudio_to_docbin.dataclasses import SpanIssue
+
+
+@dataclass
+class RecordIssue:
+    file: str
+    record: int
+    text: str
+    issue: SpanIssue
+
+
+@dataclass
+class ValidationReport:
+    files: list[str]
+    records: int = 0
+    spans: int = 0
+    elapsed: float = 0.0
+    issue_counts: dict[str, int] = field(default_factory=dict)
+    issues: list[RecordIssue] = field(default_factory=list)
+
+    @property
+    def records_per_sec(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.records / self.elapsed
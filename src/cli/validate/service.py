@@ -0,0 +1,37 @@
+import logging
+from pathlib import Path
+from typer import Exit
+from ..base_service import BaseCliService
+from .command import ValidateCommand
+
+logger = logging.getLogger(__name__)
+
+
+class ValidateService(BaseCliService[ValidateCommand]):
+
+    command_cls = ValidateCommand
+
+    @classmethod
+    def run(cls, **kwargs):
+        service = cls()
+        Kwargs = service.command_cls.Kwargs
+        command = service.build_command(kwargs.get(Kwargs.BATCH_SIZE.value) or 1000)
+        raw_paths = kwargs.get(Kwargs.INPUT_PATHS.value)
+        if raw_paths:
+            input_paths = [service._to_path(path, check=True) for path in raw_paths]
+        else:
+            input_paths = command.default_input_paths()
+        if not input_paths:
+            logger.error("No input files given and no converted JSON found in data/converted/")
+            raise Exit(code=1)
+
+        report = command.validate(input_paths)
+        output_path = kwargs.get(Kwargs.OUTPUT_PATH.value)
+        command.save(report, Path(output_path) if output_path else None)
+        command.print_summary(report)
+        if kwargs.get(Kwargs.STRICT.value) and command.blocking_issues(report):
+            logger.error(f"{command.blocking_issues(report)} spans would be dropped or rejected by the build")
+            raise Exit(code=1)
+
+    def build_command(self, batch_size: int) -> ValidateCommand:
+        return self.command_cls(batch_size=batch_size)
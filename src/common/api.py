@@ -1,64 +1,321 @@
 # src/common/api.py
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+import gzip
+import json as jsonlib
 import logging
-import requests
+import os
+import random
+import re
+import statistics
+import threading
+import time
 from typing import Optional
-from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
+import httpx
 
 logger = logging.getLogger(__name__)
 
 
 class ApiError(Exception):
     """Custom exception for API errors"""
-    pass
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        # None when no response came back at all (connection error, timeout)
+        self.status_code = status_code
+
+    @property
+    def transient(self) -> bool:
+        """Worth retrying: no response, rate limited, or a server-side error."""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+@dataclass
+class RequestTiming:
+    method: str
+    endpoint: str
+    status_code: int | None
+    elapsed: float
+    attempts: int
+
+
+@dataclass
+class LatencySummary:
+    method: str
+    endpoint: str
+    requests: int
+    errors: int
+    retries: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
 
 
 class ApiClient:
-    """Base API client with error handling and logging"""
-   
+    """
+    Base API client with error handling and logging.
+
+    Wraps one pooled httpx client per mode: the sync methods (get/post/put/
+    delete/stream) are safe to call from many threads at once, the async ones
+    (aget/apost/aput/adelete/astream) let a single event loop keep many
+    requests in flight. Either way at most `pool_size` connections are open
+    to the server.
+
+    Failed requests are retried up to `max_retries` times with full-jitter
+    exponential backoff, so many concurrent callers don't retry in lockstep.
+    Idempotent methods are retried on timeouts, connection errors, 429s and
+    5xx responses. POST and PATCH are only retried when the request can't
+    have been acted on: the connection was never made, or the server
+    answered 429/503. Anything else (e.g. a read timeout after a task import
+    was sent) is raised, since sending it again could duplicate it. gzip responses are asked for
+    and decoded transparently. With `compress_requests`, JSON bodies larger
+    than `compress_threshold` bytes are sent gzipped; stock Label Studio does
+    not inflate request bodies itself, so only turn it on behind a proxy that
+    does.
+
+    Every request's latency is recorded per endpoint (ids in the path are
+    collapsed) and can be summarized with `latency_summary()`.
+    """
+
     ApiError = ApiError
 
-    def __init__(self, timeout: int = 30):
+    AUTH_TOKEN_ENV = "LABELSTUDIO_API_TOKEN"
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    # Statuses that mean a non-idempotent request was turned away, not processed
+    REJECTED_STATUSES = frozenset({429, 503})
+    MAX_TIMINGS = 100_000
+    _ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+    def __init__(
+            self,
+            timeout: float = 30,
+            pool_size: int = 10,
+            max_retries: int = 3,
+            backoff: float = 0.5,
+            max_backoff: float = 30.0,
+            compress_requests: bool = False,
+            compress_threshold: int = 64 * 1024,
+            token: str | None = None,
+    ):
         self.timeout = timeout
-        self.session = requests.Session()
-   
-    def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with error handling and logging"""       
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.compress_requests = compress_requests
+        self.compress_threshold = compress_threshold
+        self._token = token
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._client_lock = threading.Lock()
+        self._timings: deque[RequestTiming] = deque(maxlen=self.MAX_TIMINGS)
+
+    @property
+    def token(self) -> str:
+        # Read lazily, default clients are created before .env is loaded
+        return self._token if self._token is not None else os.getenv(self.AUTH_TOKEN_ENV, "")
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout, limits=self._limits())
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        # Bound to the event loop it first runs in, so create it lazily from inside that loop
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits())
+        return self._async_client
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+
+    def _build_request(self, client: httpx.Client | httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Request:
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Token {self.token}"
+        headers.update(kwargs.pop("headers", None) or {})
+        json_body = kwargs.pop("json", None)
+        if json_body is not None:
+            content = jsonlib.dumps(json_body, separators=(",", ":")).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+            if self.compress_requests and len(content) > self.compress_threshold:
+                content = gzip.compress(content, compresslevel=5)
+                headers["Content-Encoding"] = "gzip"
+            kwargs["content"] = content
+        if kwargs.get("data") is None:
+            kwargs.pop("data", None)
+        return client.build_request(method, url, headers=headers, **kwargs)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _retryable(self, method: str, response: httpx.Response | None, error: httpx.HTTPError | None) -> bool:
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        if error is not None:
+            if idempotent:
+                return isinstance(error, httpx.TransportError)
+            # Only errors raised before the request was sent
+            return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+        if response is None:
+            return False
+        return response.status_code in (self.RETRY_STATUSES if idempotent else self.REJECTED_STATUSES)
+
+    def _record(self, method: str, url: str, status_code: int | None, elapsed: float, attempts: int):
+        endpoint = self._ID_SEGMENT.sub("/{id}", httpx.URL(url).path)
+        self._timings.append(RequestTiming(method, endpoint, status_code, elapsed, attempts))
+        logger.debug(f"{method} {url} -> {status_code} in {elapsed * 1000:.1f}ms ({attempts} attempts)")
+
+    def _raise_for(self, url: str, response: httpx.Response | None, error: httpx.HTTPError | None):
+        if isinstance(error, httpx.TimeoutException):
+            logger.error(f"Request timeout to {url}: {error}", exc_info=error)
+            raise ApiError(f"Request timed out: {error}") from error
+        if isinstance(error, httpx.TransportError):
+            logger.error(f"Connection failed to {url}: {error}", exc_info=error)
+            raise ApiError(f"Failed to connect to API: {error}") from error
+        if error is not None:
+            logger.error(f"Request failed to {url}: {error}", exc_info=error)
+            raise ApiError(f"Request failed: {error}") from error
+        if response is not None and response.is_error:
+            msg = f"API request failed with status {response.status_code} for {url}"
+            logger.error(msg)
+            raise ApiError(msg, status_code=response.status_code)
+
+    def _make_request(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """Make HTTP request with retries, error handling and logging"""
         logger.debug(f"Making {method.upper()} request to {url}")
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                timeout=self.timeout,
-                **kwargs
-            )
-            logger.debug(f"Response status: {response.status_code}")
-            response.raise_for_status()
-            return response
-            
-        except ConnectionError as e:
-            logger.error(f"Connection failed to {url}: {e}", exc_info=True)
-            raise ApiError(f"Failed to connect to API: {e}") from e
-            
-        except Timeout as e:
-            logger.error(f"Request timeout to {url}: {e}", exc_info=True)
-            raise ApiError(f"Request timed out: {e}") from e
-            
-        except HTTPError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {url}: {e}", exc_info=True)
-            raise ApiError(f"API request failed with status {e.response.status_code}: {e}") from e
-            
-        except RequestException as e:
-            logger.error(f"Request failed to {url}: {e}", exc_info=True)
-            raise ApiError(f"Request failed: {e}") from e
-    
-    def get(self, url: str, params: Optional[dict] = None, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = error = None
+        attempt = 0
+        for attempt in range(self.max_retries + 1):
+            request = self._build_request(self.client, method, url, **dict(kwargs))
+            response = error = None
+            try:
+                response = self.client.send(request, stream=stream)
+            except httpx.HTTPError as e:
+                error = e
+            if not self._retryable(method, response, error) or attempt == self.max_retries:
+                break
+            if response is not None:
+                response.close()
+            delay = self._backoff_delay(attempt)
+            logger.warning(f"{method} {url} failed ({error or response.status_code}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+        self._record(method, url, response.status_code if response is not None else None, time.perf_counter() - start, attempt + 1)
+        if response is not None and response.is_error and stream:
+            response.read()
+            response.close()
+        self._raise_for(url, response, error)
+        return response
+
+    async def _amake_request(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        logger.debug(f"Making async {method.upper()} request to {url}")
+        start = time.perf_counter()
+        response = error = None
+        attempt = 0
+        for attempt in range(self.max_retries + 1):
+            request = self._build_request(self.async_client, method, url, **dict(kwargs))
+            response = error = None
+            try:
+                response = await self.async_client.send(request, stream=stream)
+            except httpx.HTTPError as e:
+                error = e
+            if not self._retryable(method, response, error) or attempt == self.max_retries:
+                break
+            if response is not None:
+                await response.aclose()
+            delay = self._backoff_delay(attempt)
+            logger.warning(f"{method} {url} failed ({error or response.status_code}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        self._record(method, url, response.status_code if response is not None else None, time.perf_counter() - start, attempt + 1)
+        if response is not None and response.is_error and stream:
+            await response.aread()
+            await response.aclose()
+        self._raise_for(url, response, error)
+        return response
+
+    def get(self, url: str, params: Optional[dict] = None, **kwargs) -> httpx.Response:
         return self._make_request("GET", url, params=params, **kwargs)
-    
-    def post(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> requests.Response:
+
+    def post(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> httpx.Response:
         return self._make_request("POST", url, data=data, json=json, **kwargs)
-    
-    def put(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> requests.Response:
+
+    def put(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> httpx.Response:
         return self._make_request("PUT", url, data=data, json=json, **kwargs)
-    
-    def delete(self, url: str, **kwargs) -> requests.Response:
+
+    def delete(self, url: str, **kwargs) -> httpx.Response:
         return self._make_request("DELETE", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+        """Response whose body is read lazily (iter_bytes), closed on exit."""
+        response = self._make_request(method, url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+
+    async def aget(self, url: str, params: Optional[dict] = None, **kwargs) -> httpx.Response:
+        return await self._amake_request("GET", url, params=params, **kwargs)
+
+    async def apost(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> httpx.Response:
+        return await self._amake_request("POST", url, data=data, json=json, **kwargs)
+
+    async def aput(self, url: str, data: Optional[dict] = None, json: Optional[dict | list] = None, **kwargs) -> httpx.Response:
+        return await self._amake_request("PUT", url, data=data, json=json, **kwargs)
+
+    async def adelete(self, url: str, **kwargs) -> httpx.Response:
+        return await self._amake_request("DELETE", url, **kwargs)
+
+    @asynccontextmanager
+    async def astream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        response = await self._amake_request(method, url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    def latency_summary(self) -> list[LatencySummary]:
+        grouped: dict[tuple[str, str], list[RequestTiming]] = {}
+        for timing in list(self._timings):
+            grouped.setdefault((timing.method, timing.endpoint), []).append(timing)
+        summaries = []
+        for (method, endpoint), timings in sorted(grouped.items()):
+            elapsed_ms = sorted(t.elapsed * 1000 for t in timings)
+            summaries.append(LatencySummary(
+                method=method,
+                endpoint=endpoint,
+                requests=len(timings),
+                errors=sum(1 for t in timings if t.status_code is None or t.status_code >= 400),
+                retries=sum(t.attempts - 1 for t in timings),
+                p50_ms=statistics.median(elapsed_ms),
+                p95_ms=elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+                max_ms=elapsed_ms[-1],
+            ))
+        return summaries
+
+    def log_latency_summary(self):
+        for s in self.latency_summary():
+            logger.info(
+                f"{s.method} {s.endpoint}: {s.requests} requests, p50 {s.p50_ms:.0f}ms, p95 {s.p95_ms:.0f}ms, "
+                f"max {s.max_ms:.0f}ms, {s.retries} retries, {s.errors} errors"
+            )
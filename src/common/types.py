@@ -16,3 +16,14 @@ class SpacyFormattedJson(TypedDict):
     text: str
     entities: list[tuple[int, int, str]]
 
+
+class EntityPrediction(TypedDict):
+    text: str
+    label: str
+    start: int
+    end: int
+
+
+class InferenceResult(TypedDict):
+    text: str
+    entities: list[EntityPrediction]
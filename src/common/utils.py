@@ -1,8 +1,22 @@
 from datetime import datetime, timezone
+import hashlib
+from pathlib import Path
 
 
 def timestamp(intraday: bool = False) -> str:
     dt = datetime.now(tz=timezone.utc)
     if intraday:
         return dt.strftime("%Y-%m-%d__%H-%M-%S")
-    return dt.strftime("%Y-%m-%d")
\ No newline at end of file
+    return dt.strftime("%Y-%m-%d")
+
+
+def model_fingerprint(model_dir: Path) -> str:
+    """
+    Cheap identity for a trained model directory, derived from file names, sizes
+    and modification times. Changes whenever spaCy rewrites the model on disk.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(p for p in model_dir.rglob("*") if p.is_file()):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(model_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:12]
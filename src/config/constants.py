@@ -4,8 +4,23 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = ROOT_DIR / "data"
 MODEL_DIR = DATA_DIR / "training" / "model-best"
+CONFIG_PATH = ROOT_DIR / "config.cfg"
+# Custom registered functions config.cfg refers to, passed to `spacy train --code`
+TRAINING_CODE_PATH = ROOT_DIR / "src" / "training" / "corpus.py"
+SPACY_DIR = DATA_DIR / "spacy"
+LABELSTUDIO_URL = "http://localhost:8080"
 
 RAW_DIR = DATA_DIR / "raw"
 RAW_TRAINING_DIR = RAW_DIR / "training"
 RAW_VALIDATION_DIR = RAW_DIR / "validation"
-RAW_TESTING_DIR = RAW_DIR / "testing"
\ No newline at end of file
+RAW_TESTING_DIR = RAW_DIR / "testing"
+
+EXAMPLES_DIR = DATA_DIR / "examples"
+BENCH_DIR = DATA_DIR / "bench"
+SWEEP_DIR = DATA_DIR / "sweeps"
+CACHE_DIR = DATA_DIR / "cache"
+VALIDATION_DIR = DATA_DIR / "validation"
+DEDUP_DIR = DATA_DIR / "dedup"
+IMPORT_JOURNAL_DIR = DATA_DIR / "import_journal"
+AL_POOL_DIR = DATA_DIR / "al_pool"
+EVALUATION_DIR = DATA_DIR / "evaluation"
@@ -40,3 +40,6 @@ def setup_logging(debug_mode: bool = False, log_file: Path = Path("log/error.log
         level=logging.DEBUG,
         handlers=[console_handler, file_handler],
     )
+    # ApiClient logs every request itself, httpx/httpcore would repeat each one
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
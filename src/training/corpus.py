@@ -0,0 +1,179 @@
+"""
+Streaming corpus reader for `spacy train`.
+
+Registered as `street_ninja.StreamingCorpus.v1`. Training has to load this
+file with `--code src/training/corpus.py`, which imports it as a standalone
+module, so it only depends on the standard library and spaCy.
+"""
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+import json
+import logging
+from pathlib import Path
+import random
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc, DocBin
+from spacy.training import Example
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class CorpusShard:
+    path: str
+    docs: int
+    bytes: int
+
+
+@dataclass
+class CorpusManifest:
+    """Lists a sharded corpus directory's DocBins in order. Shard paths are relative to the directory."""
+    docs: int
+    shards: list[CorpusShard]
+
+    @classmethod
+    def load(cls, corpus_dir: Path) -> "CorpusManifest":
+        with open(corpus_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(docs=data["docs"], shards=[CorpusShard(**shard) for shard in data["shards"]])
+
+    def save(self, corpus_dir: Path):
+        with open(corpus_dir / MANIFEST_NAME, "w", encoding="utf-8") as out:
+            json.dump(asdict(self), out, indent=2)
+
+
+def resolve_shards(path: Path) -> list[Path]:
+    """
+    Shard files for a corpus path: the manifest's shards (or every .spacy
+    file) of a directory, the file itself, or `<path>.spacy` when a sharded
+    directory was configured but only a merged DocBin was exported. A
+    directory without any shards (e.g. left by an interrupted export) also
+    falls back to `<path>.spacy`.
+
+    Raises ValueError if no shards are found, rather than yielding an empty
+    corpus that `spacy train` only fails on much later.
+    """
+    if path.is_dir():
+        if (path / MANIFEST_NAME).exists():
+            shards = [path / shard.path for shard in CorpusManifest.load(path).shards]
+        else:
+            shards = sorted(path.glob("*.spacy"))
+        if shards:
+            return shards
+    elif path.is_file():
+        return [path]
+    merged = path.with_suffix(".spacy")
+    if merged.is_file():
+        return [merged]
+    problem = "has no .spacy shards" if path.is_dir() else "doesn't exist"
+    msg = f"No corpus found at `{path}`: it {problem} and there is no `{merged.name}` to fall back to"
+    logger.error(msg)
+    raise ValueError(msg)
+
+
+class StreamingCorpus:
+    """
+    Yields training Examples shard by shard, so only one or two shards are
+    ever deserialized at a time. The next shard is loaded in a background
+    thread while the current one is being consumed by the training loop.
+
+    With a `shuffle_buffer` greater than 1, shard order is shuffled and
+    examples are drawn at random from a buffer of that many, reseeded every
+    epoch. This is a local shuffle: keep shards small relative to the buffer
+    for a good mix.
+
+    spaCy only streams the train corpus when `training.max_epochs = -1`,
+    otherwise it materializes it with list() first.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            shuffle_buffer: int = 0,
+            seed: int = 0,
+            max_length: int = 0,
+            limit: int = 0,
+            augmenter: Callable[[Language, Example], Iterable[Example]] | None = None,
+    ):
+        self.path = path
+        self.shuffle_buffer = shuffle_buffer
+        self.seed = seed
+        self.max_length = max_length
+        self.limit = limit
+        self.augmenter = augmenter
+        self.epoch = 0
+
+    def __call__(self, nlp: Language) -> Iterator[Example]:
+        rng = random.Random(self.seed + self.epoch)
+        self.epoch += 1
+        examples = self._iter_examples(nlp, self._iter_docs(nlp, rng))
+        if self.shuffle_buffer > 1:
+            examples = self._shuffle(examples, rng)
+        for i, example in enumerate(examples):
+            if self.limit and i >= self.limit:
+                return
+            yield example
+
+    def _iter_docs(self, nlp: Language, rng: random.Random) -> Iterator[Doc]:
+        shards = resolve_shards(self.path)
+        if self.shuffle_buffer > 1:
+            rng.shuffle(shards)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="corpus-prefetch") as executor:
+            next_shard: Future[DocBin] = executor.submit(self._load_shard, shards[0])
+            for i in range(len(shards)):
+                doc_bin = next_shard.result()
+                if i + 1 < len(shards):
+                    next_shard = executor.submit(self._load_shard, shards[i + 1])
+                yield from doc_bin.get_docs(nlp.vocab)
+
+    def _load_shard(self, shard: Path) -> DocBin:
+        return DocBin().from_disk(shard)
+
+    def _iter_examples(self, nlp: Language, docs: Iterable[Doc]) -> Iterator[Example]:
+        for reference in docs:
+            if self.max_length and len(reference) >= self.max_length:
+                continue
+            example = Example(nlp.make_doc(reference.text), reference)
+            if self.augmenter is None:
+                yield example
+            else:
+                yield from self.augmenter(nlp, example)
+
+    def _shuffle(self, examples: Iterable[Example], rng: random.Random) -> Iterator[Example]:
+        buffer: list[Example] = []
+        for example in examples:
+            if len(buffer) < self.shuffle_buffer:
+                buffer.append(example)
+                continue
+            i = rng.randrange(len(buffer))
+            yield buffer[i]
+            buffer[i] = example
+        rng.shuffle(buffer)
+        yield from buffer
+
+
+@spacy.registry.readers("street_ninja.StreamingCorpus.v1")
+def create_streaming_corpus(
+        path: Path | None,
+        shuffle_buffer: int = 0,
+        seed: int = 0,
+        max_length: int = 0,
+        limit: int = 0,
+        augmenter: Callable[[Language, Example], Iterable[Example]] | None = None,
+) -> Callable[[Language], Iterator[Example]]:
+    if path is None:
+        msg = "street_ninja.StreamingCorpus.v1 needs a path, set paths.train"
+        logger.error(msg)
+        raise ValueError(msg)
+    return StreamingCorpus(
+        Path(path),
+        shuffle_buffer=shuffle_buffer,
+        seed=seed,
+        max_length=max_length,
+        limit=limit,
+        augmenter=augmenter,
+    )
@@ -0,0 +1,45 @@
+import pytest
+import spacy
+from src.cli.interact.cache import ResultCache
+from src.cli.interact.command import InteractCommand
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    # Phrase patterns match on ORTH, so this pipeline is case-sensitive like the trained NER
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "RESOURCE", "pattern": "Shelter"},
+        {"label": "LOCATION", "pattern": "Main"},
+        {"label": "LOCATION", "pattern": "Hastings"},
+    ])
+    path = tmp_path_factory.mktemp("model")
+    nlp.to_disk(path)
+    return path
+
+
+def test_cached_parse_matches_uncached_on_mixed_case(model_dir):
+    text = "Shelter near Main and Hastings"
+    uncached = InteractCommand(model_dir=model_dir).parse(text)
+    cached = InteractCommand(model_dir=model_dir, cache=ResultCache(max_size=10))
+    assert uncached == [("Shelter", "RESOURCE"), ("Main", "LOCATION"), ("Hastings", "LOCATION")]
+    assert cached.parse(text) == uncached
+    assert cached.parse(text) == uncached
+    assert cached.cache.hits == 1
+
+
+def test_cached_parse_many_matches_uncached_on_mixed_case(model_dir):
+    texts = ["Shelter near Main and Hastings", "Shelter  near Main  and Hastings", "food please"]
+    uncached = InteractCommand(model_dir=model_dir).parse_many(texts)
+    cached = InteractCommand(model_dir=model_dir, cache=ResultCache(max_size=10))
+    assert cached.parse_many(texts) == uncached
+    assert cached.parse_many(texts) == uncached
+
+
+def test_cached_offsets_map_onto_the_callers_text(model_dir):
+    cached = InteractCommand(model_dir=model_dir, cache=ResultCache(max_size=10))
+    cached.parse("Shelter near Main and Hastings")
+    assert cached.parse("  Shelter   near Main and Hastings ") == [
+        ("Shelter", "RESOURCE"), ("Main", "LOCATION"), ("Hastings", "LOCATION"),
+    ]
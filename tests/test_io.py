@@ -0,0 +1,46 @@
+import json
+import pytest
+from src.common.io import iter_json_array
+
+
+def _split_every(text: str, size: int) -> list[bytes]:
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_iter_json_array_across_chunk_boundaries(size):
+    records = [
+        {"text": "need food near main & hastings ☕", "id": 1},
+        1.5e3,
+        -12,
+        "a, b]",
+        [1, [2, {"x": None}]],
+        True,
+        {},
+    ]
+    text = " [ " + " , ".join(json.dumps(r, ensure_ascii=False) for r in records) + " ] \n"
+    assert list(iter_json_array(_split_every(text, size))) == records
+
+
+@pytest.mark.parametrize("size", [1, 64])
+def test_iter_json_array_empty(size):
+    assert list(iter_json_array(_split_every(" [ ] ", size))) == []
+
+
+@pytest.mark.parametrize("text", [
+    "[1,,2]",
+    "[,1]",
+    "[1,]",
+    "[1 2]",
+    "[1]garbage",
+    "[1][2]",
+    "[1,2",
+    "[1,2,",
+    "",
+    "{}",
+])
+@pytest.mark.parametrize("size", [1, 64])
+def test_iter_json_array_rejects_malformed(text, size):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_split_every(text, size)))